@@ -19,7 +19,6 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from tools.flow.flow_linter import FlowLinter
-from tools.flow.flow_runner import FlowRunner
 
 
 def main(args: Optional[List[str]] = None):
@@ -149,6 +148,9 @@ def cmd_lint(args):
 
 def cmd_run(args):
     """Execute flow"""
+    # Imported here: the runner (asyncio, subprocess plumbing) is only needed to run
+    from tools.flow.flow_runner import FlowRunner
+
     registry_path = Path(args.registry)
 
     if not registry_path.exists():
@@ -50,15 +50,17 @@ class MemoryBridge:
         from .vector.chroma_adapter import create_vector_store
         from .vector.embeddings import create_embedding_provider
 
-        # Initialize vector store
-        backend = self.config.get("backend", "chroma")
-        persist_dir = self.config.get("persist_dir", ".cache/chroma")
-        self.vector_store = create_vector_store(backend, persist_dir)
-
         # Initialize embedding provider
         embedding_model = self.config.get("embedding_model", "bge-m3")
         self.embedding_provider = create_embedding_provider(embedding_model)
 
+        # Initialize vector store
+        backend = self.config.get("backend", "chroma")
+        persist_dir = self.config.get("persist_dir", ".cache/chroma")
+        quantize = self.config.get("quantize_embeddings", False)
+        self.vector_store = create_vector_store(backend, persist_dir, quantize,
+                                                self.embedding_provider.semantic)
+
         logger.info(f"Loaded vector store: {backend}")
         logger.info(f"Loaded embedding model: {embedding_model}")
 
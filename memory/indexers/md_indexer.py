@@ -4,10 +4,63 @@ AdvancedRules Markdown Indexer
 Indexes documentation files with structure-aware chunking
 """
 
+import mmap
+import os
 import re
+import stat
+import sys
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-import hashlib
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+from datetime import datetime as _dt
+from hashlib import sha256 as _sha256
+
+# Files larger than this are memory-mapped rather than read into a buffer
+MMAP_THRESHOLD = 64 * 1024
+
+# Chunks shorter than this are too trivial to index
+MIN_CHUNK_SIZE = 50
+
+
+def chunk_text(content: str, chunk_size: int, overlap: int,
+               min_tail: int = MIN_CHUNK_SIZE) -> List[Tuple[int, int]]:
+    """Return (start, end) offsets of line-aligned chunks of ``content``.
+
+    Lines are accumulated until the chunk reaches ``chunk_size`` characters;
+    the next chunk then restarts ``overlap`` lines back. The trailing chunk
+    is kept only if it has at least ``min_tail`` characters. Works on
+    offsets so no intermediate line lists or joined strings are built.
+    """
+    spans = []
+    add_span = spans.append
+    # Absolute start offset of every line, sized up front from the newline count
+    line_starts = [0] * (content.count('\n') + 1)
+    lines_seen = 0
+    first = 0         # index into line_starts of the current chunk's first line
+    find = content.find
+    n = len(content)
+    pos = 0
+
+    while True:
+        line_starts[lines_seen] = pos
+        lines_seen += 1
+        nl = find('\n', pos)
+        end = n if nl < 0 else nl
+
+        start = line_starts[first]
+        if end - start >= chunk_size:
+            add_span((start, end))
+            # Start new chunk with overlap
+            first = max(first, lines_seen - overlap)
+
+        if nl < 0:
+            break
+        pos = nl + 1
+
+    # Add remaining content
+    if first < lines_seen and n - line_starts[first] >= min_tail:
+        add_span((line_starts[first], n))
+
+    return spans
 
 
 class MarkdownIndexer:
@@ -22,236 +75,159 @@ class MarkdownIndexer:
 
         # Markdown structure patterns
         self.header_pattern = re.compile(r'^(#{1,6})\s+(.+)$', re.MULTILINE)
+        # Same as header_pattern but never spans lines, for whole-content scans
+        self._header_line_pattern = re.compile(r'^(#{1,6})[^\S\n]+(.+)$', re.MULTILINE)
         self.code_block_pattern = re.compile(r'```[\s\S]*?```', re.MULTILINE)
         self.list_pattern = re.compile(r'^[\s]*[-\*\+]\s+', re.MULTILINE)
         self.table_pattern = re.compile(r'^\|.*\|.*$', re.MULTILINE)
 
     def index_file(self, file_path: Path) -> List[Dict[str, Any]]:
         """Index a single markdown file"""
-        if not file_path.exists() or not file_path.is_file():
+        if file_path.suffix.lower() not in self.supported_extensions:
             return []
 
-        if file_path.suffix.lower() not in self.supported_extensions:
+        # One stat call covers both the existence and regular-file checks;
+        # the interned path string is shared by every document's
+        # 'source' and 'file_path' keys
+        path = sys.intern(os.fspath(file_path))
+        try:
+            st = os.stat(path)
+        except OSError:
+            return []
+        if not stat.S_ISREG(st.st_mode):
             return []
 
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
+            content = self._read_text(path, st.st_size)
 
             if not content.strip():
                 return []
 
-            # Extract structured chunks
-            chunks = self._extract_structured_chunks(content)
-
-            # Create documents
-            documents = []
-            for i, chunk in enumerate(chunks):
-                # Generate content hash for deduplication
-                content_hash = hashlib.sha256(chunk['content'].encode()).hexdigest()[:16]
-
-                doc = {
-                    'content': chunk['content'],
-                    'source': str(file_path),
-                    'file_path': str(file_path),
-                    'chunk_id': i,
-                    'chunk_type': chunk['type'],
-                    'language': 'markdown',
-                    'timestamp': self._get_timestamp(),
-                    'content_hash': content_hash,
-                }
-
-                # Add metadata
-                if 'metadata' in chunk:
-                    doc.update(chunk['metadata'])
-
-                documents.append(doc)
-
-            return documents
+            return list(self._stream_docs(path, content))
 
         except Exception as e:
             print(f"Warning: Failed to index {file_path}: {e}")
             return []
 
-    def _extract_structured_chunks(self, content: str) -> List[Dict[str, Any]]:
-        """Extract structured chunks from markdown content"""
-        chunks = []
+    def _read_text(self, path: str, size: int) -> str:
+        """Read a file as text, memory-mapping it when it is large"""
+        if size <= MMAP_THRESHOLD:
+            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+                return f.read()
+
+        # Decode straight from the page cache instead of reading a bytes copy
+        with open(path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                content = str(mm, 'utf-8', 'ignore')
+
+        # Match the universal-newline translation of text mode
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return content
+
+    def _stream_docs(self, file_path: str, content: str) -> Iterator[Dict[str, Any]]:
+        """Yield finished documents for each chunk of the content"""
+        timestamp = self._get_timestamp()
+
+        for i, (chunk, section, subsection) in enumerate(
+                self._extract_structured_chunks(content)):
+            doc = {
+                'content': chunk,
+                'source': file_path,
+                'file_path': file_path,
+                'chunk_id': i,
+                'chunk_type': 'documentation',
+                'language': 'markdown',
+                'timestamp': timestamp,
+                # Content hash for deduplication
+                'content_hash': _sha256(chunk.encode()).hexdigest()[:16],
+            }
+
+            # Add section context
+            if section is not None:
+                doc['subsection'] = subsection
+                doc['section'] = section
+
+            yield doc
+
+    def _extract_structured_chunks(
+            self, content: str) -> Iterator[Tuple[str, Optional[str], Optional[str]]]:
+        """Yield (content, section, subsection) for each structured chunk"""
+        found = False
 
         # Split by major sections (top-level headers)
-        sections = self._split_by_headers(content)
-
-        for section_title, section_content in sections:
+        for section_title, section_content in self._split_by_headers(content):
             # Further chunk the section content
-            section_chunks = self._chunk_section(section_content, section_title)
-
-            for chunk in section_chunks:
-                # Add section context to metadata
-                if 'metadata' not in chunk:
-                    chunk['metadata'] = {}
-                chunk['metadata']['section'] = section_title
-
-                chunks.append(chunk)
+            for chunk, subsection_title in self._chunk_section(section_content, section_title):
+                found = True
+                yield chunk, section_title, subsection_title
 
         # If no sections found, fall back to size-based chunking
-        if not chunks:
-            chunks = self._fallback_chunking(content)
-
-        return chunks
+        if not found:
+            for chunk in self._split_large_content(content):
+                yield chunk, None, None
 
     def _split_by_headers(self, content: str) -> List[tuple]:
         """Split content by top-level headers"""
-        lines = content.split('\n')
-        sections = []
-        current_section = []
-        current_title = "Document"
-
-        for line in lines:
-            # Check if this is a top-level header
-            header_match = self.header_pattern.match(line)
-            if header_match:
-                level = len(header_match.group(1))
-                title = header_match.group(2).strip()
-
-                # Save previous section
-                if current_section:
-                    sections.append((current_title, '\n'.join(current_section)))
-
-                # Start new section
-                current_title = title
-                current_section = [line]
-            else:
-                current_section.append(line)
-
-        # Add final section
-        if current_section:
-            sections.append((current_title, '\n'.join(current_section)))
-
-        return sections
+        return self._split_at_headers(content, "Document", 1)
 
-    def _chunk_section(self, content: str, section_title: str) -> List[Dict[str, Any]]:
-        """Chunk a section into smaller pieces"""
-        chunks = []
+    def _chunk_section(self, content: str, section_title: str) -> Iterator[Tuple[str, str]]:
+        """Yield (content, subsection) pieces of a section"""
+        chunk_size = self.chunk_size
+        split_large_content = self._split_large_content
 
         # Split by subsection headers or natural boundaries
-        subsections = self._split_by_subsections(content)
-
-        for subsection_title, subsection_content in subsections:
+        for subsection_title, subsection_content in self._split_by_subsections(content):
             # Check if subsection is too large
-            if len(subsection_content) > self.chunk_size:
+            if len(subsection_content) > chunk_size:
                 # Split into smaller chunks
-                sub_chunks = self._split_large_content(subsection_content)
-                for sub_chunk in sub_chunks:
-                    chunks.append({
-                        'content': sub_chunk,
-                        'type': 'documentation',
-                        'metadata': {
-                            'subsection': subsection_title,
-                            'section': section_title
-                        }
-                    })
-            else:
-                chunks.append({
-                    'content': subsection_content,
-                    'type': 'documentation',
-                    'metadata': {
-                        'subsection': subsection_title,
-                        'section': section_title
-                    }
-                })
-
-        return chunks
+                for sub_chunk in split_large_content(subsection_content):
+                    yield sub_chunk, subsection_title
+            elif len(subsection_content) >= MIN_CHUNK_SIZE:
+                yield subsection_content, subsection_title
 
     def _split_by_subsections(self, content: str) -> List[tuple]:
         """Split content by subsection headers (##, ###, etc.)"""
-        lines = content.split('\n')
-        subsections = []
-        current_subsection = []
-        current_title = "Content"
+        return self._split_at_headers(content, "Content", 2)
+
+    def _split_at_headers(self, content: str, default_title: str,
+                          min_level: int) -> List[tuple]:
+        """Split content at header lines of at least ``min_level``
+
+        Header lines are located with a single regex scan over the whole
+        content; each piece runs from its header line up to (not including)
+        the newline before the next one.
+        """
+        sections = []
+        current_title = default_title
+        current_start = 0
 
-        for line in lines:
-            # Check if this is a subsection header (## or deeper)
-            header_match = self.header_pattern.match(line)
-            if header_match and len(header_match.group(1)) >= 2:
-                title = header_match.group(2).strip()
+        for header_match in self._header_line_pattern.finditer(content):
+            if len(header_match.group(1)) < min_level:
+                continue
 
-                # Save previous subsection
-                if current_subsection:
-                    subsections.append((current_title, '\n'.join(current_subsection)))
+            start = header_match.start()
+            # Save previous section (nothing precedes a header on line one)
+            if start > 0:
+                sections.append((current_title, content[current_start:start - 1]))
 
-                # Start new subsection
-                current_title = title
-                current_subsection = [line]
-            else:
-                current_subsection.append(line)
+            # Start new section
+            current_title = header_match.group(2).strip()
+            current_start = start
 
-        # Add final subsection
-        if current_subsection:
-            subsections.append((current_title, '\n'.join(current_subsection)))
+        # Add final section
+        sections.append((current_title, content[current_start:]))
 
-        return subsections
+        return sections
 
     def _split_large_content(self, content: str) -> List[str]:
         """Split large content into smaller chunks"""
-        chunks = []
-        lines = content.split('\n')
-        current_chunk = []
-
-        for line in lines:
-            current_chunk.append(line)
-            current_content = '\n'.join(current_chunk)
-
-            if len(current_content) >= self.chunk_size:
-                chunks.append(current_content)
-
-                # Start new chunk with overlap
-                overlap_start = max(0, len(current_chunk) - self.chunk_overlap)
-                current_chunk = current_chunk[overlap_start:]
-
-        # Add remaining content
-        if current_chunk:
-            current_content = '\n'.join(current_chunk)
-            if len(current_content) >= 50:  # Minimum chunk size
-                chunks.append(current_content)
-
-        return chunks
-
-    def _fallback_chunking(self, content: str) -> List[Dict[str, Any]]:
-        """Fallback to simple size-based chunking"""
-        chunks = []
-        lines = content.split('\n')
-        current_chunk = []
-
-        for line in lines:
-            current_chunk.append(line)
-            current_content = '\n'.join(current_chunk)
-
-            if len(current_content) >= self.chunk_size:
-                chunks.append({
-                    'content': current_content,
-                    'type': 'documentation',
-                    'metadata': {}
-                })
-
-                # Start new chunk with overlap
-                overlap_start = max(0, len(current_chunk) - self.chunk_overlap)
-                current_chunk = current_chunk[overlap_start:]
-
-        # Add remaining content
-        if current_chunk:
-            current_content = '\n'.join(current_chunk)
-            if len(current_content) >= 50:
-                chunks.append({
-                    'content': current_content,
-                    'type': 'documentation',
-                    'metadata': {}
-                })
-
-        return chunks
+        return [content[start:end] for start, end in
+                chunk_text(content, self.chunk_size, self.chunk_overlap)]
 
     def _get_timestamp(self) -> str:
         """Get current timestamp"""
-        from datetime import datetime
-        return datetime.now().isoformat()
+        return _dt.now().isoformat()
 
     def get_supported_extensions(self) -> List[str]:
         """Get list of supported file extensions"""
@@ -5,14 +5,63 @@ Local-first vector storage with metadata filtering
 """
 
 import os
+import heapq
 import json
 import logging
 from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 import hashlib
+from contextlib import contextmanager
+
+try:
+    import numpy as np
+except ImportError:  # numpy only accelerates the fallback store's embedding path
+    np = None
+
+try:
+    import simsimd
+except ImportError:
+    simsimd = None
+
+try:
+    import fcntl
+except ImportError:  # no advisory locks (Windows): namespace cache updates are unserialized
+    fcntl = None
+
+try:
+    import msgpack
+except ImportError:  # fallback store persists as plain JSON instead
+    msgpack = None
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of documents sent to Chroma in one add() call
+STORE_BATCH_SIZE = 512
+
+# Page size for the cold-start namespace scan
+NAMESPACE_SCAN_PAGE = 10000
+
+def _as_list(embedding):
+    """Convert an ndarray embedding to a plain list at a serialization boundary"""
+    return embedding.tolist() if hasattr(embedding, "tolist") else embedding
+
+
+def _pack_ndarray(obj):
+    """msgpack hook: store ndarrays as raw bytes plus dtype and shape"""
+    if np is not None and isinstance(obj, np.ndarray):
+        return {"__ndarray__": obj.tobytes(), "dtype": obj.dtype.str, "shape": list(obj.shape)}
+    if hasattr(obj, "tolist"):  # numpy scalars
+        return obj.tolist()
+    raise TypeError(f"Cannot serialize {type(obj).__name__}")
+
+
+def _unpack_ndarray(obj):
+    """msgpack hook: rebuild ndarrays written by _pack_ndarray"""
+    if "__ndarray__" in obj and np is not None:
+        return np.frombuffer(obj["__ndarray__"], dtype=obj["dtype"]).reshape(obj["shape"])
+    return obj
+
+
 class ChromaAdapter:
     """ChromaDB adapter for vector storage and retrieval"""
 
@@ -22,6 +71,8 @@ class ChromaAdapter:
         self.client = None
         self.collection = None
         self._initialized = False
+        # True once every stored persona is lowercase, so Chroma can filter on it
+        self._personas_normalized = False
 
     def initialize(self) -> bool:
         """Initialize ChromaDB client and collection"""
@@ -48,6 +99,7 @@ class ChromaAdapter:
                     metadata={"description": "AdvancedRules hybrid memory store"}
                 )
                 logger.info(f"Created new collection: {self.collection_name}")
+            self._personas_normalized = self._normalize_personas()
 
             self._initialized = True
             logger.info("ChromaDB adapter initialized successfully")
@@ -68,46 +120,49 @@ class ChromaAdapter:
             return False
 
         try:
-            ids = []
-            texts = []
-            metadatas = []
-            embeddings_list = []
-
-            for doc in documents:
-                # Generate unique ID
-                content_hash = hashlib.sha256(doc["content"].encode()).hexdigest()[:16]
-                doc_id = f"{doc.get('namespace', 'default')}_{content_hash}"
-
-                # Prepare data
-                ids.append(doc_id)
-                texts.append(doc["content"])
-                metadatas.append({
+            # Prepare data (unique ID from namespace + content hash)
+            ids = [
+                f"{doc.get('namespace', 'default')}_"
+                f"{hashlib.sha256(doc['content'].encode()).hexdigest()[:16]}"
+                for doc in documents
+            ]
+            texts = [doc["content"] for doc in documents]
+            metadatas = [
+                {
                     "namespace": doc.get("namespace", "default"),
                     "source": doc.get("source", "unknown"),
                     "chunk_id": doc.get("chunk_id", 0),
                     "timestamp": doc.get("timestamp", ""),
                     "file_path": doc.get("file_path", ""),
-                    "persona": doc.get("persona", "general"),
-                })
-
-                # Use pre-computed embeddings if available
-                if "embedding" in doc:
-                    embeddings_list.append(doc["embedding"])
-
-            # Add to collection
-            if embeddings_list:
-                self.collection.add(
-                    ids=ids,
-                    documents=texts,
-                    metadatas=metadatas,
-                    embeddings=embeddings_list
-                )
-            else:
-                self.collection.add(
-                    ids=ids,
-                    documents=texts,
-                    metadatas=metadatas
-                )
+                    "persona": doc.get("persona", "general").lower(),
+                }
+                for doc in documents
+            ]
+
+            # Use pre-computed embeddings if available
+            embeddings_list = [_as_list(doc["embedding"]) for doc in documents if "embedding" in doc]
+
+            # Add to collection in bounded batches
+            for start in range(0, len(documents), STORE_BATCH_SIZE):
+                end = start + STORE_BATCH_SIZE
+                if embeddings_list:
+                    self.collection.add(
+                        ids=ids[start:end],
+                        documents=texts[start:end],
+                        metadatas=metadatas[start:end],
+                        embeddings=embeddings_list[start:end]
+                    )
+                else:
+                    self.collection.add(
+                        ids=ids[start:end],
+                        documents=texts[start:end],
+                        metadatas=metadatas[start:end]
+                    )
+
+            # Record any new namespaces
+            new_namespaces = {metadata["namespace"] for metadata in metadatas} - self._load_namespace_cache()
+            if new_namespaces:
+                self._update_namespace_cache(add=new_namespaces)
 
             logger.info(f"Stored {len(documents)} documents")
             return True
@@ -124,51 +179,46 @@ class ChromaAdapter:
             return []
 
         try:
-            # Prepare query - ChromaDB has limitations with complex where clauses
-            # For now, we'll do a simple query and filter results in Python
+            query_kwargs = {}
+            where = self._build_where(filter_metadata, self._personas_normalized)
+            if where:
+                query_kwargs["where"] = where
+
+            # Filtering happens inside Chroma, so fetch exactly what was asked for;
+            # mixed-case personas from older stores still need the Python filter
+            persona_filter = None
+            if not self._personas_normalized and filter_metadata and "$in" in filter_metadata.get("persona", {}):
+                persona_filter = {v.lower() for v in filter_metadata["persona"]["$in"]}
             results = self.collection.query(
-                query_embeddings=[embedding],
-                n_results=min(n_results * 3, 100),  # Get more results to filter
-                include=["documents", "metadatas", "distances"]
+                query_embeddings=[_as_list(embedding)],
+                n_results=n_results if persona_filter is None else min(n_results * 3, 100),
+                include=["documents", "metadatas", "distances"],
+                **query_kwargs
             )
 
-            # Format and filter results
+            # Format results, capping at n_results during extraction
             formatted_results = []
-            if results["documents"] and results["documents"][0]:
-                for i, doc in enumerate(results["documents"][0]):
-                    metadata = results["metadatas"][0][i] if results["metadatas"] else {}
-                    distance = results["distances"][0][i] if results["distances"] else 0.0
-
-                    # Apply metadata filtering in Python
-                    if filter_metadata:
-                        match = True
-                        for key, expected_values in filter_metadata.items():
-                            if key == "persona" and "$in" in expected_values:
-                                actual_value = metadata.get("persona", "").lower()
-                                if actual_value not in [v.lower() for v in expected_values["$in"]]:
-                                    match = False
-                                    break
-                            elif key == "namespace" and "$in" in expected_values:
-                                actual_value = metadata.get("namespace", "")
-                                if actual_value not in expected_values["$in"]:
-                                    match = False
-                                    break
-                            # Add more filter types as needed
-                        if not match:
-                            continue
-
-                    formatted_results.append({
-                        "content": doc,
-                        "metadata": metadata,
-                        "score": 1.0 - distance,  # Convert distance to similarity
-                        "source": metadata.get("source", "unknown"),
-                        "namespace": metadata.get("namespace", "default"),
-                        "file_path": metadata.get("file_path", ""),
-                        "persona": metadata.get("persona", "general"),
-                    })
-
-            # Limit to requested number of results
-            formatted_results = formatted_results[:n_results]
+            docs = results["documents"][0] if results["documents"] else []
+            metadatas = results["metadatas"][0] if results["metadatas"] else None
+            distances = results["distances"][0] if results["distances"] else None
+
+            for i, doc in enumerate(docs):
+                if len(formatted_results) == n_results:
+                    break
+                metadata = metadatas[i] if metadatas else {}
+                distance = distances[i] if distances else 0.0
+                if persona_filter is not None and metadata.get("persona", "").lower() not in persona_filter:
+                    continue
+
+                formatted_results.append({
+                    "content": doc,
+                    "metadata": metadata,
+                    "score": 1.0 - distance,  # Convert distance to similarity
+                    "source": metadata.get("source", "unknown"),
+                    "namespace": metadata.get("namespace", "default"),
+                    "file_path": metadata.get("file_path", ""),
+                    "persona": metadata.get("persona", "general"),
+                })
 
             logger.info(f"Query returned {len(formatted_results)} results")
             return formatted_results
@@ -177,6 +227,59 @@ class ChromaAdapter:
             logger.error(f"Failed to query documents: {e}")
             return []
 
+    @staticmethod
+    def _build_where(filter_metadata: Optional[Dict], personas_normalized: bool = True) -> Optional[Dict[str, Any]]:
+        """Translate persona/namespace ``$in`` filters into a Chroma where clause
+
+        The persona filter is left out unless stored personas are all lowercase
+        (the caller then filters in Python instead).
+        """
+        if not filter_metadata:
+            return None
+
+        clauses = []
+        for key, expected_values in filter_metadata.items():
+            if key == "persona" and "$in" in expected_values:
+                if personas_normalized:
+                    values = dict.fromkeys(v.lower() for v in expected_values["$in"])
+                    clauses.append({"persona": {"$in": list(values)}})
+            elif key == "namespace" and "$in" in expected_values:
+                clauses.append({"namespace": {"$in": list(expected_values["$in"])}})
+            # Add more filter types as needed
+
+        if not clauses:
+            return None
+        return clauses[0] if len(clauses) == 1 else {"$and": clauses}
+
+    def _normalize_personas(self) -> bool:
+        """Lowercase personas stored before store_documents normalized them (once per collection)"""
+        marker = self.persist_dir / f"{self.collection_name}.personas_lowercase"
+        if marker.exists():
+            return True
+        try:
+            offset = 0
+            while True:
+                results = self.collection.get(include=["metadatas"],
+                                              limit=NAMESPACE_SCAN_PAGE, offset=offset)
+                ids = []
+                updated = []
+                for doc_id, metadata in zip(results["ids"], results["metadatas"] or []):
+                    persona = (metadata or {}).get("persona")
+                    if isinstance(persona, str) and persona != persona.lower():
+                        ids.append(doc_id)
+                        updated.append({**metadata, "persona": persona.lower()})
+                if ids:
+                    self.collection.update(ids=ids, metadatas=updated)
+                if len(results["ids"]) < NAMESPACE_SCAN_PAGE:
+                    break
+                offset += NAMESPACE_SCAN_PAGE
+            marker.touch()
+            logger.info("Normalized stored persona case")
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to normalize stored personas, filtering them in Python: {e}")
+            return False
+
     def delete_by_metadata(self, metadata_filter: Dict[str, Any]) -> bool:
         """Delete documents matching metadata filter"""
         if not self._initialized:
@@ -185,6 +288,15 @@ class ChromaAdapter:
 
         try:
             self.collection.delete(where=metadata_filter)
+
+            # A whole-namespace delete is tracked exactly; anything else may
+            # have emptied a namespace, so rescan on next listing
+            namespace = metadata_filter.get("namespace")
+            if set(metadata_filter) == {"namespace"} and isinstance(namespace, str):
+                self._update_namespace_cache(remove={namespace})
+            else:
+                self._invalidate_namespace_cache()
+
             logger.info(f"Deleted documents matching: {metadata_filter}")
             return True
         except Exception as e:
@@ -212,21 +324,87 @@ class ChromaAdapter:
             return []
 
         try:
-            # Get all documents with metadata
-            results = self.collection.get(include=["metadatas"])
-            namespaces = set()
-
-            if results["metadatas"]:
-                for metadata in results["metadatas"]:
-                    if "namespace" in metadata:
-                        namespaces.add(metadata["namespace"])
-
-            return sorted(list(namespaces))
+            return sorted(self._load_namespace_cache())
 
         except Exception as e:
             logger.error(f"Failed to list namespaces: {e}")
             return []
 
+    @contextmanager
+    def _namespace_lock(self):
+        """Serialize namespace cache updates across processes sharing persist_dir"""
+        if fcntl is None:
+            yield
+            return
+        with open(self.persist_dir / "namespaces.lock", 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read_namespace_cache(self) -> Optional[set]:
+        """Namespaces recorded in namespaces.json, or None if missing/unreadable"""
+        try:
+            with open(self.persist_dir / "namespaces.json", 'r') as f:
+                return set(json.load(f))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def _load_namespace_cache(self) -> set:
+        """Return the namespace cache, rebuilding it from the collection if needed"""
+        # Re-read every time: other processes may have recorded namespaces since
+        namespaces = self._read_namespace_cache()
+        if namespaces is None:
+            with self._namespace_lock():
+                namespaces = self._read_namespace_cache()
+                if namespaces is None:
+                    namespaces = self._scan_namespaces()
+                    self._write_namespace_cache(namespaces)
+        return namespaces
+
+    def _update_namespace_cache(self, add: set = frozenset(), remove: set = frozenset()):
+        """Merge a change into the on-disk cache under the lock (rescan if it is missing)"""
+        with self._namespace_lock():
+            namespaces = self._read_namespace_cache()
+            if namespaces is None:
+                namespaces = self._scan_namespaces()
+            self._write_namespace_cache((namespaces | set(add)) - set(remove))
+
+    def _scan_namespaces(self) -> set:
+        """Collect namespaces from the collection, one page of metadata at a time"""
+        namespaces = set()
+        offset = 0
+        while True:
+            results = self.collection.get(include=["metadatas"],
+                                          limit=NAMESPACE_SCAN_PAGE, offset=offset)
+            metadatas = results["metadatas"] or []
+            for metadata in metadatas:
+                if metadata and "namespace" in metadata:
+                    namespaces.add(metadata["namespace"])
+            if len(metadatas) < NAMESPACE_SCAN_PAGE:
+                return namespaces
+            offset += NAMESPACE_SCAN_PAGE
+
+    def _write_namespace_cache(self, namespaces: set):
+        """Persist the namespace cache atomically (caller holds the lock)"""
+        cache_file = self.persist_dir / "namespaces.json"
+        tmp_file = cache_file.with_suffix(".tmp")
+        try:
+            with open(tmp_file, 'w') as f:
+                json.dump(sorted(namespaces), f)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            logger.warning(f"Failed to save namespace cache: {e}")
+
+    def _invalidate_namespace_cache(self):
+        """Drop the namespace cache so the next listing rescans"""
+        with self._namespace_lock():
+            try:
+                os.remove(self.persist_dir / "namespaces.json")
+            except OSError:
+                pass
+
     def purge_namespace(self, namespace: str) -> bool:
         """Purge all documents in a namespace"""
         return self.delete_by_metadata({"namespace": namespace})
@@ -243,6 +421,8 @@ class ChromaAdapter:
                 name=self.collection_name,
                 metadata={"description": "AdvancedRules hybrid memory store"}
             )
+            with self._namespace_lock():
+                self._write_namespace_cache(set())
             logger.info("Purged all documents")
             return True
         except Exception as e:
@@ -253,37 +433,171 @@ class ChromaAdapter:
 class FallbackVectorStore:
     """Fallback vector store when ChromaDB is not available"""
 
-    def __init__(self, persist_dir: str = ".cache/fallback"):
+    def __init__(self, persist_dir: str = ".cache/fallback", quantize: bool = False,
+                 semantic_embeddings: bool = True):
         self.persist_dir = Path(persist_dir)
         self.persist_dir.mkdir(parents=True, exist_ok=True)
+        # Keep the similarity matrix as per-vector int8 instead of float32
+        self.quantize = quantize
+        # Hash-based embeddings carry no meaning: rank those by word overlap
+        self.semantic_embeddings = semantic_embeddings
         self.documents = []
+        # Inverted index: lowercase word -> ascending indices into self.documents
+        self._postings: Dict[str, List[int]] = {}
+        # Stacked float32 document embeddings, rebuilt lazily after changes
+        self._emb_matrix = None
+        self._emb_norms = None
+        self._emb_dirty = True
         self._load_documents()
 
+    def _docs_file(self) -> Path:
+        """Path of the persisted document list for the available serializer"""
+        return self.persist_dir / ("documents.msgpack" if msgpack is not None else "documents.json")
+
     def _load_documents(self):
         """Load documents from disk"""
-        docs_file = self.persist_dir / "documents.json"
-        if docs_file.exists():
-            try:
-                with open(docs_file, 'r') as f:
+        msgpack_file = self.persist_dir / "documents.msgpack"
+        json_file = self.persist_dir / "documents.json"
+        try:
+            if msgpack is not None and msgpack_file.exists():
+                with open(msgpack_file, 'rb') as f:
+                    self.documents = msgpack.unpack(f, raw=False, object_hook=_unpack_ndarray)
+            elif json_file.exists():
+                # Written without msgpack, or before the binary format was introduced
+                with open(json_file, 'r') as f:
                     self.documents = json.load(f)
-            except:
-                self.documents = []
+        except (OSError, ValueError, TypeError, KeyError):
+            self.documents = []
+        self._rebuild_index()
 
     def _save_documents(self):
-        """Save documents to disk"""
-        docs_file = self.persist_dir / "documents.json"
+        """Save documents to disk atomically (msgpack if installed, else JSON)"""
+        docs_file = self._docs_file()
+        tmp_file = docs_file.with_suffix(".tmp")
         try:
-            with open(docs_file, 'w') as f:
-                json.dump(self.documents, f, indent=2)
-        except Exception as e:
+            with open(tmp_file, 'wb') as f:
+                if msgpack is not None:
+                    msgpack.pack(self.documents, f, use_bin_type=True, default=_pack_ndarray)
+                else:
+                    f.write(json.dumps(self.documents, default=_as_list).encode())
+            os.replace(tmp_file, docs_file)
+        except (OSError, TypeError, ValueError) as e:
             logger.error(f"Failed to save documents: {e}")
 
+    def _index_document(self, idx: int, doc: Dict[str, Any]):
+        """Add a document's unique words to the inverted index"""
+        postings = self._postings
+        for word in set(doc["content"].lower().split()):
+            if word in postings:
+                postings[word].append(idx)
+            else:
+                postings[word] = [idx]
+
+    def _rebuild_index(self):
+        """Rebuild the inverted index after documents were removed"""
+        self._postings = {}
+        self._emb_dirty = True
+        for idx, doc in enumerate(self.documents):
+            self._index_document(idx, doc)
+
+    def _embedding_matrix(self):
+        """Stack stored embeddings into an (N, D) matrix, or None if not all docs have one"""
+        if self._emb_dirty:
+            self._emb_dirty = False
+            self._emb_matrix = None
+            self._emb_norms = None
+            if np is not None and self.documents:
+                try:
+                    matrix = np.asarray([doc["embedding"] for doc in self.documents],
+                                        dtype=np.float32)
+                except (KeyError, TypeError, ValueError):
+                    matrix = None
+                if matrix is not None and matrix.ndim == 2:
+                    if self.quantize:
+                        matrix = _quantize_int8(matrix)
+                        self._emb_norms = np.linalg.norm(matrix.astype(np.float32), axis=1)
+                    else:
+                        self._emb_norms = np.linalg.norm(matrix, axis=1)
+                    self._emb_matrix = matrix
+        return self._emb_matrix
+
+    @staticmethod
+    def _matches_filter(doc: Dict[str, Any], filter_metadata: Dict) -> bool:
+        """Check a document against a metadata filter"""
+        metadata = doc.get("metadata", {})
+        for key, value in filter_metadata.items():
+            if metadata.get(key) != value:
+                return False
+        return True
+
+    @staticmethod
+    def _format_result(doc: Dict[str, Any], score: float) -> Dict[str, Any]:
+        """Shape a stored document as a query result"""
+        return {
+            "content": doc["content"],
+            "metadata": doc.get("metadata", {}),
+            "score": score,
+            "source": doc.get("source", "unknown"),
+            "namespace": doc.get("namespace", "default"),
+            "file_path": doc.get("file_path", ""),
+            "persona": doc.get("persona", "general"),
+        }
+
+    def _query_by_embedding(self, embedding, n_results: int,
+                            filter_metadata: Optional[Dict]) -> Optional[List[Dict[str, Any]]]:
+        """Rank documents by cosine similarity, or None if embeddings can't be used"""
+        matrix = self._embedding_matrix()
+        if matrix is None:
+            return None
+
+        query = np.asarray(embedding, dtype=np.float32).ravel()
+        if query.shape[0] != matrix.shape[1]:
+            return None
+
+        # Cosine is scale-invariant, so int8 rows compare directly with an
+        # int8 query without dequantizing
+        if self.quantize:
+            query = _quantize_int8(query[np.newaxis, :])[0]
+
+        # One batched kernel call over all stored vectors
+        if simsimd is not None:
+            distances = np.asarray(simsimd.cdist(query[np.newaxis, :], matrix, metric="cosine"))
+            scores = 1.0 - distances.reshape(-1)
+        else:
+            if self.quantize:
+                dots = np.einsum("nd,d->n", matrix, query, dtype=np.int32, casting="safe")
+            else:
+                dots = matrix @ query
+            norms = self._emb_norms * np.linalg.norm(query.astype(np.float32))
+            scores = np.divide(dots, norms,
+                               out=np.zeros(len(matrix), dtype=np.float32), where=norms > 0)
+
+        if filter_metadata:
+            candidates = np.asarray(
+                [i for i, doc in enumerate(self.documents)
+                 if self._matches_filter(doc, filter_metadata)],
+                dtype=np.intp,
+            )
+        else:
+            candidates = np.arange(len(matrix))
+
+        if n_results <= 0 or len(candidates) == 0:
+            return []
+        if n_results < len(candidates):
+            part = np.argpartition(-scores[candidates], n_results - 1)[:n_results]
+            candidates = candidates[part]
+
+        top = sorted(candidates.tolist(), key=lambda i: (-scores[i], i))
+        return [self._format_result(self.documents[i], float(scores[i])) for i in top]
+
     def store_documents(self, documents: List[Dict[str, Any]]) -> bool:
         """Store documents (simple list append)"""
         for doc in documents:
             doc_copy = doc.copy()
             doc_copy["id"] = f"{doc.get('namespace', 'default')}_{hash(doc['content']) % 1000000}"
+            self._index_document(len(self.documents), doc_copy)
             self.documents.append(doc_copy)
+        self._emb_dirty = True
 
         self._save_documents()
         logger.info(f"Stored {len(documents)} documents in fallback store")
@@ -291,46 +605,34 @@ class FallbackVectorStore:
 
     def query_documents(self, query_text: str, embedding: List[float],
                        n_results: int = 8, filter_metadata: Optional[Dict] = None) -> List[Dict[str, Any]]:
-        """Simple text matching query (no embeddings)"""
+        """Cosine similarity over stored semantic embeddings, else simple text matching"""
+        if self.semantic_embeddings and embedding is not None and len(embedding) > 0:
+            results = self._query_by_embedding(embedding, n_results, filter_metadata)
+            if results is not None:
+                return results
+
+        query_words = set(query_text.lower().split())
+        if not query_words:
+            return []
+
+        # Word overlap counts, touching only documents that share a query word
+        overlaps: Dict[int, int] = {}
+        for word in query_words:
+            for idx in self._postings.get(word, ()):
+                overlaps[idx] = overlaps.get(idx, 0) + 1
+
         results = []
-        query_lower = query_text.lower()
+        for idx in sorted(overlaps):
+            doc = self.documents[idx]
 
-        for doc in self.documents:
             # Simple filtering
-            if filter_metadata:
-                match = True
-                for key, value in filter_metadata.items():
-                    if doc.get("metadata", {}).get(key) != value:
-                        match = False
-                        break
-                if not match:
-                    continue
+            if filter_metadata and not self._matches_filter(doc, filter_metadata):
+                continue
 
-            # Simple text matching
-            content_lower = doc["content"].lower()
-            score = 0.0
-
-            # Word overlap scoring
-            query_words = set(query_lower.split())
-            content_words = set(content_lower.split())
-            overlap = len(query_words & content_words)
-            if overlap > 0:
-                score = overlap / len(query_words)
-
-            if score > 0:
-                results.append({
-                    "content": doc["content"],
-                    "metadata": doc.get("metadata", {}),
-                    "score": score,
-                    "source": doc.get("source", "unknown"),
-                    "namespace": doc.get("namespace", "default"),
-                    "file_path": doc.get("file_path", ""),
-                    "persona": doc.get("persona", "general"),
-                })
+            results.append(self._format_result(doc, overlaps[idx] / len(query_words)))
 
         # Sort by score and limit results
-        results.sort(key=lambda x: x["score"], reverse=True)
-        return results[:n_results]
+        return heapq.nlargest(n_results, results, key=lambda x: x["score"])
 
     def delete_by_metadata(self, metadata_filter: Dict[str, Any]) -> bool:
         """Delete documents matching metadata"""
@@ -340,6 +642,7 @@ class FallbackVectorStore:
             if not all(doc.get("metadata", {}).get(k) == v for k, v in metadata_filter.items())
         ]
         if len(self.documents) != original_count:
+            self._rebuild_index()
             self._save_documents()
             return True
         return False
@@ -367,6 +670,7 @@ class FallbackVectorStore:
             if doc.get("namespace") != namespace
         ]
         if len(self.documents) != original_count:
+            self._rebuild_index()
             self._save_documents()
             return True
         return False
@@ -374,19 +678,33 @@ class FallbackVectorStore:
     def purge_all(self) -> bool:
         """Purge all documents"""
         self.documents = []
+        self._postings = {}
+        self._emb_dirty = True
         self._save_documents()
         return True
 
 
-def create_vector_store(backend: str = "chroma", persist_dir: str = ".cache/chroma") -> Any:
-    """Factory function to create vector store"""
+def _quantize_int8(matrix):
+    """Symmetric per-row int8 quantization of a float matrix"""
+    scales = np.abs(matrix).max(axis=1, keepdims=True) / 127.0
+    scales[scales == 0] = 1.0
+    return np.round(matrix / scales).astype(np.int8)
+
+
+def create_vector_store(backend: str = "chroma", persist_dir: str = ".cache/chroma",
+                        quantize: bool = False, semantic_embeddings: bool = True) -> Any:
+    """Factory function to create vector store
+
+    ``quantize`` and ``semantic_embeddings`` apply to the fallback store only;
+    Chroma keeps its own float32 index.
+    """
     if backend.lower() == "chroma":
         store = ChromaAdapter(persist_dir)
         if store.initialize():
             return store
         else:
             logger.warning("ChromaDB failed, falling back to simple store")
-            return FallbackVectorStore(persist_dir.replace("chroma", "fallback"))
+            return FallbackVectorStore(persist_dir.replace("chroma", "fallback"), quantize, semantic_embeddings)
     else:
         logger.info(f"Using fallback store for backend: {backend}")
-        return FallbackVectorStore(persist_dir.replace("chroma", "fallback"))
+        return FallbackVectorStore(persist_dir.replace("chroma", "fallback"), quantize, semantic_embeddings)
@@ -5,30 +5,84 @@ GPU-accelerated embeddings with graceful degradation
 """
 
 import os
+import contextlib
+import hashlib
 import logging
+from collections import OrderedDict
 from typing import List, Optional, Union
 from pathlib import Path
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 class EmbeddingProvider:
     """Base class for embedding providers"""
 
+    # Number of per-text embeddings kept in the LRU cache
+    cache_size = 4096
+    # Dimension of the zero vectors returned when encoding fails
+    dimension = 384
+    # dtype of returned embeddings; stores upcast at their own boundary
+    dtype = np.float32
+    # Whether similar texts get nearby vectors (False for the hash fallback)
+    semantic = True
+
     def __init__(self, model_name: str, device: str = "auto"):
         self.model_name = model_name
         self.device = device
         self.model = None
         self._initialized = False
+        self._cache = OrderedDict()
 
     def initialize(self) -> bool:
         """Initialize the embedding model"""
         raise NotImplementedError
 
-    def encode(self, texts: Union[str, List[str]]) -> List[List[float]]:
-        """Encode texts to embeddings"""
+    def encode(self, texts: Union[str, List[str]]) -> np.ndarray:
+        """Encode texts to an (N, D) embedding array of ``self.dtype``
+
+        Only texts missing from the LRU cache are sent to the model.
+        """
+        if not self._initialized:
+            raise RuntimeError("Model not initialized. Call initialize() first.")
+
+        if isinstance(texts, str):
+            texts = [texts]
+
+        keys = [hashlib.blake2b(text.encode(), digest_size=16).digest() for text in texts]
+        cache = self._cache
+        rows = {}
+        for key in keys:
+            if key in cache:
+                cache.move_to_end(key)
+                rows[key] = cache[key]
+
+        # Encode each distinct uncached text once
+        misses = {key: text for key, text in zip(keys, texts) if key not in rows}
+        if misses or not keys:
+            try:
+                embeddings = self._encode_impl(list(misses.values()))
+            except Exception as e:
+                logger.error(f"Failed to encode texts: {e}")
+                # Return zero embeddings as fallback (not cached)
+                return np.zeros((len(texts), self.dimension), dtype=self.dtype)
+            if not keys:
+                return embeddings
+
+            # Copy each row: a view would keep the whole (N, D) batch alive
+            for key, row in zip(misses, embeddings):
+                rows[key] = cache[key] = row.copy()
+            while len(cache) > self.cache_size:
+                cache.popitem(last=False)
+
+        return np.stack([rows[key] for key in keys])
+
+    def _encode_impl(self, texts: List[str]) -> np.ndarray:
+        """Run the model on texts; errors propagate to encode()"""
         raise NotImplementedError
 
-    def __call__(self, texts: Union[str, List[str]]) -> List[List[float]]:
+    def __call__(self, texts: Union[str, List[str]]) -> np.ndarray:
         """Convenience method for encoding"""
         return self.encode(texts)
 
@@ -36,9 +90,14 @@ class EmbeddingProvider:
 class BGEEmbeddingProvider(EmbeddingProvider):
     """BGE-M3 embeddings with GPU acceleration"""
 
-    def __init__(self, model_name: str = "BAAI/bge-m3", device: str = "auto"):
+    def __init__(self, model_name: str = "BAAI/bge-m3", device: str = "auto",
+                 batch_size: int = 32):
         super().__init__(model_name, device)
         self.tokenizer = None
+        self.batch_size = batch_size
+        self.dimension = 1024  # BGE-M3 has 1024 dimensions
+        # Output is L2-normalized, so fp16 keeps cosine/dot accuracy at half the bytes
+        self.dtype = np.float16
 
     def initialize(self) -> bool:
         """Initialize BGE-M3 model"""
@@ -53,12 +112,17 @@ class BGEEmbeddingProvider(EmbeddingProvider):
 
             logger.info(f"Initializing BGE embeddings on device: {self.device}")
 
-            # Load tokenizer and model
-            self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
-            self.model = AutoModel.from_pretrained(self.model_name)
+            use_cuda = self.device == "cuda" and hasattr(torch, 'cuda') and torch.cuda.is_available()
+
+            # Load tokenizer and model (bf16 weights on GPU halve memory traffic)
+            self.tokenizer = AutoTokenizer.from_pretrained(self.model_name, use_fast=True)
+            self.model = AutoModel.from_pretrained(
+                self.model_name,
+                torch_dtype=torch.bfloat16 if use_cuda else torch.float32,
+            ).eval()
 
             # Move to device if CUDA available
-            if self.device == "cuda" and hasattr(torch, 'cuda') and torch.cuda.is_available():
+            if use_cuda:
                 self.model = self.model.cuda()
 
             self._initialized = True
@@ -73,52 +137,52 @@ class BGEEmbeddingProvider(EmbeddingProvider):
             logger.error(f"Failed to initialize BGE model: {e}")
             return False
 
-    def encode(self, texts: Union[str, List[str]]) -> List[List[float]]:
+    def _encode_impl(self, texts: List[str]) -> np.ndarray:
         """Encode texts using BGE-M3"""
-        if not self._initialized:
-            raise RuntimeError("Model not initialized. Call initialize() first.")
-
-        if isinstance(texts, str):
-            texts = [texts]
-
-        try:
-            import torch
-
-            # Tokenize
-            inputs = self.tokenizer(
-                texts,
-                max_length=8192,
-                padding=True,
-                truncation=True,
-                return_tensors="pt"
-            )
-
-            # Move to device
-            if self.device == "cuda":
-                inputs = {k: v.cuda() for k, v in inputs.items()}
-
-            # Generate embeddings
-            with torch.no_grad():
-                outputs = self.model(**inputs)
-                embeddings = outputs.last_hidden_state[:, 0]  # CLS token
+        import torch
 
-            # Normalize
+        use_cuda = self.device == "cuda"
+        # Sort by length so each micro-batch pads to similar lengths
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        batches = []
+
+        with torch.inference_mode():
+            for start in range(0, len(order), self.batch_size):
+                batch = [texts[i] for i in order[start:start + self.batch_size]]
+
+                # Tokenize
+                inputs = self.tokenizer(
+                    batch,
+                    max_length=8192,
+                    padding=True,
+                    truncation=True,
+                    return_tensors="pt"
+                )
+
+                # Move to device
+                if use_cuda:
+                    inputs = {k: v.to(self.device, non_blocking=True) for k, v in inputs.items()}
+
+                # Generate embeddings
+                with (torch.autocast("cuda", dtype=torch.bfloat16) if use_cuda
+                      else contextlib.nullcontext()):
+                    outputs = self.model(**inputs)
+                batches.append(outputs.last_hidden_state[:, 0].float())  # CLS token
+
+            # Restore caller order and normalize
+            embeddings = torch.cat(batches)[torch.argsort(torch.tensor(order))]
             embeddings = torch.nn.functional.normalize(embeddings, p=2, dim=1)
 
-            # Convert to list
-            return embeddings.cpu().tolist()
-
-        except Exception as e:
-            logger.error(f"Failed to encode texts: {e}")
-            # Return zero embeddings as fallback
-            return [[0.0] * 1024 for _ in texts]  # BGE-M3 has 1024 dimensions
+        return embeddings.half().cpu().numpy()
 
 
 class SentenceTransformerProvider(EmbeddingProvider):
     """Sentence Transformers fallback"""
 
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2", device: str = "auto"):
+    def __init__(self, model_name: str = "all-MiniLM-L6-v2", device: str = "auto",
+                 batch_size: int = 64):
         super().__init__(model_name, device)
+        self.batch_size = batch_size
 
     def initialize(self) -> bool:
         """Initialize Sentence Transformers model"""
@@ -133,6 +197,11 @@ class SentenceTransformerProvider(EmbeddingProvider):
             # Load model
             device_arg = 0 if self.device == "cuda" else -1  # SentenceTransformers uses device indices
             self.model = SentenceTransformer(self.model_name, device=device_arg)
+
+            # Half precision halves memory traffic on GPU
+            if self.device == "cuda":
+                self.model = self.model.half()
+
             self._initialized = True
             logger.info("Sentence Transformers initialized successfully")
             return True
@@ -145,26 +214,23 @@ class SentenceTransformerProvider(EmbeddingProvider):
             logger.error(f"Failed to initialize Sentence Transformers: {e}")
             return False
 
-    def encode(self, texts: Union[str, List[str]]) -> List[List[float]]:
+    def _encode_impl(self, texts: List[str]) -> np.ndarray:
         """Encode texts using Sentence Transformers"""
-        if not self._initialized:
-            raise RuntimeError("Model not initialized. Call initialize() first.")
-
-        if isinstance(texts, str):
-            texts = [texts]
-
-        try:
-            embeddings = self.model.encode(texts, convert_to_tensor=False)
-            return embeddings.tolist()
-        except Exception as e:
-            logger.error(f"Failed to encode texts: {e}")
-            # Return zero embeddings as fallback
-            return [[0.0] * 384 for _ in texts]  # Default dimension
+        embeddings = self.model.encode(
+            texts,
+            batch_size=self.batch_size,
+            normalize_embeddings=True,  # normalized on device, like BGE
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        )
+        return np.asarray(embeddings, dtype=np.float32)
 
 
 class FallbackEmbeddingProvider(EmbeddingProvider):
     """Simple fallback when no ML libraries available"""
 
+    semantic = False
+
     def __init__(self, model_name: str = "fallback", device: str = "cpu"):
         super().__init__(model_name, device)
         self.dimension = 384  # Standard dimension
@@ -175,37 +241,19 @@ class FallbackEmbeddingProvider(EmbeddingProvider):
         logger.info("Using fallback embedding provider (no ML acceleration)")
         return True
 
-    def encode(self, texts: Union[str, List[str]]) -> List[List[float]]:
-        """Generate simple hash-based embeddings"""
+    def encode(self, texts: Union[str, List[str]]) -> np.ndarray:
+        """Generate simple hash-based embeddings (cheap enough to skip the cache)"""
         if isinstance(texts, str):
             texts = [texts]
 
-        embeddings = []
-        for text in texts:
-            # Simple hash-based embedding (deterministic)
-            import hashlib
-            hash_obj = hashlib.sha256(text.encode())
-            hash_bytes = hash_obj.digest()
-
-            # Convert to float list
-            embedding = []
-            for i in range(0, len(hash_bytes), 4):
-                chunk = hash_bytes[i:i+4]
-                if len(chunk) == 4:
-                    value = int.from_bytes(chunk, byteorder='big') / (2**32 - 1)
-                    embedding.append(value * 2 - 1)  # Scale to [-1, 1]
-                else:
-                    embedding.append(0.0)
-
-            # Pad or truncate to dimension
-            if len(embedding) < self.dimension:
-                embedding.extend([0.0] * (self.dimension - len(embedding)))
-            else:
-                embedding = embedding[:self.dimension]
-
-            embeddings.append(embedding)
-
-        return embeddings
+        # Simple hash-based embedding (deterministic): an extendable-output
+        # hash fills every dimension, one big-endian uint32 per value
+        nbytes = self.dimension * 4
+        digests = b"".join(hashlib.shake_256(text.encode()).digest(nbytes) for text in texts)
+        values = np.frombuffer(digests, dtype=">u4").reshape(len(texts), self.dimension)
+
+        # Scale to [-1, 1]
+        return (values / (2**32 - 1) * 2 - 1).astype(np.float32)
 
 
 def _pick_device():
@@ -4,37 +4,61 @@ PII-SAFE METRICS COLLECTOR
 Thin wrapper over Prometheus client with strict, PII-free labels.
 """
 
+import functools
 import os
-import re
+import string
 import time
 from contextlib import contextmanager
 from prometheus_client import Counter, Histogram, Gauge, CollectorRegistry, REGISTRY
 
-# Sanitization regex - only allow alphanumeric, underscore, dash, dot, forward slash
-_ALLOWED = re.compile(r"[^a-zA-Z0-9_\-./]")
+# Sanitization - only allow alphanumeric, underscore, dash, dot, forward slash
+_ALLOWED_CHARS = frozenset(string.ascii_letters + string.digits + "_-./")
 MAXLEN = 64
 
 
+class _SanTable(dict):
+    """str.translate table mapping every disallowed code point to '_'"""
+
+    def __missing__(self, codepoint):
+        self[codepoint] = mapped = codepoint if chr(codepoint) in _ALLOWED_CHARS else "_"
+        return mapped
+
+
+_SAN_TABLE = _SanTable()
+
+
+@functools.lru_cache(maxsize=4096)
+def _san_str(v):
+    """Sanitize a string label value (label vocabularies are small, so cache)"""
+    return v.translate(_SAN_TABLE)[:MAXLEN] or "unknown"
+
+
 def _san(v):
     """Sanitize label values to be PII-free and Prometheus-safe"""
     if v is None:
         return "unknown"
-    v = str(v)
-    v = _ALLOWED.sub("_", v)[:MAXLEN]
-    return v or "unknown"
+    return _san_str(str(v))
+
+
+# Read once at import; the flag is process-wide and set before startup
+_ENABLED = os.getenv("AR_ENABLE_METRICS") == "1"
+# Optional: read from config file if needed
+# try:
+#     from config import features
+#     _ENABLED = _ENABLED or features.get("metrics_v2", False)
+# except:
+#     pass
 
 
 def metrics_enabled():
     """Check if metrics collection is enabled"""
-    if os.getenv("AR_ENABLE_METRICS") == "1":
-        return True
-    # Optional: read from config file if needed
-    # try:
-    #     from config import features
-    #     return features.get("metrics_v2", False)
-    # except:
-    #     pass
-    return False
+    return _ENABLED
+
+
+def set_metrics_enabled(enabled: bool):
+    """Override the metrics flag at runtime (for tests and embedding apps)"""
+    global _ENABLED
+    _ENABLED = bool(enabled)
 
 
 # Global metrics registry (using default)
@@ -72,6 +96,13 @@ STEP_RETRIES = Counter(
     ["flow_id", "step_id", "persona"]
 )
 
+STEP_RETRY_DELAY_S = Histogram(
+    "ar_step_retry_delay_seconds",
+    "Effective backoff before a step retry",
+    ["flow_id", "step_id", "persona"],
+    buckets=(1, 5, 15, 30, 60, 120, 300, 600, 1200, 3600)
+)
+
 # Token tracking
 TOKENS = Counter(
     "ar_tokens_total", 
@@ -87,82 +118,91 @@ INFLIGHT = Gauge(
 )
 
 
+# Labelled children keyed by (id(metric), *raw label values)
+_CHILD_CACHE = {}
+
+
+def _get_child(metric, *raw_labels):
+    """Return the labelled child of a metric, cached by raw label values"""
+    key = (id(metric),) + raw_labels
+    try:
+        return _CHILD_CACHE[key]
+    except KeyError:
+        child = _CHILD_CACHE[key] = metric.labels(*map(_san, raw_labels))
+        return child
+    except TypeError:
+        # Unhashable label value - sanitize and look up uncached
+        return metric.labels(*map(_san, raw_labels))
+
+
 def flow_start(flow_id, persona, exec_mode, branch):
     """Record flow start event"""
-    if not metrics_enabled():
+    if not _ENABLED:
         return
-    FLOW_STARTED.labels(
-        _san(flow_id), 
-        _san(persona), 
-        _san(exec_mode), 
-        _san(branch)
-    ).inc()
+    _get_child(FLOW_STARTED, flow_id, persona, exec_mode, branch).inc()
 
 
 def flow_end(flow_id, persona, exec_mode, branch, success: bool, reason: str = "ok"):
     """Record flow completion event"""
-    if not metrics_enabled():
+    if not _ENABLED:
         return
     
     if success:
-        FLOW_SUCCESS.labels(
-            _san(flow_id), 
-            _san(persona), 
-            _san(exec_mode), 
-            _san(branch)
-        ).inc()
+        _get_child(FLOW_SUCCESS, flow_id, persona, exec_mode, branch).inc()
     else:
-        FLOW_FAIL.labels(
-            _san(flow_id), 
-            _san(persona), 
-            _san(exec_mode), 
-            _san(branch), 
-            _san(reason)
-        ).inc()
+        _get_child(FLOW_FAIL, flow_id, persona, exec_mode, branch, reason).inc()
 
 
 @contextmanager
 def step_timer(flow_id, step_id, persona, model="unknown", exec_mode="dry_run"):
     """Context manager to time step execution and track inflight status"""
+    if not _ENABLED:
+        yield
+        return
+
+    # Resolve both children once; the flow label is shared by both
+    inflight = _get_child(INFLIGHT, flow_id)
+    latency = _get_child(STEP_LAT_MS, flow_id, step_id, persona, model, exec_mode)
+
+    inflight.inc()
     started = time.perf_counter()
-    if metrics_enabled():
-        INFLIGHT.labels(_san(flow_id)).inc()
-    
     try:
         yield
     finally:
-        if metrics_enabled():
-            dur_ms = (time.perf_counter() - started) * 1000.0
-            STEP_LAT_MS.labels(
-                _san(flow_id), 
-                _san(step_id), 
-                _san(persona), 
-                _san(model), 
-                _san(exec_mode)
-            ).observe(dur_ms)
-            INFLIGHT.labels(_san(flow_id)).dec()
-
-
-def add_retry(flow_id, step_id, persona):
-    """Record a step retry event"""
-    if not metrics_enabled():
+        latency.observe((time.perf_counter() - started) * 1000.0)
+        inflight.dec()
+
+
+def step_begin(flow_id):
+    """Mark a step inflight (the entry half of step_timer)"""
+    if not _ENABLED:
+        return
+    _get_child(INFLIGHT, flow_id).inc()
+
+
+def step_end(flow_id, step_id, persona, model, exec_mode, latency_ms, inflight=True):
+    """Record a finished step's latency (the exit half of step_timer)"""
+    if not _ENABLED:
+        return
+    _get_child(STEP_LAT_MS, flow_id, step_id, persona, model, exec_mode).observe(latency_ms)
+    if inflight:
+        _get_child(INFLIGHT, flow_id).dec()
+
+
+def add_retry(flow_id, step_id, persona, delay=None):
+    """Record a step retry event (and the backoff chosen for it, if given)"""
+    if not _ENABLED:
         return
-    STEP_RETRIES.labels(
-        _san(flow_id), 
-        _san(step_id), 
-        _san(persona)
-    ).inc()
+    _get_child(STEP_RETRIES, flow_id, step_id, persona).inc()
+    if delay is not None:
+        _get_child(STEP_RETRY_DELAY_S, flow_id, step_id, persona).observe(delay)
 
 
 def add_tokens(direction, model, persona, n):
     """Record token usage"""
-    if not metrics_enabled():
+    if not _ENABLED:
         return
-    TOKENS.labels(
-        _san(direction), 
-        _san(model), 
-        _san(persona)
-    ).inc(n)
+    _get_child(TOKENS, direction, model, persona).inc(n)
 
 
 # Test/debug utilities
@@ -173,6 +213,7 @@ def get_metric_families():
 
 def reset_metrics():
     """Reset all metrics (for testing only)"""
+    _CHILD_CACHE.clear()
     for collector in list(REGISTRY._collector_to_names.keys()):
         if hasattr(collector, '_value'):
             collector._value.clear()
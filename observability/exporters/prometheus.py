@@ -5,22 +5,111 @@ Exposes Prometheus metrics via HTTP server
 """
 
 import argparse
+import gzip
 import os
+import signal
+import threading
 import time
-from prometheus_client import start_http_server
+from socketserver import ThreadingMixIn
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, generate_latest
 from observability.collector import metrics_enabled
 
 
+class CachingApp:
+    """WSGI app serving a short-lived, pre-gzipped registry snapshot"""
+
+    def __init__(self, registry=REGISTRY, ttl: float = 1.0):
+        self.registry = registry
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._pending = None
+        self._ts = float("-inf")
+        self._cached = (b"", b"")
+
+    def _snapshot(self):
+        """Return (body, gzipped body), rendering at most once per TTL"""
+        while True:
+            with self._lock:
+                if time.monotonic() - self._ts < self.ttl:
+                    return self._cached
+                event = self._pending
+                leader = event is None
+                if leader:
+                    event = self._pending = threading.Event()
+                    event.result = None
+            if leader:
+                break
+            # Coalesce concurrent scrapes: one thread renders, the rest wait on
+            # it; if that render failed they retry instead of serving stale data
+            event.wait()
+            if event.result is not None:
+                return event.result
+
+        try:
+            body = generate_latest(self.registry)
+            cached = (body, gzip.compress(body, 1))
+            with self._lock:
+                self._cached, self._ts = cached, time.monotonic()
+            event.result = cached
+            return cached
+        finally:
+            with self._lock:
+                self._pending = None
+            event.set()
+
+    def __call__(self, environ, start_response):
+        body, gz = self._snapshot()
+        headers = [("Content-Type", CONTENT_TYPE_LATEST), ("Vary", "Accept-Encoding")]
+        if "gzip" in environ.get("HTTP_ACCEPT_ENCODING", ""):
+            body = gz
+            headers.append(("Content-Encoding", "gzip"))
+        headers.append(("Content-Length", str(len(body))))
+        start_response("200 OK", headers)
+        return [body]
+
+
+def build_registry():
+    """Default registry, or a multiprocess aggregate when PROMETHEUS_MULTIPROC_DIR is set"""
+    if not os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        return REGISTRY
+
+    # Native collector reads the per-process .db files much faster when installed
+    try:
+        from prometheus_client_speedups import MultiProcessCollector
+    except ImportError:
+        from prometheus_client.multiprocess import MultiProcessCollector
+
+    registry = CollectorRegistry()
+    MultiProcessCollector(registry)
+    return registry
+
+
+class _ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+
+
+class _QuietHandler(WSGIRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
 def serve(port: int = 9108, addr: str = "0.0.0.0"):
     """Start the Prometheus metrics HTTP server"""
-    start_http_server(port, addr=addr)
+    ttl = float(os.getenv("AR_METRICS_CACHE_TTL", "1"))
+    httpd = make_server(addr, port, CachingApp(build_registry(), ttl=ttl),
+                        server_class=_ThreadingWSGIServer, handler_class=_QuietHandler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
     print(f"[obs] Prometheus exporter on http://{addr}:{port}/metrics")
-    
-    try:
-        while True:
-            time.sleep(3600)
-    except KeyboardInterrupt:
-        print("[obs] exporter stopped")
+
+    # Block until SIGTERM/SIGINT, then let in-flight scrapes finish
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+    stop.wait()
+    httpd.shutdown()
+    httpd.server_close()
+    print("[obs] exporter stopped")
 
 
 if __name__ == "__main__":
@@ -42,4 +131,4 @@ if __name__ == "__main__":
     if not metrics_enabled():
         print("AR_ENABLE_METRICS!=1 → metrics disabled (exporter will still serve empty registry)")
     
-    serve(args.port, args.addr)
\ No newline at end of file
+    serve(args.port, args.addr)
@@ -1,52 +1,79 @@
 #!/usr/bin/env python3
-import argparse, re, sys, time, urllib.request
+import argparse, bisect, functools, gzip, re, sys, time, urllib.request
 
 parser = argparse.ArgumentParser()
 parser.add_argument('--url', required=True)
 parser.add_argument('--p95-ms', type=float, default=1200.0)
 args = parser.parse_args()
 
-def scrape(url):
-    with urllib.request.urlopen(url, timeout=3) as r:
-        return r.read().decode()
+HIST = "ar_step_latency_ms"
+HIST_PREFIX = HIST + "_"
+HIST_SUFFIX_AT = len(HIST_PREFIX)
+COUNTERS = ("ar_flow_started_total", "ar_flow_success_total")
+_LE_RE = re.compile(r'le="([^"]+)"')
 
-def parse_histogram(lines, name, label_key='persona'):
-    # returns {persona: (buckets{le:count}, total_count)}
+@functools.lru_cache(maxsize=8)
+def _label_re(key):
+    return re.compile(fr'{re.escape(key)}="([^"]+)"')
+
+def scrape_lines(url):
+    # yields lines straight off the socket, so memory stays bounded by a line
+    req = urllib.request.Request(url, headers={'Accept-Encoding': 'gzip'})
+    with urllib.request.urlopen(req, timeout=3) as r:
+        stream = gzip.GzipFile(fileobj=r) if r.headers.get('Content-Encoding') == 'gzip' else r
+        for raw in stream:
+            yield raw.decode().rstrip('\r\n')
+
+def parse_metrics(lines):
+    # single pass: returns (started, success, {persona: (buckets{le:count}, total_count)})
+    c_started = 0.0
+    c_success = 0.0
     buckets = {}
     totals = {}
+    persona_re = _label_re("persona")
     for ln in lines:
-        if ln.startswith(f"{name}_bucket"):
-            labs = ln.split("{",1)[1].split("}",1)[0]
-            val = float(ln.rsplit(" ",1)[1])
-            le = re.search(r'le="([^"]+)"', labs).group(1)
-            persona = re.search(fr'{label_key}="([^"]+)"', labs).group(1)
-            buckets.setdefault(persona, {})[float(le)] = val
-        elif ln.startswith(f"{name}_count"):
-            labs = ln.split("{",1)[1].split("}",1)[0]
-            val = float(ln.rsplit(" ",1)[1])
-            persona = re.search(fr'{label_key}="([^"]+)"', labs).group(1)
-            totals[persona] = totals.get(persona, 0.0) + val
-    return {p:(buckets.get(p,{}), totals.get(p,0.0)) for p in set(buckets)|set(totals)}
+        # one short prefix test rejects comments and foreign metrics
+        if not ln.startswith("ar_"):
+            continue
+        if ln.startswith(COUNTERS):
+            if ln.startswith(COUNTERS[0]):
+                c_started += float(ln[ln.rfind(" ") + 1:])
+            else:
+                c_success += float(ln[ln.rfind(" ") + 1:])
+        elif ln.startswith(HIST_PREFIX):
+            # suffix after "ar_step_latency_ms_": bucket / count (sum, created ignored)
+            if ln.startswith("bucket", HIST_SUFFIX_AT):
+                labs = ln.partition("{")[2].partition("}")[0]
+                if 'le="' not in labs:
+                    continue
+                val = float(ln[ln.rfind(" ") + 1:])
+                le = _LE_RE.search(labs).group(1)
+                persona = persona_re.search(labs).group(1)
+                buckets.setdefault(persona, {})[float(le)] = val
+            elif ln.startswith("count", HIST_SUFFIX_AT):
+                labs = ln.partition("{")[2].partition("}")[0]
+                val = float(ln[ln.rfind(" ") + 1:])
+                persona = persona_re.search(labs).group(1)
+                totals[persona] = totals.get(persona, 0.0) + val
+    hist = {p:(buckets.get(p,{}), totals.get(p,0.0)) for p in set(buckets)|set(totals)}
+    return c_started, c_success, hist
 
 def p95_from_hist(buckets, total):
     if total == 0: return None
-    target = 0.95 * total
-    for le in sorted(buckets.keys()):
-        if buckets[le] >= target:
-            return le
-    return None
+    # bucket counts are cumulative, hence non-decreasing in le: bisect them
+    les = sorted(buckets)
+    cumulative = [buckets[le] for le in les]
+    idx = bisect.bisect_left(cumulative, 0.95 * total)
+    return les[idx] if idx < len(les) else None
 
-text = scrape(args.url).splitlines()
+c_started, c_success, hist = parse_metrics(scrape_lines(args.url))
 
 # Counters must move
-c_started = sum(float(l.rsplit(" ",1)[1]) for l in text if l.startswith("ar_flow_started_total"))
-c_success = sum(float(l.rsplit(" ",1)[1]) for l in text if l.startswith("ar_flow_success_total"))
 if c_started < 1 or c_success < 1:
     print(f"✗ counters too low: started={c_started}, success={c_success}")
     sys.exit(1)
 
 # P95 check
-hist = parse_histogram(text, "ar_step_latency_ms")
 violations = []
 for persona, (bkt, tot) in hist.items():
     p95 = p95_from_hist(bkt, tot)
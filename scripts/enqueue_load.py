@@ -1,28 +1,50 @@
 #!/usr/bin/env python3
-import argparse, sys
+import argparse, os, sys
+from multiprocessing import Pool
 sys.path.insert(0, '.')
+from exec_queue.celery_app import app
 from exec_queue.tasks import execute_step
 
-p = argparse.ArgumentParser()
-p.add_argument('--coder', type=int, default=30)
-p.add_argument('--auditor', type=int, default=10)
-p.add_argument('--flow', type=str, default='flow_demo')
-p.add_argument('--branch', type=str, default='feature/queue-demo')
-args = p.parse_args()
+def enq(start, end, persona, flow, branch):
+    # constant kwargs built once per slice; only per-task keys change
+    base = dict(
+        flow_id=flow,
+        persona=persona,
+        exec_mode="dry_run",
+        branch=branch,
+        model="local-13b",
+    )
+    prefix = f"T-{persona[:2]}-"
+    # one pooled producer (connection + channel) per process, acquired post-fork
+    with app.producer_pool.acquire(block=True) as producer:
+        for i in range(start, end):
+            execute_step.apply_async(kwargs=dict(
+                base,
+                task_id=f"{prefix}{i:04d}",
+                step_id=f"step_{i:03d}",
+                payload={"i": i}
+            ), producer=producer)
+    return end - start
 
-def enq(n, persona):
-    for i in range(n):
-        execute_step.apply_async(kwargs=dict(
-            flow_id=args.flow,
-            task_id=f"T-{persona[:2]}-{i:04d}",
-            step_id=f"step_{i:03d}",
-            persona=persona,
-            exec_mode="dry_run",
-            branch=args.branch,
-            model="local-13b",
-            payload={"i": i}
-        ))
+def slices(n, persona, workers, flow, branch):
+    chunk = max(1, -(-n // max(1, workers)))
+    return [(i, min(i + chunk, n), persona, flow, branch) for i in range(0, n, chunk)]
 
-enq(args.coder, "CODER_AI")
-enq(args.auditor, "AUDITOR_AI")
-print(f"✅ Enqueued {args.coder}+{args.auditor} tasks")
+if __name__ == '__main__':
+    p = argparse.ArgumentParser()
+    p.add_argument('--coder', type=int, default=30)
+    p.add_argument('--auditor', type=int, default=10)
+    p.add_argument('--flow', type=str, default='flow_demo')
+    p.add_argument('--branch', type=str, default='feature/queue-demo')
+    p.add_argument('--workers', type=int, default=min(4, os.cpu_count() or 1))
+    args = p.parse_args()
+
+    jobs = slices(args.coder, "CODER_AI", args.workers, args.flow, args.branch) + \
+           slices(args.auditor, "AUDITOR_AI", args.workers, args.flow, args.branch)
+    if args.workers > 1 and len(jobs) > 1:
+        with Pool(args.workers) as pool:
+            pool.starmap(enq, jobs)
+    else:
+        for job in jobs:
+            enq(*job)
+    print(f"✅ Enqueued {args.coder}+{args.auditor} tasks")
@@ -8,27 +8,46 @@ import json
 import yaml
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 class SafetyRailsValidator:
     def __init__(self, root_dir: str = "."):
         self.root_dir = Path(root_dir)
         self.errors = []
         self.warnings = []
+        self._buf = []
+
+    def _out(self, line: str):
+        """Queue a line of output until the current phase is flushed"""
+        self._buf.append(line)
+
+    def flush(self):
+        """Write queued output in a single call"""
+        if self._buf:
+            sys.stdout.write("\n".join(self._buf) + "\n")
+            sys.stdout.flush()
+            self._buf.clear()
 
     def log_error(self, message: str):
         """Log an error that prevents validation"""
         self.errors.append(message)
-        print(f"❌ {message}")
+        self._out(f"❌ {message}")
 
     def log_warning(self, message: str):
         """Log a warning that should be reviewed"""
         self.warnings.append(message)
-        print(f"⚠️  {message}")
+        self._out(f"⚠️  {message}")
 
     def log_success(self, message: str):
         """Log a successful validation"""
-        print(f"✅ {message}")
+        self._out(f"✅ {message}")
 
     def validate_json_files(self):
         """Validate all JSON schema files and envelope v2"""
@@ -43,20 +62,33 @@ class SafetyRailsValidator:
             "tools/envelopes/action_envelope_v2.json"
         ]
 
-        for file_path in json_files:
-            full_path = self.root_dir / file_path
-            if not full_path.exists():
-                self.log_error(f"Missing required file: {file_path}")
-                continue
+        # Independent reads: load in parallel, report serially in list order
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            results = list(ex.map(self._load_json, json_files))
 
-            try:
-                with open(full_path, 'r') as f:
-                    json.load(f)
+        for file_path, ok, err in results:
+            if ok:
                 self.log_success(f"{file_path}")
-            except json.JSONDecodeError as e:
-                self.log_error(f"Invalid JSON in {file_path}: {e}")
-            except Exception as e:
-                self.log_error(f"Error reading {file_path}: {e}")
+            else:
+                self.log_error(err)
+
+    def _load_json(self, file_path: str):
+        """Parse one JSON file, returning (path, ok, error message)"""
+        full_path = self.root_dir / file_path
+        try:
+            data = full_path.read_bytes()
+        except FileNotFoundError:
+            return file_path, False, f"Missing required file: {file_path}"
+        except Exception as e:
+            return file_path, False, f"Error reading {file_path}: {e}"
+
+        try:
+            _loads(data)
+            return file_path, True, None
+        except json.JSONDecodeError as e:
+            return file_path, False, f"Invalid JSON in {file_path}: {e}"
+        except Exception as e:
+            return file_path, False, f"Error reading {file_path}: {e}"
 
     def validate_yaml_config(self):
         """Validate YAML configuration file"""
@@ -149,19 +181,28 @@ class SafetyRailsValidator:
         v1_path = self.root_dir / "action_envelope.json"
         v2_path = self.root_dir / "tools" / "envelopes" / "action_envelope_v2.json"
 
-        if not v1_path.exists():
+        # Read directly and treat FileNotFoundError as "missing" (no separate stat)
+        try:
+            v1_raw = v1_path.read_bytes()
+        except FileNotFoundError:
             self.log_warning("Original action_envelope.json not found - skipping compatibility test")
             return
+        except OSError as e:
+            self.log_error(f"Compatibility test failed: {e}")
+            return
 
-        if not v2_path.exists():
+        try:
+            v2_raw = v2_path.read_bytes()
+        except FileNotFoundError:
             self.log_error("action_envelope_v2.json not found")
             return
+        except OSError as e:
+            self.log_error(f"Compatibility test failed: {e}")
+            return
 
         try:
-            with open(v1_path, 'r') as f:
-                v1_data = json.load(f)
-            with open(v2_path, 'r') as f:
-                v2_data = json.load(f)
+            v1_data = _loads(v1_raw)
+            v2_data = _loads(v2_raw)
 
             # Check for shared keys (backwards compatibility)
             v1_keys = set(v1_data.keys())
@@ -169,7 +210,7 @@ class SafetyRailsValidator:
             shared_keys = v1_keys & v2_keys
             compatibility_ratio = len(shared_keys) / len(v1_keys) if v1_keys else 0
 
-            print(f"Envelope v2 backwards compatible: {len(shared_keys)}/{len(v1_keys)} keys match ({compatibility_ratio:.1%})")
+            self._out(f"Envelope v2 backwards compatible: {len(shared_keys)}/{len(v1_keys)} keys match ({compatibility_ratio:.1%})")
 
             if compatibility_ratio >= 0.8:
                 self.log_success("Backwards compatibility maintained")
@@ -210,6 +251,7 @@ class SafetyRailsValidator:
 
     def generate_report(self):
         """Generate final validation report"""
+        self.flush()
         print("\n🎯 Validation Report")
         print("=" * 20)
 
@@ -237,18 +279,24 @@ class SafetyRailsValidator:
 
         # Phase 1: File structure validation
         self.validate_json_files()
+        self.flush()
 
         # Phase 2: Configuration validation
         config = self.validate_yaml_config()
+        self.flush()
         if config:
             self.validate_safety_gates(config)
+            self.flush()
             self.validate_feature_flags(config)
+            self.flush()
 
         # Phase 3: Compatibility validation
         self.validate_envelope_compatibility()
+        self.flush()
 
         # Phase 4: Workflow validation
         self.validate_git_workflow()
+        self.flush()
 
         # Phase 5: Final report
         return self.generate_report()
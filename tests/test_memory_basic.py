@@ -1,9 +1,12 @@
-import os, subprocess, json
+import os, subprocess, json, mmap, re, tempfile
 
 def test_flag_blocks_by_default():
     """Test that memory operations are blocked when RAG is disabled by default"""
-    out = subprocess.run(["arx","memory","stats"], capture_output=True, text=True).stdout +\
-          subprocess.run(["arx","memory","query","--persona","CODER_AI","--query","x","--k","1"], capture_output=True, text=True).stdout
+    # Independent commands: start both so interpreter startup overlaps
+    p1 = subprocess.Popen(["arx","memory","stats"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    p2 = subprocess.Popen(["arx","memory","query","--persona","CODER_AI","--query","x","--k","1"],
+                          stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    out = p1.communicate()[0] + p2.communicate()[0]
     assert "disabled" in out or "Set AR_ENABLE_RAG" in out
 
 def test_unique_ids_on_reindex(monkeypatch):
@@ -18,12 +21,16 @@ def test_persona_isolation():
     """Test that personas cannot access unauthorized namespaces"""
     env = dict(os.environ, AR_ENABLE_RAG="1")
     # CODER_AI should not be able to access docs namespace
-    result = subprocess.run(["arx","memory","query","--persona","CODER_AI","--query","README","--k","3"],
-                          capture_output=True, text=True, env=env)
-    # Should not find docs content (though may show some coder content)
-    output = result.stdout.lower()
-    # If docs content appears, it would indicate a security breach
-    assert "docs" not in output or "no results" in output
+    # Stream output to a temp file and search it via mmap instead of buffering it in Python
+    with tempfile.TemporaryFile() as tf:
+        subprocess.run(["arx","memory","query","--persona","CODER_AI","--query","README","--k","3"],
+                       stdout=tf, stderr=subprocess.DEVNULL, env=env, check=False)
+        if os.fstat(tf.fileno()).st_size == 0:
+            return
+        with mmap.mmap(tf.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Should not find docs content (though may show some coder content)
+            # If docs content appears, it would indicate a security breach
+            assert not re.search(rb"(?i)docs", mm) or re.search(rb"(?i)no results", mm)
 
 def test_model_id_validation():
     """Test that model ID format is valid"""
@@ -10,6 +10,12 @@ import tempfile
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import orjson
+    _dumps = lambda obj: orjson.dumps(obj).decode()
+except ImportError:
+    _dumps = json.dumps
+
 # Add tools directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
 
@@ -84,9 +90,9 @@ class TestTaskDecomposer:
             title="Test Task",
             description="Test",
             steps=[
-                TaskStep("step1", "Step 1", dependencies=["step3"]),  # Points to later step
-                TaskStep("step2", "Step 2", dependencies=["step1"]),
-                TaskStep("step3", "Step 3", dependencies=["step2"]),  # Creates cycle
+                TaskStep("step1", "Step 1", dependencies=["Step 3"]),  # Points to later step
+                TaskStep("step2", "Step 2", dependencies=["Step 1"]),
+                TaskStep("step3", "Step 3", dependencies=["Step 2"]),  # Creates cycle
             ]
         )
 
@@ -182,24 +188,9 @@ class TestIntegration:
         is_valid, issues = decomposer.validate_task_graph(task)
         assert is_valid, f"Decomposition validation failed: {issues}"
 
-        # Convert to scheduler format
-        tasks_data = [{
-            "id": task.id,
-            "steps": [
-                {
-                    "id": step.id,
-                    "description": step.description,
-                    "priority": step.priority,
-                    "estimated_time": step.estimated_time,
-                    "dependencies": step.dependencies
-                }
-                for step in task.steps
-            ]
-        }]
-
         # Schedule tasks
         scheduler = PriorityScheduler()
-        scheduled = scheduler.schedule_tasks(tasks_data)
+        scheduled = scheduler.schedule_tasks([task])
 
         # Verify scheduling
         assert len(scheduled) == len(task.steps)
@@ -214,7 +205,7 @@ class TestIntegration:
 
         # Create a temporary workflow file
         with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump({"tasks": []}, f)
+            f.write(_dumps({"tasks": []}))
             temp_file = f.name
 
         try:
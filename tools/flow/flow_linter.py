@@ -13,15 +13,298 @@ Features:
 
 import yaml
 import json
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+import os
 import sys
+import time
 from pathlib import Path
-from typing import Dict, List, Any, Tuple, Optional
-from dataclasses import dataclass
-import networkx as nx  # For DAG validation
+from typing import Dict, FrozenSet, List, Any, Optional
+from dataclasses import dataclass, replace
+from yaml.composer import Composer, ComposerError
+from yaml.nodes import MappingNode, ScalarNode, SequenceNode
 import re
 
-
-@dataclass
+# libyaml-backed loader when PyYAML was built with it; pure-Python otherwise
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+# orjson for the on-disk caches when installed; both paths work on bytes
+try:
+    import orjson
+    _dumpb = orjson.dumps
+    _loadb = orjson.loads
+except ImportError:
+    _dumpb = lambda obj: json.dumps(obj).encode()
+    _loadb = json.loads
+
+# Numba-compiled cycle check for large flows (pip install numba); optional
+try:
+    import numba
+    import numpy as np
+except ImportError:
+    numba = None
+
+LINTER_VERSION = "2.3"
+# Digest of this module's source: cached results are keyed on it, so any edit
+# to a rule invalidates them without relying on a LINTER_VERSION bump
+_SOURCE_DIGEST = hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16).hexdigest()
+# Slotted dataclasses (no per-instance __dict__) where supported (3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+# Below this many uncached flows, validating in-process beats pool startup
+PARALLEL_MIN_FLOWS = 4
+# On-disk result cache, opt-in: set AR_FLOW_LINT_CACHE to a directory (e.g. .cache/flow_linter)
+FLOW_LINT_CACHE_DIR = os.getenv("AR_FLOW_LINT_CACHE") or None
+# Cached results not rewritten for this long are deleted (swept at most once a day)
+FLOW_LINT_CACHE_MAX_AGE = 30 * 24 * 3600
+_PRUNE_STAMP = ".last_prune"
+# Per-flow DAG results from the previous run, kept beside the result cache
+DAG_STATE_FILE = "dag_state.json"
+# Below this many graph nodes, CSR conversion + JIT dispatch cost more than they save
+JIT_MIN_NODES = 200
+# Past this many added edges, one full DFS is cheaper than per-edge reachability
+_INCREMENTAL_EDGE_LIMIT = 4
+
+
+
+class _StreamingLoader(_SafeLoader):
+    """Safe loader that composes one node at a time (works over the C parser too)"""
+    compose_node = Composer.compose_node
+    compose_scalar_node = Composer.compose_scalar_node
+    compose_sequence_node = Composer.compose_sequence_node
+    compose_mapping_node = Composer.compose_mapping_node
+
+    def __init__(self, stream):
+        super().__init__(stream)
+        self.anchors = {}
+
+_VERSION_RE = re.compile(r'^\d+\.\d+$')
+_FLOW_ID_RE = re.compile(r'^flow_[a-z_][a-z0-9_]*$')
+_NODE_ID_RE = re.compile(r'^[a-z_][a-z0-9_]*$')
+# All of a flow's node IDs, newline-joined, in one fullmatch
+_NODE_IDS_RE = re.compile(r'[a-z_][a-z0-9_]*(?:\n[a-z_][a-z0-9_]*)*')
+
+_WHITE, _GRAY, _BLACK = 0, 1, 2
+
+# Sentinel for single-lookup optional fields (dict.get(key, _MISSING))
+_MISSING = object()
+
+# Names accepted in a flow's guards list (params live in FlowLinter.built_in_guards)
+_BUILTIN_GUARD_NAMES: FrozenSet[str] = frozenset({
+    "branch_not_main",
+    "dry_run_unless_allowed",
+    "artifacts_present",
+    "git_clean",
+    "ci_environment",
+    "test_framework_available",
+})
+
+# field -> (min, max or None, error code, message template)
+_INT_RANGES = {
+    "timeout": (1, 3600, "INVALID_TIMEOUT", "Timeout {value} must be integer between 1-3600 seconds"),
+    "retries": (0, 10, "INVALID_RETRIES", "Retries {value} must be integer between 0-10"),
+    "max_execution_time": (1, None, "INVALID_MAX_EXECUTION_TIME",
+                           "max_execution_time must be positive integer in flow '{flow_id}'"),
+    "max_iterations": (1, None, "INVALID_MAX_ITERATIONS",
+                       "max_iterations must be positive integer in flow '{flow_id}'"),
+}
+
+
+def _find_cycle(adj: Dict[str, List[str]]) -> Optional[List[str]]:
+    """Return one cycle as a node list, or None if acyclic (iterative 3-color DFS)"""
+    color = dict.fromkeys(adj, _WHITE)
+    for start in adj:
+        if color[start] != _WHITE:
+            continue
+        color[start] = _GRAY
+        path = [start]
+        stack = [iter(adj[start])]
+        while stack:
+            for nxt in stack[-1]:
+                state = color[nxt]
+                if state == _GRAY:
+                    # Back edge: the cycle is the path suffix starting at nxt
+                    return path[path.index(nxt):]
+                if state == _WHITE:
+                    color[nxt] = _GRAY
+                    path.append(nxt)
+                    stack.append(iter(adj[nxt]))
+                    break
+            else:
+                color[path.pop()] = _BLACK
+                stack.pop()
+    return None
+
+
+def _csr_cycle_node(indptr, indices) -> int:
+    """Index of a node on some cycle in a CSR graph, or -1 (3-color DFS, JIT-able)"""
+    n = indptr.shape[0] - 1
+    color = np.zeros(n, np.int8)
+    stack = np.empty(n, np.int64)
+    pos = np.empty(n, np.int64)
+    for start in range(n):
+        if color[start] != _WHITE:
+            continue
+        color[start] = _GRAY
+        top = 0
+        stack[0] = start
+        pos[0] = indptr[start]
+        while top >= 0:
+            v = stack[top]
+            p = pos[top]
+            if p < indptr[v + 1]:
+                pos[top] = p + 1
+                w = indices[p]
+                if color[w] == _GRAY:
+                    return w
+                if color[w] == _WHITE:
+                    color[w] = _GRAY
+                    top += 1
+                    stack[top] = w
+                    pos[top] = indptr[w]
+            else:
+                color[v] = _BLACK
+                top -= 1
+    return -1
+
+
+if numba is not None:
+    _csr_cycle_node_jit = numba.njit(cache=True)(_csr_cycle_node)
+else:
+    _csr_cycle_node_jit = None
+
+
+def _find_cycle_large(adj: Dict[str, List[str]]) -> Optional[List[str]]:
+    """_find_cycle, with a compiled acyclicity pre-check on large graphs"""
+    if _csr_cycle_node_jit is None or len(adj) < JIT_MIN_NODES:
+        return _find_cycle(adj)
+    index = {node: i for i, node in enumerate(adj)}
+    indptr = np.zeros(len(adj) + 1, np.int64)
+    np.cumsum([len(dsts) for dsts in adj.values()], out=indptr[1:])
+    indices = np.fromiter((index[dst] for dsts in adj.values() for dst in dsts),
+                          np.int64, count=int(indptr[-1]))
+    if _csr_cycle_node_jit(indptr, indices) < 0:
+        return None
+    # Cyclic flows are the error path: report the same cycle the Python DFS finds
+    return _find_cycle(adj)
+
+
+def _reaches(adj: Dict[str, List[str]], src: str, dst: str) -> bool:
+    """True if dst is reachable from src (iterative DFS over src's descendants)"""
+    if src == dst:
+        return True
+    seen = {src}
+    stack = [src]
+    while stack:
+        for nxt in adj[stack.pop()]:
+            if nxt == dst:
+                return True
+            if nxt not in seen:
+                seen.add(nxt)
+                stack.append(nxt)
+    return False
+
+
+def _flow_lines(key_node, value_node) -> Dict[str, int]:
+    """Map flow-relative paths (id, nodes.<id>, edges[i], ...) to 1-based line numbers"""
+    lines = {"": key_node.start_mark.line + 1}
+    if isinstance(value_node, MappingNode):
+        for k, v in value_node.value:
+            if not isinstance(k, ScalarNode):
+                continue
+            lines[k.value] = k.start_mark.line + 1
+            if k.value == "nodes" and isinstance(v, MappingNode):
+                for node_key, _ in v.value:
+                    if isinstance(node_key, ScalarNode):
+                        lines[f"nodes.{node_key.value}"] = node_key.start_mark.line + 1
+            elif k.value == "edges" and isinstance(v, SequenceNode):
+                for i, item in enumerate(v.value):
+                    lines[f"edges[{i}]"] = item.start_mark.line + 1
+    return lines
+
+
+def _iter_registry(stream):
+    """Stream a registry document, building one flow subtree at a time
+
+    Yields ("field", key, value, line) for top-level entries, ("flow", flow_id,
+    flow_def, lines) for each flow, or ("root", value, None, None) when the
+    document is not a mapping. The flows mapping itself is yielded as {}.
+    """
+    loader = _StreamingLoader(stream)
+    try:
+        loader.get_event()  # StreamStart
+        if loader.check_event(yaml.StreamEndEvent):
+            yield "root", None, None, None
+            return
+        loader.get_event()  # DocumentStart
+
+        if not loader.check_event(yaml.MappingStartEvent):
+            yield "root", loader.construct_document(loader.compose_node(None, None)), None, None
+        else:
+            loader.get_event()
+            while not loader.check_event(yaml.MappingEndEvent):
+                key_node = loader.compose_node(None, None)
+                key = loader.construct_document(key_node)
+                line = key_node.start_mark.line + 1
+                if key == "flows" and loader.check_event(yaml.MappingStartEvent):
+                    loader.get_event()
+                    yield "field", key, {}, line
+                    while not loader.check_event(yaml.MappingEndEvent):
+                        flow_key = loader.compose_node(None, None)
+                        flow_node = loader.compose_node(None, None)
+                        yield ("flow", loader.construct_document(flow_key),
+                               loader.construct_document(flow_node), _flow_lines(flow_key, flow_node))
+                    loader.get_event()
+                else:
+                    yield "field", key, loader.construct_document(loader.compose_node(None, None)), line
+            loader.get_event()  # MappingEnd
+
+        loader.get_event()  # DocumentEnd
+        if not loader.check_event(yaml.StreamEndEvent):
+            event = loader.get_event()
+            raise ComposerError("expected a single document in the stream", None,
+                                "but found another document", event.start_mark)
+    finally:
+        loader.dispose()
+
+
+def _validate_flow_worker(flow_id: str, flow_def: Dict, registry_path: str,
+                          dag_entry: Optional[Dict]) -> tuple:
+    """Process-pool entry point: run the uncached checks for one flow.
+
+    Takes the parent's DAG state slot for this flow and returns it updated, so
+    the parent can persist it alongside its own.
+    """
+    linter = FlowLinter(cache_dir=None)
+    slot = _dag_slot(registry_path, flow_id)
+    linter._dag_state = {slot: dag_entry} if dag_entry is not None else {}
+    result = linter._validate_single_flow(flow_id, flow_def, registry_path)
+    return result, linter._dag_state.get(slot)
+
+
+def _dag_slot(file_path: str, flow_id: str) -> str:
+    """DAG state key for a flow, independent of the working directory"""
+    return f"{os.path.abspath(file_path)}::{flow_id}"
+
+
+def _with_lines(result: "ValidationResult", lines: Dict[str, int]) -> "ValidationResult":
+    """Copy of result with line numbers filled in from each error's context path"""
+    default = lines.get("")
+
+    def place(items):
+        placed = items.copy()
+        line_numbers = placed.line_numbers
+        for i, (line, context) in enumerate(zip(line_numbers, placed.contexts)):
+            if line is None:
+                line_numbers[i] = lines.get(context, default)
+        return placed
+
+    return replace(result, errors=place(result.errors), warnings=place(result.warnings), info=place(result.info))
+
+
+@dataclass(**_SLOTS)
 class ValidationError:
     """Structured validation error"""
     level: str  # "ERROR", "WARNING", "INFO"
@@ -32,22 +315,112 @@ class ValidationError:
     context: Optional[str] = None
 
 
-@dataclass
+class ValidationErrors:
+    """Validation errors stored column-wise (one list per field, no per-error objects)"""
+    _COLUMNS = ("levels", "codes", "messages", "file_paths", "line_numbers", "contexts")
+    # Few distinct values each; interned so decoded copies share one string
+    _INTERNED = ("levels", "codes", "file_paths")
+    __slots__ = _COLUMNS
+
+    def __init__(self):
+        self.levels: List[str] = []
+        self.codes: List[str] = []
+        self.messages: List[str] = []
+        self.file_paths: List[str] = []
+        self.line_numbers: List[Optional[int]] = []
+        self.contexts: List[Optional[str]] = []
+
+    @classmethod
+    def single(cls, level: str, code: str, message: str, file_path: str,
+               line_number: Optional[int] = None, context: Optional[str] = None) -> "ValidationErrors":
+        """Collection holding exactly one error"""
+        errors = cls()
+        errors.append(level, code, message, file_path, line_number, context)
+        return errors
+
+    @classmethod
+    def from_columns(cls, data: Dict[str, List]) -> "ValidationErrors":
+        """Rebuild from to_columns() output (or its JSON / pickle round trip)"""
+        errors = cls()
+        for name in cls._COLUMNS:
+            if name in cls._INTERNED:
+                setattr(errors, name, list(map(sys.intern, data[name])))
+            else:
+                setattr(errors, name, list(data[name]))
+        return errors
+
+    def to_columns(self) -> Dict[str, List]:
+        """Plain dict of column lists (JSON-serializable)"""
+        return {name: list(getattr(self, name)) for name in self._COLUMNS}
+
+    def copy(self) -> "ValidationErrors":
+        """Shallow copy with independent column lists"""
+        return self.from_columns(self.to_columns())
+
+    def append(self, level: str, code: str, message: str, file_path: str,
+               line_number: Optional[int] = None, context: Optional[str] = None) -> None:
+        """Add one error (same fields as ValidationError)"""
+        self.levels.append(level)
+        self.codes.append(code)
+        self.messages.append(message)
+        self.file_paths.append(file_path)
+        self.line_numbers.append(line_number)
+        self.contexts.append(context)
+
+    def extend(self, other) -> None:
+        """Append another ValidationErrors (column-wise) or an iterable of ValidationError"""
+        if isinstance(other, ValidationErrors):
+            for name in self._COLUMNS:
+                getattr(self, name).extend(getattr(other, name))
+        else:
+            for e in other:
+                self.append(e.level, e.code, e.message, e.file_path, e.line_number, e.context)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, i: int) -> ValidationError:
+        return ValidationError(self.levels[i], self.codes[i], self.messages[i],
+                               self.file_paths[i], self.line_numbers[i], self.contexts[i])
+
+    def __iter__(self):
+        # Row views for callers that expect ValidationError objects
+        return map(ValidationError, self.levels, self.codes, self.messages,
+                   self.file_paths, self.line_numbers, self.contexts)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ValidationErrors):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self._COLUMNS)
+
+    def __repr__(self) -> str:
+        return f"ValidationErrors({list(self)!r})"
+
+
+@dataclass(**_SLOTS)
 class ValidationResult:
     """Complete validation result"""
     flow_id: str
     is_valid: bool
-    errors: List[ValidationError]
-    warnings: List[ValidationError]
-    info: List[ValidationError]
+    errors: "ValidationErrors"
+    warnings: "ValidationErrors"
+    info: "ValidationErrors"
 
 
 class FlowLinter:
     """Comprehensive flow definition validator"""
 
-    def __init__(self):
+    def __init__(self, cache_dir: Optional[str] = FLOW_LINT_CACHE_DIR):
         self.schema_cache = {}
         self.built_in_guards = self._load_built_in_guards()
+        self.result_cache: Dict[str, ValidationResult] = {}
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        # Cached results are only valid for this linter source and guard set
+        self._fingerprint = (
+            LINTER_VERSION + _SOURCE_DIGEST + json.dumps(self.built_in_guards, sort_keys=True)
+        ).encode()
+        self._dag_state: Optional[Dict[str, Dict]] = None
+        self._dag_dirty = False
 
     def _load_built_in_guards(self) -> Dict[str, Dict]:
         """Load built-in guard definitions"""
@@ -80,78 +453,140 @@ class FlowLinter:
 
     def validate_flow_registry(self, registry_path: str) -> Dict[str, ValidationResult]:
         """Validate complete flow registry"""
+        # Shared by every error, and by results decoded from cache or workers
+        registry_path = sys.intern(os.fspath(registry_path))
+        registry = {}
+        root_lines = {}
+        jobs = []  # per flow: [flow_id, lines, result, flow_def, cache_key, future]
+        misses = 0
+        pool = None
         try:
-            with open(registry_path, 'r') as f:
-                registry = yaml.safe_load(f)
-        except (FileNotFoundError, yaml.YAMLError) as e:
-            return {
-                "registry": ValidationResult(
-                    flow_id="registry",
-                    is_valid=False,
-                    errors=[ValidationError(
-                        level="ERROR",
-                        code="REGISTRY_LOAD_FAILED",
-                        message=f"Failed to load registry: {e}",
-                        file_path=registry_path
-                    )],
-                    warnings=[],
-                    info=[]
-                )
-            }
-
-        results = {}
-
-        # Validate registry structure
-        registry_result = self._validate_registry_structure(registry, registry_path)
-        results["registry"] = registry_result
-
-        if not registry_result.is_valid:
-            return results  # Stop if registry is invalid
-
-        # Validate individual flows
-        if "flows" in registry:
-            for flow_id, flow_def in registry["flows"].items():
-                result = self.validate_single_flow(flow_id, flow_def, registry_path)
-                results[flow_id] = result
-
-        return results
+            try:
+                with open(registry_path, 'r') as f:
+                    for kind, key, value, where in _iter_registry(f):
+                        if kind == "root":
+                            registry = key
+                        elif kind == "field":
+                            registry[key] = value
+                            root_lines[key] = where
+                        else:
+                            cache_key = self._cache_key(key, value, registry_path)
+                            cached = self._lookup_result(cache_key) if cache_key else None
+                            job = [key, where, cached, None, cache_key, None]
+                            jobs.append(job)
+                            if cached is not None:
+                                continue
+                            job[3] = value
+                            misses += 1
+
+                            # Enough uncached flows to amortize worker startup: hand
+                            # queued and later flows to a process pool as they stream in
+                            if pool is None and misses >= PARALLEL_MIN_FLOWS:
+                                pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+                            if pool is not None:
+                                for queued in jobs:
+                                    if queued[3] is not None:
+                                        queued[5] = pool.submit(
+                                            _validate_flow_worker, queued[0], queued[3], registry_path,
+                                            self._dag_entry(queued[0], registry_path)
+                                        )
+                                        queued[3] = None
+            except (FileNotFoundError, yaml.YAMLError) as e:
+                return {
+                    "registry": ValidationResult(
+                        flow_id="registry",
+                        is_valid=False,
+                        errors=ValidationErrors.single(
+                            level="ERROR",
+                            code="REGISTRY_LOAD_FAILED",
+                            message=f"Failed to load registry: {e}",
+                            file_path=registry_path
+                        ),
+                        warnings=ValidationErrors(),
+                        info=ValidationErrors()
+                    )
+                }
+
+            results = {}
+
+            # Validate registry structure
+            registry_result = _with_lines(self._validate_registry_structure(registry, registry_path), root_lines)
+            results["registry"] = registry_result
+
+            # Stop if registry is invalid or has no flows mapping to iterate
+            if not registry_result.is_valid or not isinstance(registry.get("flows"), dict):
+                return results
+
+            # Collect individual flow results (few misses are validated in-process)
+            for flow_id, lines, result, flow_def, cache_key, future in jobs:
+                if result is None:
+                    if future is not None:
+                        result, dag_entry = future.result()
+                        self._merge_dag_entry(flow_id, registry_path, dag_entry)
+                    else:
+                        result = self._validate_single_flow(flow_id, flow_def, registry_path)
+                    if cache_key:
+                        self._remember_result(cache_key, result)
+                results[flow_id] = _with_lines(result, lines)
+
+            self._save_dag_state(registry_path, {_dag_slot(registry_path, job[0]) for job in jobs})
+            self._prune_cache()
+            return results
+        finally:
+            if pool is not None:
+                for job in jobs:
+                    if job[5] is not None:
+                        job[5].cancel()
+                pool.shutdown()
 
     def _validate_registry_structure(self, registry: Dict, file_path: str) -> ValidationResult:
         """Validate registry-level structure"""
-        errors = []
-        warnings = []
-        info = []
+        errors = ValidationErrors()
+        warnings = ValidationErrors()
+        info = ValidationErrors()
+
+        # Nothing else can be checked (or iterated) unless the document is a mapping
+        if not isinstance(registry, dict):
+            errors.append(
+                level="ERROR",
+                code="INVALID_REGISTRY_STRUCTURE",
+                message=f"registry must be a dictionary, got {type(registry).__name__}",
+                file_path=file_path
+            )
+            return ValidationResult(flow_id="registry", is_valid=False, errors=errors, warnings=warnings, info=info)
 
         # Check required fields
         required_fields = ["version", "flows"]
         for field in required_fields:
             if field not in registry:
-                errors.append(ValidationError(
+                errors.append(
                     level="ERROR",
                     code="MISSING_REGISTRY_FIELD",
                     message=f"Required field '{field}' missing from registry",
                     file_path=file_path
-                ))
+                )
 
         # Validate version format
         if "version" in registry:
-            if not re.match(r'^\d+\.\d+$', str(registry["version"])):
-                warnings.append(ValidationError(
+            if not _VERSION_RE.match(str(registry["version"])):
+                warnings.append(
                     level="WARNING",
                     code="INVALID_VERSION_FORMAT",
                     message=f"Version '{registry['version']}' should follow semantic versioning",
-                    file_path=file_path
-                ))
+                    file_path=file_path,
+                    context="version"
+                )
 
         # Validate flows structure
         if "flows" in registry:
             if not isinstance(registry["flows"], dict):
-                errors.append(ValidationError(
+                errors.append(
                     level="ERROR",
                     code="INVALID_FLOWS_STRUCTURE",
                     message="flows must be a dictionary",
-                    file_path=file_path
-                ))
+                    file_path=file_path,
+                    context="flows"
+                )
 
         return ValidationResult(
             flow_id="registry",
@@ -163,59 +598,155 @@ class FlowLinter:
 
     def validate_single_flow(self, flow_id: str, flow_def: Dict,
                            registry_path: str) -> ValidationResult:
-        """Validate a single flow definition"""
-        errors = []
-        warnings = []
-        info = []
+        """Validate a single flow definition (memoized by content hash)"""
+        key = self._cache_key(flow_id, flow_def, registry_path)
+        if key is None:
+            return self._validate_single_flow(flow_id, flow_def, registry_path)
+
+        result = self._lookup_result(key)
+        if result is None:
+            result = self._validate_single_flow(flow_id, flow_def, registry_path)
+            self._remember_result(key, result)
+        return result
+
+    def _cache_key(self, flow_id: str, flow_def: Dict, registry_path: str) -> Optional[str]:
+        """Content hash for a flow, or None if it cannot be serialized (e.g. mixed key types)"""
+        try:
+            return hashlib.blake2b(
+                json.dumps([flow_id, registry_path, flow_def], sort_keys=True, default=str).encode()
+                + self._fingerprint,
+                digest_size=16
+            ).hexdigest()
+        except (TypeError, ValueError):
+            return None
+
+    def _lookup_result(self, key: str) -> Optional[ValidationResult]:
+        """Memoized result from memory, then disk"""
+        result = self.result_cache.get(key)
+        if result is None:
+            result = self._load_cached_result(key)
+            if result is not None:
+                self.result_cache[key] = result
+        return result
+
+    def _remember_result(self, key: str, result: ValidationResult) -> None:
+        """Memoize a fresh result in memory and on disk"""
+        self.result_cache[key] = result
+        self._store_cached_result(key, result)
+
+    def _load_cached_result(self, key: str) -> Optional[ValidationResult]:
+        """Load a cached result (entries are only ever replaced whole, see _store_cached_result)"""
+        if self.cache_dir is None:
+            return None
+        try:
+            data = _loadb((self.cache_dir / f"{key}.json").read_bytes())
+            return ValidationResult(
+                flow_id=data["flow_id"],
+                is_valid=data["is_valid"],
+                errors=ValidationErrors.from_columns(data["errors"]),
+                warnings=ValidationErrors.from_columns(data["warnings"]),
+                info=ValidationErrors.from_columns(data["info"])
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _store_cached_result(self, key: str, result: ValidationResult) -> None:
+        """Persist a result atomically via rename (best effort)"""
+        if self.cache_dir is None:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_dir / f"{key}.json.tmp"
+            tmp_path.write_bytes(_dumpb({
+                "flow_id": result.flow_id,
+                "is_valid": result.is_valid,
+                "errors": result.errors.to_columns(),
+                "warnings": result.warnings.to_columns(),
+                "info": result.info.to_columns()
+            }))
+            os.replace(tmp_path, self.cache_dir / f"{key}.json")
+        except (OSError, TypeError, ValueError):
+            pass
+
+    def _prune_cache(self) -> None:
+        """Delete result entries older than FLOW_LINT_CACHE_MAX_AGE (best effort, daily)"""
+        if self.cache_dir is None:
+            return
+        stamp = self.cache_dir / _PRUNE_STAMP
+        now = time.time()
+        try:
+            if now - stamp.stat().st_mtime < 24 * 3600:
+                return
+        except OSError:
+            pass
+        try:
+            cutoff = now - FLOW_LINT_CACHE_MAX_AGE
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    name = entry.name
+                    if name == DAG_STATE_FILE or name == _PRUNE_STAMP:
+                        continue
+                    # Leftover markers/temp files from older cache layouts go too
+                    if name.endswith((".complete", ".tmp")) or (
+                        name.endswith(".json") and entry.stat().st_mtime < cutoff
+                    ):
+                        try:
+                            os.unlink(entry.path)
+                        except OSError:
+                            pass
+            stamp.touch()
+        except OSError:
+            pass
+
+    def _validate_single_flow(self, flow_id: str, flow_def: Dict,
+                              registry_path: str) -> ValidationResult:
+        """Run all checks for a single flow definition"""
+        errors = ValidationErrors()
+        warnings = ValidationErrors()
+        info = ValidationErrors()
 
         # Basic structure validation
         required_fields = ["id", "name", "nodes", "edges"]
         for field in required_fields:
             if field not in flow_def:
-                errors.append(ValidationError(
+                errors.append(
                     level="ERROR",
                     code="MISSING_FLOW_FIELD",
                     message=f"Required field '{field}' missing from flow '{flow_id}'",
                     file_path=registry_path
-                ))
+                )
 
         # Validate flow ID format
         if "id" in flow_def:
-            if not re.match(r'^flow_[a-z_][a-z0-9_]*$', flow_def["id"]):
-                errors.append(ValidationError(
+            if not _FLOW_ID_RE.match(flow_def["id"]):
+                errors.append(
                     level="ERROR",
                     code="INVALID_FLOW_ID_FORMAT",
                     message=f"Flow ID '{flow_def['id']}' must match pattern 'flow_[a-z_][a-z0-9_]*'",
-                    file_path=registry_path
-                ))
+                    file_path=registry_path,
+                    context="id"
+                )
 
         # Validate nodes
         if "nodes" in flow_def:
-            node_errors, node_warnings = self._validate_nodes(flow_def["nodes"], flow_id, registry_path)
-            errors.extend(node_errors)
-            warnings.extend(node_warnings)
+            self._validate_nodes(flow_def["nodes"], flow_id, registry_path, errors, warnings)
 
         # Validate edges
         if "edges" in flow_def:
-            edge_errors, edge_warnings = self._validate_edges(flow_def["edges"], flow_def.get("nodes", {}), flow_id, registry_path)
-            errors.extend(edge_errors)
-            warnings.extend(edge_warnings)
+            self._validate_edges(flow_def["edges"], flow_def.get("nodes", {}), flow_id, registry_path, errors, warnings)
 
         # Validate guards
         if "guards" in flow_def:
-            guard_errors = self._validate_guards(flow_def["guards"], flow_id, registry_path)
-            errors.extend(guard_errors)
+            self._validate_guards(flow_def["guards"], flow_id, registry_path, errors)
 
         # Validate DAG structure
         if "nodes" in flow_def and "edges" in flow_def:
-            dag_errors = self._validate_dag_structure(flow_def["nodes"], flow_def["edges"], flow_id, registry_path)
+            dag_errors = self._validate_dag_incremental(flow_def["nodes"], flow_def["edges"], flow_id, registry_path)
             errors.extend(dag_errors)
 
         # Validate config
         if "config" in flow_def:
-            config_errors, config_warnings = self._validate_config(flow_def["config"], flow_id, registry_path)
-            errors.extend(config_errors)
-            warnings.extend(config_warnings)
+            self._validate_config(flow_def["config"], flow_id, registry_path, errors, warnings)
 
         return ValidationResult(
             flow_id=flow_id,
@@ -225,300 +756,430 @@ class FlowLinter:
             info=info
         )
 
-    def _validate_nodes(self, nodes: Dict, flow_id: str, file_path: str) -> Tuple[List[ValidationError], List[ValidationError]]:
-        """Validate node definitions"""
-        errors = []
-        warnings = []
-
+    def _validate_nodes(self, nodes: Dict, flow_id: str, file_path: str,
+                        errors: "ValidationErrors", warnings: "ValidationErrors") -> None:
+        """Validate node definitions, appending to errors/warnings"""
         if not isinstance(nodes, dict):
-            errors.append(ValidationError(
+            errors.append(
                 level="ERROR",
                 code="INVALID_NODES_TYPE",
                 message=f"nodes must be a dictionary in flow '{flow_id}'",
-                file_path=file_path
-            ))
-            return errors, warnings
+                file_path=file_path,
+                context="nodes"
+            )
+            return
+
+        # One C-level scan clears every ID in the common case; only a failing
+        # scan (or non-string keys) falls back to matching IDs one by one.
+        # The newline count rules out IDs that themselves contain newlines.
+        try:
+            joined = "\n".join(nodes)
+            ids_ok = (joined.count("\n") == len(nodes) - 1
+                      and _NODE_IDS_RE.fullmatch(joined) is not None)
+        except TypeError:
+            ids_ok = False
 
         for node_id, node_def in nodes.items():
             # Validate node ID format
-            if not re.match(r'^[a-z_][a-z0-9_]*$', node_id):
-                errors.append(ValidationError(
+            if not ids_ok and not _NODE_ID_RE.match(node_id):
+                errors.append(
                     level="ERROR",
                     code="INVALID_NODE_ID_FORMAT",
                     message=f"Node ID '{node_id}' must match pattern '[a-z_][a-z0-9_]*'",
-                    file_path=file_path
-                ))
+                    file_path=file_path,
+                    context=f"nodes.{node_id}"
+                )
 
             # Validate required fields
             required_fields = ["type", "name", "command"]
             for field in required_fields:
                 if field not in node_def:
-                    errors.append(ValidationError(
+                    errors.append(
                         level="ERROR",
                         code="MISSING_NODE_FIELD",
                         message=f"Required field '{field}' missing from node '{node_id}' in flow '{flow_id}'",
-                        file_path=file_path
-                    ))
+                        file_path=file_path,
+                        context=f"nodes.{node_id}"
+                    )
+
+            # Optional fields below need a mapping; anything else was reported above
+            if not isinstance(node_def, dict):
+                continue
 
             # Validate node type
-            if "type" in node_def:
+            node_type = node_def.get("type", _MISSING)
+            if node_type is not _MISSING:
                 valid_types = ["command", "condition", "gateway"]
-                if node_def["type"] not in valid_types:
-                    errors.append(ValidationError(
+                if node_type not in valid_types:
+                    errors.append(
                         level="ERROR",
                         code="INVALID_NODE_TYPE",
-                        message=f"Node type '{node_def['type']}' not in valid types: {valid_types}",
-                        file_path=file_path
-                    ))
-
-            # Validate timeout
-            if "timeout" in node_def:
-                timeout = node_def["timeout"]
-                if not isinstance(timeout, int) or timeout < 1 or timeout > 3600:
-                    errors.append(ValidationError(
-                        level="ERROR",
-                        code="INVALID_TIMEOUT",
-                        message=f"Timeout {timeout} must be integer between 1-3600 seconds",
-                        file_path=file_path
-                    ))
-
-            # Validate retries
-            if "retries" in node_def:
-                retries = node_def["retries"]
-                if not isinstance(retries, int) or retries < 0 or retries > 10:
-                    errors.append(ValidationError(
-                        level="ERROR",
-                        code="INVALID_RETRIES",
-                        message=f"Retries {retries} must be integer between 0-10",
-                        file_path=file_path
-                    ))
-
-        return errors, warnings
-
-    def _validate_edges(self, edges: List, nodes: Dict, flow_id: str, file_path: str) -> Tuple[List[ValidationError], List[ValidationError]]:
-        """Validate edge definitions and references"""
-        errors = []
-        warnings = []
-
+                        message=f"Node type '{node_type}' not in valid types: {valid_types}",
+                        file_path=file_path,
+                        context=f"nodes.{node_id}"
+                    )
+
+            # Validate timeout / retries
+            self._check_int_range(node_def, "timeout", errors, flow_id, file_path, f"nodes.{node_id}")
+            self._check_int_range(node_def, "retries", errors, flow_id, file_path, f"nodes.{node_id}")
+
+    def _check_int_range(self, d: Dict, key: str, errors: "ValidationErrors",
+                         flow_id: str, file_path: str, context: str) -> None:
+        """Table-driven integer bounds check for one optional field"""
+        value = d.get(key, _MISSING)
+        if value is _MISSING:
+            return
+        lo, hi, code, template = _INT_RANGES[key]
+        if type(value) is not int or value < lo or (hi is not None and value > hi):
+            errors.append(
+                level="ERROR",
+                code=code,
+                message=template.format(value=value, flow_id=flow_id),
+                file_path=file_path,
+                context=context
+            )
+
+    def _validate_edges(self, edges: List, nodes: Dict, flow_id: str, file_path: str,
+                        errors: "ValidationErrors", warnings: "ValidationErrors") -> None:
+        """Validate edge definitions and references, appending to errors/warnings"""
         if not isinstance(edges, list):
-            errors.append(ValidationError(
+            errors.append(
                 level="ERROR",
                 code="INVALID_EDGES_TYPE",
                 message=f"edges must be a list in flow '{flow_id}'",
-                file_path=file_path
-            ))
-            return errors, warnings
+                file_path=file_path,
+                context="edges"
+            )
+            return
 
         node_ids = set(nodes.keys()) if nodes else set()
 
+        # Common case first: if every edge is a mapping with known endpoints
+        # and a string (or no) condition, a few set operations prove there is
+        # nothing to report and the per-edge walk below is skipped
+        try:
+            froms = {edge["from"] for edge in edges}
+            tos = {edge["to"] for edge in edges}
+            whens = [edge["when"] for edge in edges if "when" in edge]
+            if froms <= node_ids and tos <= node_ids and all([isinstance(w, str) for w in whens]):
+                return
+        except (TypeError, KeyError):
+            pass
+
         for i, edge in enumerate(edges):
             if not isinstance(edge, dict):
-                errors.append(ValidationError(
+                errors.append(
                     level="ERROR",
                     code="INVALID_EDGE_TYPE",
                     message=f"Edge {i} must be a dictionary in flow '{flow_id}'",
-                    file_path=file_path
-                ))
+                    file_path=file_path,
+                    context=f"edges[{i}]"
+                )
                 continue
 
             # Validate required fields
             required_fields = ["from", "to"]
             for field in required_fields:
                 if field not in edge:
-                    errors.append(ValidationError(
+                    errors.append(
                         level="ERROR",
                         code="MISSING_EDGE_FIELD",
                         message=f"Required field '{field}' missing from edge {i} in flow '{flow_id}'",
-                        file_path=file_path
-                    ))
+                        file_path=file_path,
+                        context=f"edges[{i}]"
+                    )
 
             # Validate node references
-            if "from" in edge and edge["from"] not in node_ids:
-                errors.append(ValidationError(
+            src = edge.get("from", _MISSING)
+            if src is not _MISSING and src not in node_ids:
+                errors.append(
                     level="ERROR",
                     code="INVALID_EDGE_FROM",
-                    message=f"Edge {i} references unknown node '{edge['from']}' in flow '{flow_id}'",
-                    file_path=file_path
-                ))
+                    message=f"Edge {i} references unknown node '{src}' in flow '{flow_id}'",
+                    file_path=file_path,
+                    context=f"edges[{i}]"
+                )
 
-            if "to" in edge and edge["to"] not in node_ids:
-                errors.append(ValidationError(
+            dst = edge.get("to", _MISSING)
+            if dst is not _MISSING and dst not in node_ids:
+                errors.append(
                     level="ERROR",
                     code="INVALID_EDGE_TO",
-                    message=f"Edge {i} references unknown node '{edge['to']}' in flow '{flow_id}'",
-                    file_path=file_path
-                ))
+                    message=f"Edge {i} references unknown node '{dst}' in flow '{flow_id}'",
+                    file_path=file_path,
+                    context=f"edges[{i}]"
+                )
 
             # Validate 'when' condition syntax (basic)
-            if "when" in edge:
-                when_condition = edge["when"]
+            when_condition = edge.get("when", _MISSING)
+            if when_condition is not _MISSING:
                 if not isinstance(when_condition, str):
-                    errors.append(ValidationError(
+                    errors.append(
                         level="ERROR",
                         code="INVALID_WHEN_CONDITION",
                         message=f"Edge {i} 'when' condition must be a string in flow '{flow_id}'",
-                        file_path=file_path
-                    ))
-
-        return errors, warnings
-
-    def _validate_guards(self, guards: List, flow_id: str, file_path: str) -> List[ValidationError]:
-        """Validate guard definitions"""
-        errors = []
+                        file_path=file_path,
+                        context=f"edges[{i}]"
+                    )
 
+    def _validate_guards(self, guards: List, flow_id: str, file_path: str, errors: "ValidationErrors") -> None:
+        """Validate guard definitions, appending to errors"""
         if not isinstance(guards, list):
-            errors.append(ValidationError(
+            errors.append(
                 level="ERROR",
                 code="INVALID_GUARDS_TYPE",
                 message=f"guards must be a list in flow '{flow_id}'",
-                file_path=file_path
-            ))
-            return errors
+                file_path=file_path,
+                context="guards"
+            )
+            return
 
         for guard in guards:
             if not isinstance(guard, str):
-                errors.append(ValidationError(
+                errors.append(
                     level="ERROR",
                     code="INVALID_GUARD_TYPE",
                     message=f"Guard '{guard}' must be a string in flow '{flow_id}'",
-                    file_path=file_path
-                ))
+                    file_path=file_path,
+                    context="guards"
+                )
                 continue
 
             # Check if guard is built-in
-            if guard not in self.built_in_guards:
-                errors.append(ValidationError(
+            if guard not in _BUILTIN_GUARD_NAMES:
+                errors.append(
                     level="ERROR",
                     code="UNKNOWN_GUARD",
                     message=f"Unknown guard '{guard}' in flow '{flow_id}'",
-                    file_path=file_path
-                ))
+                    file_path=file_path,
+                    context="guards"
+                )
 
+    def _load_dag_state(self) -> Dict[str, Dict]:
+        """Per-flow DAG state from the last run (empty if missing or stale)"""
+        if self._dag_state is None:
+            self._dag_state = {}
+            if self.cache_dir is not None:
+                try:
+                    data = _loadb((self.cache_dir / DAG_STATE_FILE).read_bytes())
+                    if data.get("fingerprint") == self._fingerprint.decode():
+                        self._dag_state = data["flows"]
+                except (OSError, ValueError, KeyError, TypeError, AttributeError):
+                    pass
+        return self._dag_state
+
+    def _dag_entry(self, flow_id: str, file_path: str) -> Optional[Dict]:
+        """Last run's DAG state for one flow, to hand to a pool worker"""
+        if self.cache_dir is None:
+            return None
+        return self._load_dag_state().get(_dag_slot(file_path, flow_id))
+
+    def _merge_dag_entry(self, flow_id: str, file_path: str, entry: Optional[Dict]) -> None:
+        """Adopt DAG state computed by a pool worker"""
+        if self.cache_dir is None or entry is None:
+            return
+        state = self._load_dag_state()
+        slot = _dag_slot(file_path, flow_id)
+        if state.get(slot) != entry:
+            state[slot] = entry
+            self._dag_dirty = True
+
+    def _save_dag_state(self, registry_path: str, live_slots: set) -> None:
+        """Drop state for flows gone from this registry (or registries gone from disk),
+        then persist atomically if anything changed (best effort)"""
+        if self.cache_dir is None:
+            return
+        state = self._load_dag_state()
+        registry_file = os.path.abspath(registry_path)
+        stale = [
+            slot for slot, entry in state.items()
+            if not isinstance(entry, dict)
+            or (entry.get("file") == registry_file and slot not in live_slots)
+            or not os.path.exists(entry.get("file", ""))
+        ]
+        for slot in stale:
+            del state[slot]
+        if stale:
+            self._dag_dirty = True
+        if not self._dag_dirty:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_dir / f"{DAG_STATE_FILE}.tmp"
+            tmp_path.write_bytes(_dumpb({"fingerprint": self._fingerprint.decode(), "flows": self._dag_state}))
+            os.replace(tmp_path, self.cache_dir / DAG_STATE_FILE)
+            self._dag_dirty = False
+        except (OSError, TypeError, ValueError):
+            pass
+
+    def _validate_dag_incremental(self, nodes: Dict, edges: List, flow_id: str, file_path: str) -> "ValidationErrors":
+        """DAG check that reuses the last run's result while the graph shape is unchanged"""
+        try:
+            node_ids = list(nodes.keys())
+            pairs = [[edge["from"], edge["to"]] for edge in edges if "from" in edge and "to" in edge]
+            shape = hashlib.blake2b(
+                json.dumps([flow_id, file_path, node_ids, pairs]).encode(), digest_size=16
+            ).hexdigest()
+        except Exception:
+            # Malformed nodes/edges: let the full check report them
+            return self._validate_dag_structure(nodes, edges, flow_id, file_path)
+
+        slot = _dag_slot(file_path, flow_id)
+        prev = self._load_dag_state().get(slot)
+        if isinstance(prev, dict) and prev.get("shape") == shape:
+            try:
+                return ValidationErrors.from_columns(prev["errors"])
+            except (KeyError, TypeError, ValueError):
+                pass
+
+        # Same nodes, previously acyclic, only edges added: check just the new ones
+        known_edges = None
+        if isinstance(prev, dict) and prev.get("acyclic") and prev.get("nodes") == node_ids:
+            try:
+                known = {tuple(p) for p in prev["edges"]}
+                if known.issubset(map(tuple, pairs)):
+                    known_edges = known
+            except (KeyError, TypeError, ValueError):
+                pass
+
+        errors = self._validate_dag_structure(nodes, edges, flow_id, file_path, known_edges)
+        self._dag_state[slot] = {
+            "file": os.path.abspath(file_path),
+            "shape": shape,
+            "nodes": node_ids,
+            "edges": pairs,
+            "acyclic": not any(c in ("CYCLIC_DEPENDENCY", "DAG_VALIDATION_FAILED") for c in errors.codes),
+            "errors": errors.to_columns(),
+        }
+        self._dag_dirty = True
         return errors
 
-    def _validate_dag_structure(self, nodes: Dict, edges: List, flow_id: str, file_path: str) -> List[ValidationError]:
+    def _validate_dag_structure(self, nodes: Dict, edges: List, flow_id: str, file_path: str,
+                                known_edges: Optional[set] = None) -> "ValidationErrors":
         """Validate DAG structure (acyclic, connected)"""
-        errors = []
+        errors = ValidationErrors()
 
         try:
-            # Build graph
-            G = nx.DiGraph()
-
-            # Add nodes
-            for node_id in nodes.keys():
-                G.add_node(node_id)
-
-            # Add edges
+            # Build adjacency lists and in-degrees in one pass (edge endpoints
+            # missing from nodes still become graph nodes, as before)
+            adj = {node_id: [] for node_id in nodes.keys()}
+            indeg = {}
             for edge in edges:
                 if "from" in edge and "to" in edge:
-                    G.add_edge(edge["from"], edge["to"])
+                    src, dst = edge["from"], edge["to"]
+                    adj.setdefault(src, []).append(dst)
+                    adj.setdefault(dst, [])
+                    indeg[dst] = indeg.get(dst, 0) + 1
+
+            cycle = None
+            added = [] if known_edges is None else [
+                (e["from"], e["to"]) for e in edges
+                if "from" in e and "to" in e and (e["from"], e["to"]) not in known_edges
+            ]
+            if known_edges is not None and len(added) <= _INCREMENTAL_EDGE_LIMIT:
+                # known_edges were acyclic over these nodes: a new edge u->v
+                # closes a cycle only if u is already reachable from v
+                grown = {node: [] for node in adj}
+                for src, dst in known_edges:
+                    grown[src].append(dst)
+                for src, dst in added:
+                    if _reaches(grown, dst, src):
+                        cycle = _find_cycle(adj)
+                        break
+                    grown[src].append(dst)
+            else:
+                cycle = _find_cycle_large(adj)
 
-            # Check for cycles
-            if nx.is_directed_acyclic_graph(G):
+            if cycle is None:
                 # Find root nodes (no incoming edges)
-                root_nodes = [node for node in G.nodes() if G.in_degree(node) == 0]
+                root_nodes = [node for node in adj if node not in indeg]
                 if not root_nodes:
-                    errors.append(ValidationError(
+                    errors.append(
                         level="ERROR",
                         code="NO_ROOT_NODES",
                         message=f"Flow '{flow_id}' has no root nodes (nodes with no incoming edges)",
-                        file_path=file_path
-                    ))
+                        file_path=file_path,
+                        context="edges"
+                    )
             else:
-                # Find cycles
-                cycles = list(nx.simple_cycles(G))
-                errors.append(ValidationError(
+                errors.append(
                     level="ERROR",
                     code="CYCLIC_DEPENDENCY",
-                    message=f"Flow '{flow_id}' contains cycles: {cycles}",
-                    file_path=file_path
-                ))
+                    message=f"Flow '{flow_id}' contains cycles: {[cycle]}",
+                    file_path=file_path,
+                    context="edges"
+                )
 
         except Exception as e:
-            errors.append(ValidationError(
+            errors.append(
                 level="ERROR",
                 code="DAG_VALIDATION_FAILED",
                 message=f"DAG validation failed for flow '{flow_id}': {e}",
-                file_path=file_path
-            ))
+                file_path=file_path,
+                context="edges"
+            )
 
         return errors
 
-    def _validate_config(self, config: Dict, flow_id: str, file_path: str) -> Tuple[List[ValidationError], List[ValidationError]]:
-        """Validate flow configuration"""
-        errors = []
-        warnings = []
-
+    def _validate_config(self, config: Dict, flow_id: str, file_path: str,
+                         errors: "ValidationErrors", warnings: "ValidationErrors") -> None:
+        """Validate flow configuration, appending to errors/warnings"""
         if not isinstance(config, dict):
-            errors.append(ValidationError(
+            errors.append(
                 level="ERROR",
                 code="INVALID_CONFIG_TYPE",
                 message=f"config must be a dictionary in flow '{flow_id}'",
-                file_path=file_path
-            ))
-            return errors, warnings
-
-        # Validate max_execution_time
-        if "max_execution_time" in config:
-            max_time = config["max_execution_time"]
-            if not isinstance(max_time, int) or max_time < 1:
-                errors.append(ValidationError(
-                    level="ERROR",
-                    code="INVALID_MAX_EXECUTION_TIME",
-                    message=f"max_execution_time must be positive integer in flow '{flow_id}'",
-                    file_path=file_path
-                ))
+                file_path=file_path,
+                context="config"
+            )
+            return
 
-        # Validate max_iterations
-        if "max_iterations" in config:
-            max_iter = config["max_iterations"]
-            if not isinstance(max_iter, int) or max_iter < 1:
-                errors.append(ValidationError(
-                    level="ERROR",
-                    code="INVALID_MAX_ITERATIONS",
-                    message=f"max_iterations must be positive integer in flow '{flow_id}'",
-                    file_path=file_path
-                ))
+        # Validate max_execution_time / max_iterations
+        self._check_int_range(config, "max_execution_time", errors, flow_id, file_path, "config")
+        self._check_int_range(config, "max_iterations", errors, flow_id, file_path, "config")
 
-        return errors, warnings
-
-    def print_validation_report(self, results: Dict[str, ValidationResult]) -> None:
-        """Print comprehensive validation report"""
-        print("🛡️  AdvancedRules Flow Validation Report")
-        print("=" * 50)
+    def print_validation_report(self, results: Dict[str, ValidationResult]) -> bool:
+        """Print comprehensive validation report; True if there were no errors"""
+        # Build the whole report, then emit it with a single write
+        out = ["🛡️  AdvancedRules Flow Validation Report", "=" * 50]
 
         total_errors = 0
         total_warnings = 0
 
         for flow_id, result in results.items():
-            print(f"\n📋 Flow: {flow_id}")
-            print("-" * 30)
+            out.append(f"\n📋 Flow: {flow_id}")
+            out.append("-" * 30)
 
             if result.errors:
-                print(f"❌ Errors ({len(result.errors)}):")
-                for error in result.errors:
-                    print(f"   • {error.code}: {error.message}")
+                out.append(f"❌ Errors ({len(result.errors)}):")
+                errs = result.errors
+                for code, message, line in zip(errs.codes, errs.messages, errs.line_numbers):
+                    where = f" (line {line})" if line else ""
+                    out.append(f"   • {code}: {message}{where}")
                 total_errors += len(result.errors)
 
             if result.warnings:
-                print(f"⚠️  Warnings ({len(result.warnings)}):")
-                for warning in result.warnings:
-                    print(f"   • {warning.code}: {warning.message}")
+                out.append(f"⚠️  Warnings ({len(result.warnings)}):")
+                warns = result.warnings
+                for code, message, line in zip(warns.codes, warns.messages, warns.line_numbers):
+                    where = f" (line {line})" if line else ""
+                    out.append(f"   • {code}: {message}{where}")
                 total_warnings += len(result.warnings)
 
             if not result.errors and not result.warnings:
-                print("✅ Valid")
+                out.append("✅ Valid")
 
-        print("\n🎯 Summary:")
-        print(f"   Total Errors: {total_errors}")
-        print(f"   Total Warnings: {total_warnings}")
+        out.append("\n🎯 Summary:")
+        out.append(f"   Total Errors: {total_errors}")
+        out.append(f"   Total Warnings: {total_warnings}")
 
         if total_errors == 0:
-            print("\n🎉 All flows validated successfully!")
-            return True
+            out.append("\n🎉 All flows validated successfully!")
         else:
-            print(f"\n❌ {total_errors} errors found - validation failed")
-            return False
+            out.append(f"\n❌ {total_errors} errors found - validation failed")
+
+        sys.stdout.write("\n".join(out) + "\n")
+        return total_errors == 0
 
 
 def main():
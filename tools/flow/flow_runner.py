@@ -13,18 +13,44 @@ Features:
 
 import yaml
 import json
+import hashlib
+import io
 import sys
 import os
+import asyncio
+import functools
+import heapq
+import random
+import importlib.util
+import shlex
+import shutil
+import signal
 import subprocess
+import threading
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple, Callable
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-import networkx as nx
 import re
 
+# orjson for summary/envelope JSON when installed; both paths return bytes
+try:
+    import orjson
+    _dumpb = orjson.dumps
+except ImportError:
+    _dumpb = lambda obj: json.dumps(obj).encode()
+
+# libyaml-backed loader when PyYAML was built with it; pure-Python otherwise
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 # Metrics instrumentation
 try:
     from tools.instrumentation import instr
@@ -32,19 +58,115 @@ try:
 except ImportError:
     # Graceful fallback if metrics not available
     METRICS_AVAILABLE = False
+    # nullcontext is stateless and reentrant, so one instance serves every step
+    _NULL_CTX = nullcontext()
+
+    def _noop(*args, **kwargs):
+        pass
+
     class MockInstr:
+        flow_start = flow_end = retry = staticmethod(_noop)
+
         @staticmethod
-        def flow_start(*args, **kwargs): pass
-        @staticmethod
-        def flow_end(*args, **kwargs): pass
-        @staticmethod
-        def step(*args, **kwargs): 
-            from contextlib import nullcontext
-            return nullcontext()
-        @staticmethod
-        def retry(*args, **kwargs): pass
+        def step(*args, **kwargs):
+            return _NULL_CTX
     instr = MockInstr()
 
+# Nodes run at once when a flow sets parallel_execution without max_concurrency
+DEFAULT_MAX_CONCURRENCY = 4
+# Node output is streamed to <dir>/<flow_id>/<node_id>.{stdout,stderr}; only the
+# last OUTPUT_TAIL_BYTES stay in memory. AR_FLOW_LOG_DIR="" disables the files.
+FLOW_LOG_DIR = os.getenv("AR_FLOW_LOG_DIR", str(Path(__file__).resolve().parents[2] / "logs" / "flows"))
+OUTPUT_TAIL_BYTES = 64 * 1024
+
+# Files the artifacts_present guard requires (relative to the working directory)
+REQUIRED_ARTIFACTS = (
+    "memory-bank/business/client_score.json",
+    "memory-bank/business/capacity_report.md",
+    "memory-bank/plan/proposal.md"
+)
+
+# Parsed registries per resolved path: (st_mtime_ns, st_size, content digest, flows)
+_REGISTRY_CACHE: Dict[Path, Tuple[int, int, bytes, Dict[str, Dict]]] = {}
+
+
+def _missing_paths(paths) -> List[str]:
+    """Paths that do not exist, in input order; one scandir per parent directory"""
+    by_dir = {}
+    for path in paths:
+        by_dir.setdefault(os.path.dirname(path), set()).add(os.path.basename(path))
+
+    present = set()
+    for directory, names in by_dir.items():
+        try:
+            with os.scandir(directory or ".") as it:
+                for entry in it:
+                    # Symlinks count only if their target exists, as with os.path.exists
+                    if entry.name in names and (not entry.is_symlink() or os.path.exists(entry.path)):
+                        present.add(os.path.join(directory, entry.name))
+        except OSError:
+            pass  # missing or unreadable directory: everything in it is missing
+    return [path for path in paths if path not in present]
+
+
+class _GuardOutputBuffer(threading.local):
+    buffer = None
+
+
+_GUARD_OUTPUT = _GuardOutputBuffer()
+
+
+def _guard_print(*args) -> None:
+    """print() for guard functions: buffered per thread while guards run concurrently"""
+    print(*args, file=_GUARD_OUTPUT.buffer)
+
+
+def _backoff_delay(retry_delay: float, attempt: int, backoff: float, delay_max: float) -> float:
+    """Exponential backoff for the given (1-based) attempt, capped, with +/-50% jitter"""
+    return min(retry_delay * backoff ** (attempt - 1), delay_max) * random.uniform(0.5, 1.5)
+
+
+async def _tee_stream(stream: asyncio.StreamReader, path: Optional[Path], tail_bytes: int) -> bytes:
+    """Copy a subprocess stream to path (best effort) chunk by chunk; return its last tail_bytes"""
+    tail = bytearray()
+    try:
+        log = open(path, "wb") if path is not None else None
+    except OSError:
+        log = None
+    try:
+        while True:
+            chunk = await stream.read(65536)
+            if not chunk:
+                break
+            if log is not None:
+                log.write(chunk)
+            tail += chunk
+            if len(tail) > tail_bytes:
+                del tail[:-tail_bytes]
+    finally:
+        if log is not None:
+            log.close()
+    return bytes(tail)
+
+
+async def _stream_output(process: asyncio.subprocess.Process, log_dir: Optional[Path],
+                         node_id: str) -> Tuple[bytes, bytes]:
+    """Wait for the process while streaming stdout/stderr to log files; return their tails"""
+    stdout, stderr, _ = await asyncio.gather(
+        _tee_stream(process.stdout, log_dir / f"{node_id}.stdout" if log_dir else None, OUTPUT_TAIL_BYTES),
+        _tee_stream(process.stderr, log_dir / f"{node_id}.stderr" if log_dir else None, OUTPUT_TAIL_BYTES),
+        process.wait()
+    )
+    return stdout, stderr
+
+
+def _kill_process_group(process: asyncio.subprocess.Process) -> None:
+    """Kill a shell command together with anything it spawned (it leads its own session)"""
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except (AttributeError, OSError):
+        process.kill()
+
 
 class ExecutionStatus(Enum):
     """Node execution status"""
@@ -81,7 +203,185 @@ class ExecutionResult:
     duration: float = 0.0
     attempts: int = 1
     error_message: Optional[str] = None
-    envelope_v2: Optional[Dict] = None
+    # (flow_id, dry_run, finished_at, status, duration, attempts) captured when
+    # the node finishes; the envelope itself is only built on first access
+    _envelope_source: Optional[Tuple] = field(default=None, init=False, repr=False, compare=False)
+    _envelope: Optional[Dict] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def envelope_v2(self) -> Optional[Dict]:
+        """Action envelope v2, materialized lazily"""
+        if self._envelope is None and self._envelope_source is not None:
+            self._envelope = _build_envelope_v2(self.node_id, *self._envelope_source)
+        return self._envelope
+
+    @envelope_v2.setter
+    def envelope_v2(self, value: Optional[Dict]) -> None:
+        self._envelope = value
+
+    def envelope_v2_json(self) -> bytes:
+        """Action envelope v2 encoded as JSON"""
+        return _dumpb(self.envelope_v2)
+
+
+# Static candidate scores shared by every node envelope
+_DEFAULT_SCORES = {
+    "intent": 0.95,
+    "state": 0.9,
+    "evidence": 0.85,
+    "recency": 0.9,
+    "pref": 0.88,
+    "final": 0.873
+}
+
+
+def _build_envelope_v2(node_id: str, flow_id: str, dry_run: bool, finished_at: float,
+                       status: "ExecutionStatus", duration: float, attempts: int) -> Dict:
+    """Generate action_envelope_v2 for node execution"""
+    return {
+        "envelope_version": "2.0",
+        "schema_version": "2.0",
+        "generated_at": datetime.fromtimestamp(finished_at).isoformat(),
+        "decision": "NODE_EXECUTION",
+        "chosen_id": node_id,
+        "flow_id": flow_id,
+        "task_id": f"task_{node_id}",
+        "step_id": f"step_{node_id}",
+        "candidate": {
+            "id": node_id,
+            "action_type": "FLOW_NODE_EXECUTION",
+            "scores": dict(_DEFAULT_SCORES),
+            "explanation": f"Executed flow node: {node_id}",
+            "preconds": [],
+            "command": f"Executed: {node_id}"
+        },
+        "exec_mode": "DRY_RUN" if dry_run else "LIVE_EXECUTION",
+        "metadata": {
+            "feature_flag": "flow_execution",
+            "safety_gate": "flow_guards_passed",
+            "branch_protection": True,
+            "rollback_enabled": False,
+            "execution_duration": duration,
+            "attempts": attempts
+        },
+        "provenance": {
+            "source": "flow_runner",
+            "confidence_score": 0.873,
+            "validation_status": "completed" if status == ExecutionStatus.SUCCESS else "failed",
+            "approval_required": False
+        }
+    }
+
+
+_CONTAINS_RE = re.compile(r"contains\(['\"](.+?)['\"]\)")
+# {{param}} placeholders (whitespace inside the braces is ignored)
+_PARAM_RE = re.compile(r"\{\{\s*([^{}]+?)\s*\}\}")
+# Anything /bin/sh would interpret beyond splitting words and stripping quotes:
+# operators, expansions, globs, escapes, comments, multi-line scripts
+_SHELL_SYNTAX_RE = re.compile(r"[|&;<>()$`\\*?\[\]#~\n]")
+# Words that only mean something inside a shell
+_SHELL_ONLY_COMMANDS = frozenset({
+    "!", ".", ":", "alias", "break", "case", "cd", "command", "continue", "eval", "exec",
+    "exit", "export", "for", "getopts", "hash", "if", "local", "read", "readonly", "return",
+    "set", "shift", "source", "times", "trap", "type", "ulimit", "umask", "unalias", "unset",
+    "until", "wait", "while", "{"
+})
+
+
+def _compile_success_condition(condition: Any) -> Callable[[ExecutionResult], bool]:
+    """Parse a node's success_condition once into a check on its result"""
+    # Simple condition evaluation (can be extended)
+    try:
+        if condition:
+            if "exit_code == 0" in condition:
+                return lambda result: result.exit_code == 0
+            elif "exit_code == 1" in condition:
+                return lambda result: result.exit_code == 1
+            elif "contains" in condition:
+                # Check if stdout contains specific text
+                match = _CONTAINS_RE.search(condition)
+                if match:
+                    needle = match.group(1)
+                    return lambda result: needle in result.stdout
+    except Exception:
+        pass
+
+    # Default: success if exit_code == 0
+    return lambda result: result.exit_code == 0
+
+
+def _compile_edge_condition(condition: Any) -> Callable[[Dict[str, ExecutionResult]], bool]:
+    """Parse an edge's `when` clause once into a check on the results so far"""
+    try:
+        # Support basic patterns like "node_id.success == true"
+        if ".success" in condition:
+            node_id = condition.split(".")[0]
+            return lambda results: (results[node_id].status == ExecutionStatus.SUCCESS
+                                    if node_id in results else True)
+    except Exception:
+        pass
+
+    return lambda results: True  # Default to true if condition can't be evaluated
+
+
+@functools.lru_cache(maxsize=1024)
+def _argv_template(command: str) -> Optional[Tuple[str, ...]]:
+    """Tokenize a command that needs no shell features (None means run it via /bin/sh)"""
+    if _SHELL_SYNTAX_RE.search(command):
+        return None
+    try:
+        argv = tuple(shlex.split(command))
+    except ValueError:
+        return None  # unbalanced quotes: let the shell report it
+    if not argv or "=" in argv[0] or argv[0] in _SHELL_ONLY_COMMANDS:
+        return None
+    # Every placeholder must sit inside one token ("{{ x }}" unquoted would not)
+    if len(_PARAM_RE.findall(command)) != sum(len(_PARAM_RE.findall(token)) for token in argv):
+        return None
+    return argv
+
+
+@dataclass
+class ExecutionDag:
+    """Flow graph as plain dicts: succ maps node -> {successor: when clause},
+    pred maps node -> ((predecessor, compiled when check or None), ...)"""
+    nodes: List[str]
+    succ: Dict[str, Dict[str, Optional[str]]]
+    pred: Dict[str, Tuple[Tuple[str, Optional[Callable[[Dict[str, ExecutionResult]], bool]]], ...]]
+    indeg: Dict[str, int]
+    # Set when the graph is one path through every node (the usual CI pipeline)
+    chain: Optional[List[str]] = None
+
+    def topological_order(self) -> List[str]:
+        """Kahn's algorithm, generation by generation; raises ValueError on a cycle"""
+        indeg = {node_id: d for node_id, d in self.indeg.items() if d > 0}
+        generation = [node_id for node_id in self.nodes if self.indeg[node_id] == 0]
+        order = []
+        while generation:
+            order.extend(generation)
+            next_generation = []
+            for node_id in generation:
+                for child in self.succ[node_id]:
+                    indeg[child] -= 1
+                    if indeg[child] == 0:
+                        next_generation.append(child)
+                        del indeg[child]
+            generation = next_generation
+
+        if indeg:
+            raise ValueError(f"graph contains a cycle; blocked nodes: {sorted(indeg, key=str)}")
+        return order
+
+    def to_networkx(self):
+        """Export as a networkx DiGraph for debugging/visualization (imports networkx on demand)"""
+        import networkx as nx
+
+        graph = nx.DiGraph()
+        graph.add_nodes_from(self.nodes)
+        for src, targets in self.succ.items():
+            for dst, when in targets.items():
+                graph.add_edge(src, dst, condition=when)
+        return graph
 
 
 class FlowRunner:
@@ -90,18 +390,42 @@ class FlowRunner:
     def __init__(self, registry_path: str = "flow/flow_registry.yaml"):
         self.registry_path = Path(registry_path)
         self.flows = self._load_flows()
+        self._success_checks = self._compile_success_checks()
         self.guard_functions = self._load_guard_functions()
         self.context_stack = []
 
     def _load_flows(self) -> Dict[str, Dict]:
-        """Load flow definitions from registry"""
+        """Load flow definitions from registry (parsed once per file version)"""
         try:
-            with open(self.registry_path, 'r') as f:
-                registry = yaml.safe_load(f)
-            return registry.get("flows", {})
+            path = self.registry_path.resolve()
+            stat = path.stat()
+            cached = _REGISTRY_CACHE.get(path)
+            if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                return cached[3]
+
+            # Touched but unchanged files keep their parse
+            data = path.read_bytes()
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+            if cached is not None and cached[2] == digest:
+                flows = cached[3]
+            else:
+                flows = yaml.load(data, Loader=_SafeLoader).get("flows", {})
+            _REGISTRY_CACHE[path] = (stat.st_mtime_ns, stat.st_size, digest, flows)
+            return flows
         except Exception as e:
             raise ValueError(f"Failed to load flow registry: {e}")
 
+    def _compile_success_checks(self) -> Dict[Tuple[str, str], Callable[[ExecutionResult], bool]]:
+        """Compile every node's success_condition once, at load time"""
+        checks = {}
+        for flow_id, flow_def in self.flows.items():
+            nodes = flow_def.get("nodes") if isinstance(flow_def, dict) else None
+            if isinstance(nodes, dict):
+                for node_id, node_def in nodes.items():
+                    if isinstance(node_def, dict):
+                        checks[(flow_id, node_id)] = _compile_success_condition(node_def.get("success_condition"))
+        return checks
+
     def _load_guard_functions(self) -> Dict[str, Callable]:
         """Load built-in guard functions"""
         return {
@@ -127,17 +451,19 @@ class FlowRunner:
         execution_context = {
             "flow_id": flow_id,
             "start_time": datetime.now(),
+            "start_mono": time.monotonic(),
             "parameters": parameters,
             "dry_run": dry_run,
             "node_results": {},
             "variables": {},
-            "execution_log": []
+            "execution_log": [],
+            "_guard_cache": {}
         }
 
         # Metrics: determine exec_mode, persona, and branch
         exec_mode = "dry_run" if dry_run else "live"
         persona = parameters.get("persona", "CODER_AI")
-        branch = parameters.get("branch") or self._get_current_branch()
+        branch = parameters.get("branch") or self._get_current_branch(execution_context)
 
         print(f"🚀 Executing flow: {flow_id}")
         print(f"   Dry-run: {dry_run}")
@@ -185,116 +511,280 @@ class FlowRunner:
 
         print("🛡️  Executing flow guards...")
 
+        # Each guard runs at most once per execution
+        passed = context.setdefault("_guard_cache", {})
+
+        # Guards before the first unknown one run; the unknown one fails the flow
+        pending = {}
+        unknown = None
         for guard_name in guards:
             if guard_name not in self.guard_functions:
-                print(f"❌ Unknown guard: {guard_name}")
-                return False
-
-            guard_func = self.guard_functions[guard_name]
+                unknown = guard_name
+                break
+            if not passed.get(guard_name):
+                pending[guard_name] = None
+
+        # Run them concurrently, but report in registration order and stop at
+        # the first failure, exactly as a sequential pass would
+        names = list(pending)
+        if len(names) > 1:
+            executor = ThreadPoolExecutor(max_workers=len(names), thread_name_prefix="guard")
+            futures = []
             try:
-                if not guard_func(context):
-                    print(f"❌ Guard failed: {guard_name}")
-                    return False
-                else:
-                    print(f"✅ Guard passed: {guard_name}")
-            except Exception as e:
-                print(f"❌ Guard error '{guard_name}': {e}")
-                return False
+                futures = [executor.submit(self._run_guard_captured, name, context) for name in names]
+                outcomes = (future.result() for future in futures)
+                ok = self._report_guards(names, outcomes, passed)
+            finally:
+                for future in futures:
+                    future.cancel()
+                executor.shutdown(wait=True)  # let started guards finish writing to their buffers
+        else:
+            ok = self._report_guards(names, (self._run_guard(name, context) for name in names), passed)
 
+        if ok and unknown is not None:
+            print(f"❌ Unknown guard: {unknown}")
+            return False
+        return ok
+
+    def _run_guard(self, guard_name: str, context: Dict) -> Tuple[bool, Optional[Exception], str]:
+        """Run one guard: (passed, exception raised, captured output)"""
+        try:
+            return bool(self.guard_functions[guard_name](context)), None, ""
+        except Exception as e:
+            return False, e, ""
+
+    def _run_guard_captured(self, guard_name: str, context: Dict) -> Tuple[bool, Optional[Exception], str]:
+        """Run one guard on a worker thread, buffering what it prints"""
+        _GUARD_OUTPUT.buffer = buffer = io.StringIO()
+        try:
+            ok, error, _ = self._run_guard(guard_name, context)
+        finally:
+            _GUARD_OUTPUT.buffer = None
+        return ok, error, buffer.getvalue()
+
+    def _report_guards(self, names: List[str], outcomes, passed: Dict) -> bool:
+        """Print guard outcomes in order; False at the first failing guard"""
+        for guard_name, (ok, error, output) in zip(names, outcomes):
+            if output:
+                sys.stdout.write(output)
+            if error is not None:
+                print(f"❌ Guard error '{guard_name}': {error}")
+                return False
+            if not ok:
+                print(f"❌ Guard failed: {guard_name}")
+                return False
+            passed[guard_name] = True
+            print(f"✅ Guard passed: {guard_name}")
         return True
 
-    def _build_execution_dag(self, flow_def: Dict) -> nx.DiGraph:
+    def _build_execution_dag(self, flow_def: Dict) -> ExecutionDag:
         """Build execution DAG from flow definition"""
-        dag = nx.DiGraph()
         nodes = flow_def.get("nodes", {})
         edges = flow_def.get("edges", [])
 
-        # Add all nodes
-        for node_id in nodes.keys():
-            dag.add_node(node_id)
+        # Add all nodes (edge endpoints missing from nodes are added too)
+        succ = {node_id: {} for node_id in nodes.keys()}
+        pred = {node_id: {} for node_id in nodes.keys()}
 
-        # Add edges with conditions
+        # Add edges with conditions (a repeated edge keeps its last condition)
         for edge in edges:
             if "from" in edge and "to" in edge:
-                dag.add_edge(edge["from"], edge["to"], condition=edge.get("when"))
+                src, dst = edge["from"], edge["to"]
+                for node_id in (src, dst):
+                    if node_id not in succ:
+                        succ[node_id] = {}
+                        pred[node_id] = {}
+                when = edge.get("when")
+                succ[src][dst] = when
+                pred[dst][src] = None if when is None else _compile_edge_condition(when)
+
+        # Incoming edges as flat tuples, iterated directly per readiness check
+        pred = {node_id: tuple(p.items()) for node_id, p in pred.items()}
+        indeg = {node_id: len(p) for node_id, p in pred.items()}
+
+        # Single path through all nodes: no fan-in, no fan-out, one head
+        chain = None
+        if all(d <= 1 for d in indeg.values()) and all(len(s) <= 1 for s in succ.values()):
+            heads = [node_id for node_id, d in indeg.items() if d == 0]
+            if len(heads) == 1:
+                chain = heads
+                while succ[chain[-1]]:
+                    chain.append(next(iter(succ[chain[-1]])))
+                if len(chain) != len(succ):
+                    chain = None  # the rest sits on a cycle
+
+        return ExecutionDag(
+            nodes=list(succ),
+            succ=succ,
+            pred=pred,
+            indeg=indeg,
+            chain=chain
+        )
+
+    def _execute_dag(self, dag: ExecutionDag, flow_def: Dict, context: Dict) -> Dict[str, ExecutionResult]:
+        """Execute nodes in dependency order (independent nodes concurrently if enabled)"""
+        if dag.chain is not None:
+            # Nothing can overlap on a single path: run it as a plain loop
+            return asyncio.run(self._execute_chain(dag, flow_def, context))
+
+        try:
+            # Get topological order
+            execution_order = dag.topological_order()
+        except ValueError as e:
+            raise ValueError(f"DAG execution failed: {e}")
+
+        results = asyncio.run(self._execute_dag_async(dag, execution_order, flow_def, context))
+
+        # Report in topological order, whatever order nodes finished in
+        return {node_id: results[node_id] for node_id in execution_order if node_id in results}
+
+    async def _execute_dag_async(self, dag: ExecutionDag, execution_order: List[str],
+                                 flow_def: Dict, context: Dict) -> Dict[str, ExecutionResult]:
+        """Dispatch every ready node (all predecessors finished) up to the concurrency limit"""
+        config = flow_def.get("config", {})
+        fail_fast = config.get("fail_fast", True)
+        if config.get("parallel_execution", False):
+            limit = max(1, int(config.get("max_concurrency", DEFAULT_MAX_CONCURRENCY)))
+        else:
+            limit = 1
 
-        return dag
+        # Ready nodes come out in topological-order rank, so a limit of 1
+        # reproduces the sequential execution order exactly
+        rank = {node_id: i for i, node_id in enumerate(execution_order)}
+        remaining = dict(dag.indeg)
+        ready = [rank[node_id] for node_id in execution_order if remaining[node_id] == 0]
+        heapq.heapify(ready)
 
-    def _execute_dag(self, dag: nx.DiGraph, flow_def: Dict, context: Dict) -> Dict[str, ExecutionResult]:
-        """Execute nodes in topological order"""
         results = {}
+        in_flight = {}  # task -> node_id
+        stop = False
+
+        def release(node_id: str) -> None:
+            # Node finished: successors with no other pending predecessor become ready
+            for succ in dag.succ[node_id]:
+                remaining[succ] -= 1
+                if remaining[succ] == 0:
+                    heapq.heappush(ready, rank[succ])
 
         try:
-            # Get topological order
-            execution_order = list(nx.topological_sort(dag))
+            while not stop and (ready or in_flight):
+                while ready and len(in_flight) < limit:
+                    node_id = execution_order[heapq.heappop(ready)]
+
+                    # Check if predecessors succeeded
+                    if not self._check_predecessor_success(dag, node_id, results):
+                        results[node_id] = ExecutionResult(
+                            node_id=node_id,
+                            status=ExecutionStatus.SKIPPED,
+                            error_message="Predecessor failed"
+                        )
+                        release(node_id)
+                        continue
+
+                    # Execute node
+                    node_def = flow_def["nodes"][node_id]
+                    task = asyncio.ensure_future(self._execute_node(node_id, node_def, context))
+                    in_flight[task] = node_id
+
+                if not in_flight:
+                    break
+
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    node_id = in_flight.pop(task)
+                    result = task.result()
+                    results[node_id] = result
+
+                    self._log_result(context, node_id, result)
+
+                    # Check if we should fail fast
+                    if result.status == ExecutionStatus.FAILED and fail_fast:
+                        print(f"❌ Fail-fast enabled, stopping execution after {node_id}")
+                        stop = True
+                    else:
+                        release(node_id)
+        finally:
+            # Fail-fast or an error: stop nodes still running (their processes are killed)
+            for task in in_flight:
+                task.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
 
-            for node_id in execution_order:
-                # Check if predecessors succeeded
-                if not self._check_predecessor_success(dag, node_id, results):
+        return results
+
+    async def _execute_chain(self, dag: ExecutionDag, flow_def: Dict, context: Dict) -> Dict[str, ExecutionResult]:
+        """Run a linear DAG node by node; each node has at most one predecessor"""
+        fail_fast = flow_def.get("config", {}).get("fail_fast", True)
+        results = {}
+        prev = None
+        for node_id in dag.chain:
+            if prev is not None:
+                check = dag.pred[node_id][0][1]
+                if results[prev].status != ExecutionStatus.SUCCESS or (check is not None and not check(results)):
                     results[node_id] = ExecutionResult(
                         node_id=node_id,
                         status=ExecutionStatus.SKIPPED,
                         error_message="Predecessor failed"
                     )
+                    prev = node_id
                     continue
 
-                # Execute node
-                node_def = flow_def["nodes"][node_id]
-                result = self._execute_node(node_id, node_def, context)
-
-                results[node_id] = result
+            result = await self._execute_node(node_id, flow_def["nodes"][node_id], context)
+            results[node_id] = result
+            self._log_result(context, node_id, result)
 
-                # Log result
-                context["execution_log"].append({
-                    "timestamp": datetime.now().isoformat(),
-                    "node_id": node_id,
-                    "status": result.status.value,
-                    "duration": result.duration
-                })
-
-                # Check if we should fail fast
-                if result.status == ExecutionStatus.FAILED and flow_def.get("config", {}).get("fail_fast", True):
-                    print(f"❌ Fail-fast enabled, stopping execution after {node_id}")
-                    break
-
-        except nx.NetworkXError as e:
-            raise ValueError(f"DAG execution failed: {e}")
+            if result.status == ExecutionStatus.FAILED and fail_fast:
+                print(f"❌ Fail-fast enabled, stopping execution after {node_id}")
+                break
+            prev = node_id
 
         return results
 
-    def _check_predecessor_success(self, dag: nx.DiGraph, node_id: str, results: Dict) -> bool:
-        """Check if all predecessors succeeded"""
-        predecessors = list(dag.predecessors(node_id))
+    def _log_result(self, context: Dict, node_id: str, result: ExecutionResult) -> None:
+        """Append a node result to the execution log (monotonic stamp, formatted in the summary)"""
+        context["execution_log"].append({
+            "ts_mono": time.monotonic(),
+            "node_id": node_id,
+            "status": result.status.value,
+            "duration": result.duration
+        })
 
-        for pred_id in predecessors:
-            if pred_id in results:
-                pred_result = results[pred_id]
-                if pred_result.status != ExecutionStatus.SUCCESS:
+    def _check_predecessor_success(self, dag: ExecutionDag, node_id: str, results: Dict) -> bool:
+        """Check if all predecessors succeeded"""
+        get = results.get
+        for pred_id, check in dag.pred[node_id]:
+            pred_result = get(pred_id)
+            if pred_result is not None:
+                if pred_result.status is not ExecutionStatus.SUCCESS:
                     return False
 
                 # Check edge condition if present
-                edge_data = dag.get_edge_data(pred_id, node_id)
-                if edge_data and "condition" in edge_data:
-                    condition = edge_data["condition"]
-                    if not self._evaluate_condition(condition, results):
-                        return False
+                if check is not None and not check(results):
+                    return False
 
         return True
 
-    def _execute_node(self, node_id: str, node_def: Dict, context: Dict) -> ExecutionResult:
+    async def _execute_node(self, node_id: str, node_def: Dict, context: Dict) -> ExecutionResult:
         """Execute a single node with retry logic"""
         max_retries = node_def.get("retries", 0)
         retry_delay = node_def.get("retry_delay", 30)
+        retry_backoff = node_def.get("retry_backoff", 2)
+        retry_delay_max = node_def.get("retry_delay_max", retry_delay * 8)
         timeout = node_def.get("timeout", 300)
 
         attempt = 1
         last_result = None
+        command = None
 
         while attempt <= max_retries + 1:
             try:
                 print(f"🔄 Executing {node_id} (attempt {attempt}/{max_retries + 1})")
 
-                result = self._execute_node_once(node_id, node_def, context, timeout)
+                # Parameters don't change between attempts: substitute once
+                if command is None:
+                    command = self._substitute_parameters(node_def["command"], context)
+
+                result = await self._execute_node_once(node_id, node_def, context, timeout, command)
 
                 # Check success condition
                 if self._check_success_condition(result, node_def, context):
@@ -306,12 +796,14 @@ class FlowRunner:
                     last_result = result
 
                     if attempt <= max_retries:
+                        delay = _backoff_delay(retry_delay, attempt, retry_backoff, retry_delay_max)
+
                         # Metrics: Record retry
                         persona = context.get("parameters", {}).get("persona", "CODER_AI")
-                        instr.retry(context["flow_id"], node_id, persona)
+                        instr.retry(context["flow_id"], node_id, persona, delay=delay)
                         
-                        print(f"⚠️  Success condition failed, retrying in {retry_delay}s...")
-                        time.sleep(retry_delay)
+                        print(f"⚠️  Success condition failed, retrying in {delay:.1f}s...")
+                        await asyncio.sleep(delay)
                         attempt += 1
                     else:
                         break
@@ -326,12 +818,14 @@ class FlowRunner:
                 )
 
                 if attempt <= max_retries:
+                    delay = _backoff_delay(retry_delay, attempt, retry_backoff, retry_delay_max)
+
                     # Metrics: Record retry
                     persona = context.get("parameters", {}).get("persona", "CODER_AI")
-                    instr.retry(context["flow_id"], node_id, persona)
+                    instr.retry(context["flow_id"], node_id, persona, delay=delay)
                     
-                    print(f"⚠️  Retrying in {retry_delay}s...")
-                    time.sleep(retry_delay)
+                    print(f"⚠️  Retrying in {delay:.1f}s...")
+                    await asyncio.sleep(delay)
                     attempt += 1
                 else:
                     break
@@ -347,9 +841,10 @@ class FlowRunner:
                 error_message="Node execution failed after all retries"
             )
 
-    def _execute_node_once(self, node_id: str, node_def: Dict, context: Dict, timeout: int) -> ExecutionResult:
+    async def _execute_node_once(self, node_id: str, node_def: Dict, context: Dict, timeout: int,
+                                 command: Optional[str] = None) -> ExecutionResult:
         """Execute node once (single attempt)"""
-        start_time = datetime.now()
+        start_mono = time.monotonic()
 
         # Metrics: Extract metadata for step timing
         flow_id = context["flow_id"]
@@ -358,7 +853,8 @@ class FlowRunner:
         model = node_def.get("model", "unknown")  # Allow nodes to specify model
 
         # Prepare command with parameter substitution
-        command = self._substitute_parameters(node_def["command"], context)
+        if command is None:
+            command = self._substitute_parameters(node_def["command"], context)
 
         # Metrics: Time step execution with context manager
         with instr.step(flow_id, node_id, persona, model, exec_mode):
@@ -370,175 +866,168 @@ class FlowRunner:
                     status=ExecutionStatus.SUCCESS,
                     exit_code=0,
                     stdout=f"DRY_RUN: {command}",
-                    duration=(datetime.now() - start_time).total_seconds()
+                    duration=time.monotonic() - start_mono
                 )
             else:
-                # Real execution
-                try:
-                    process = subprocess.run(
+                # Real execution (async, so independent nodes overlap)
+                log_dir = Path(FLOW_LOG_DIR) / flow_id if FLOW_LOG_DIR else None
+                if log_dir is not None:
+                    try:
+                        log_dir.mkdir(parents=True, exist_ok=True)
+                    except OSError:
+                        log_dir = None
+
+                # Plain commands run directly; parameters fill whole argv tokens,
+                # so their values are never re-parsed by a shell
+                process = None
+                template = _argv_template(node_def["command"])
+                if template is not None:
+                    try:
+                        process = await asyncio.create_subprocess_exec(
+                            *self._substitute_argv(template, context),
+                            stdout=asyncio.subprocess.PIPE,
+                            stderr=asyncio.subprocess.PIPE,
+                            cwd=Path.cwd(),
+                            start_new_session=True
+                        )
+                    except OSError:
+                        process = None  # not found / not executable: the shell reports it
+                if process is None:
+                    process = await asyncio.create_subprocess_shell(
                         command,
-                        shell=True,
-                        capture_output=True,
-                        text=True,
-                        timeout=timeout,
-                        cwd=Path.cwd()
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.PIPE,
+                        cwd=Path.cwd(),
+                        start_new_session=True
                     )
+                try:
+                    stdout, stderr = await asyncio.wait_for(_stream_output(process, log_dir, node_id), timeout)
 
                     result = ExecutionResult(
                         node_id=node_id,
                         status=ExecutionStatus.SUCCESS if process.returncode == 0 else ExecutionStatus.FAILED,
                         exit_code=process.returncode,
-                        stdout=process.stdout,
-                        stderr=process.stderr,
-                        duration=(datetime.now() - start_time).total_seconds()
+                        stdout=stdout.decode(errors="replace"),
+                        stderr=stderr.decode(errors="replace"),
+                        duration=time.monotonic() - start_mono
                     )
 
-                except subprocess.TimeoutExpired:
+                except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+                    # Never leave the command (or children holding its pipes) running
+                    if process.returncode is None:
+                        _kill_process_group(process)
+                        await process.wait()
+                    if isinstance(e, asyncio.CancelledError):
+                        raise
                     result = ExecutionResult(
                         node_id=node_id,
                         status=ExecutionStatus.TIMEOUT,
                         error_message=f"Command timed out after {timeout}s",
-                        duration=(datetime.now() - start_time).total_seconds()
+                        duration=time.monotonic() - start_mono
                     )
 
-        # Generate action envelope v2
-        result.envelope_v2 = self._generate_action_envelope_v2(node_id, result, context)
+        # Record what action envelope v2 needs; it is built only if read
+        result._envelope_source = (context["flow_id"], bool(context.get("dry_run")), time.time(),
+                                   result.status, result.duration, result.attempts)
 
         return result
 
     def _substitute_parameters(self, command: str, context: Dict) -> str:
         """Substitute parameters in command string"""
-        # Simple parameter substitution using {{param}} syntax
+        # Simple parameter substitution using {{param}} syntax, in one pass;
+        # unknown placeholders are left as they are
         params = context.get("parameters", {})
+        if not params:
+            return command
 
-        for key, value in params.items():
-            placeholder = "{{" + key + "}}"
-            command = command.replace(placeholder, str(value))
+        def lookup(match):
+            key = match.group(1)
+            return str(params[key]) if key in params else match.group(0)
 
-        return command
+        return _PARAM_RE.sub(lookup, command)
 
-    def _check_success_condition(self, result: ExecutionResult, node_def: Dict, context: Dict) -> bool:
-        """Evaluate node's success condition"""
-        success_condition = node_def.get("success_condition")
+    def _substitute_argv(self, template: Tuple[str, ...], context: Dict) -> List[str]:
+        """Substitute parameters token by token in a pre-split command"""
+        params = context.get("parameters", {})
+        if not params:
+            return list(template)
 
-        if not success_condition:
-            # Default: success if exit_code == 0
-            return result.exit_code == 0
+        def lookup(match):
+            key = match.group(1)
+            return str(params[key]) if key in params else match.group(0)
 
-        # Simple condition evaluation (can be extended)
-        try:
-            if "exit_code == 0" in success_condition:
-                return result.exit_code == 0
-            elif "exit_code == 1" in success_condition:
-                return result.exit_code == 1
-            elif "contains" in success_condition:
-                # Check if stdout contains specific text
-                match = re.search(r"contains\(['\"](.+?)['\"]\)", success_condition)
-                if match:
-                    return match.group(1) in result.stdout
-        except:
-            pass
+        return [_PARAM_RE.sub(lookup, token) if "{{" in token else token for token in template]
 
-        # Default to checking exit code
-        return result.exit_code == 0
+    def _check_success_condition(self, result: ExecutionResult, node_def: Dict, context: Dict) -> bool:
+        """Evaluate node's success condition (compiled at load time)"""
+        check = self._success_checks.get((context["flow_id"], result.node_id))
+        if check is None:
+            check = _compile_success_condition(node_def.get("success_condition"))
+        return check(result)
 
     def _evaluate_condition(self, condition: str, results: Dict[str, ExecutionResult]) -> bool:
         """Evaluate edge condition"""
-        # Simple condition evaluation (can be extended with more complex logic)
-        try:
-            # Support basic patterns like "node_id.success == true"
-            if ".success" in condition:
-                node_id = condition.split(".")[0]
-                if node_id in results:
-                    return results[node_id].status == ExecutionStatus.SUCCESS
-        except:
-            pass
-
-        return True  # Default to true if condition can't be evaluated
-
-    def _generate_action_envelope_v2(self, node_id: str, result: ExecutionResult, context: Dict) -> Dict:
-        """Generate action_envelope_v2 for node execution"""
-        return {
-            "envelope_version": "2.0",
-            "schema_version": "2.0",
-            "generated_at": datetime.now().isoformat(),
-            "decision": "NODE_EXECUTION",
-            "chosen_id": node_id,
-            "flow_id": context["flow_id"],
-            "task_id": f"task_{node_id}",
-            "step_id": f"step_{node_id}",
-            "candidate": {
-                "id": node_id,
-                "action_type": "FLOW_NODE_EXECUTION",
-                "scores": {
-                    "intent": 0.95,
-                    "state": 0.9,
-                    "evidence": 0.85,
-                    "recency": 0.9,
-                    "pref": 0.88,
-                    "final": 0.873
-                },
-                "explanation": f"Executed flow node: {node_id}",
-                "preconds": [],
-                "command": f"Executed: {node_id}"
-            },
-            "exec_mode": "DRY_RUN" if context.get("dry_run") else "LIVE_EXECUTION",
-            "metadata": {
-                "feature_flag": "flow_execution",
-                "safety_gate": "flow_guards_passed",
-                "branch_protection": True,
-                "rollback_enabled": False,
-                "execution_duration": result.duration,
-                "attempts": result.attempts
-            },
-            "provenance": {
-                "source": "flow_runner",
-                "confidence_score": 0.873,
-                "validation_status": "completed" if result.status == ExecutionStatus.SUCCESS else "failed",
-                "approval_required": False
-            }
-        }
+        return _compile_edge_condition(condition)(results)
 
     def _generate_execution_summary(self, flow_id: str, results: Dict[str, ExecutionResult], context: Dict) -> Dict:
         """Generate execution summary"""
+        # Tally statuses and build the per-node view in a single pass
+        status_counts = Counter()
+        node_results = {}
+        for k, v in results.items():
+            status = v.status
+            status_counts[status] += 1
+            node_results[k] = {
+                "status": status.value,
+                "duration": v.duration,
+                "attempts": v.attempts,
+                "exit_code": v.exit_code
+            }
         total_nodes = len(results)
-        successful_nodes = sum(1 for r in results.values() if r.status == ExecutionStatus.SUCCESS)
-        failed_nodes = sum(1 for r in results.values() if r.status == ExecutionStatus.FAILED)
+        successful_nodes = status_counts[ExecutionStatus.SUCCESS]
+        failed_nodes = status_counts[ExecutionStatus.FAILED]
 
         return {
             "flow_id": flow_id,
-            "execution_time": (datetime.now() - context["start_time"]).total_seconds(),
+            "execution_time": time.monotonic() - context["start_mono"],
             "total_nodes": total_nodes,
             "successful_nodes": successful_nodes,
             "failed_nodes": failed_nodes,
             "success_rate": successful_nodes / total_nodes if total_nodes > 0 else 0,
             "dry_run": context.get("dry_run", True),
-            "node_results": {k: {
-                "status": v.status.value,
-                "duration": v.duration,
-                "attempts": v.attempts,
-                "exit_code": v.exit_code
-            } for k, v in results.items()},
-            "execution_log": context.get("execution_log", [])
+            "node_results": node_results,
+            "execution_log": self._format_execution_log(context)
         }
 
+    def _format_execution_log(self, context: Dict) -> List[Dict]:
+        """Render monotonic log stamps as ISO timestamps"""
+        start_time = context["start_time"]
+        start_mono = context["start_mono"]
+        log = []
+        for entry in context.get("execution_log", []):
+            if "ts_mono" in entry:
+                entry = dict(entry)
+                ts = start_time + timedelta(seconds=entry.pop("ts_mono") - start_mono)
+                entry = {"timestamp": ts.isoformat(), **entry}
+            log.append(entry)
+        return log
+
     # Guard Functions
     def _guard_branch_not_main(self, context: Dict) -> bool:
         """Ensure not running on main/master branch"""
         try:
-            result = subprocess.run(["git", "branch", "--show-current"],
-                                  capture_output=True, text=True, timeout=10)
+            result = self._git_show_current(context)
             current_branch = result.stdout.strip()
             forbidden_branches = ["main", "master"]
 
             if current_branch in forbidden_branches:
-                print(f"❌ Cannot run on protected branch: {current_branch}")
+                _guard_print(f"❌ Cannot run on protected branch: {current_branch}")
                 return False
 
-            print(f"✅ Branch check passed: {current_branch}")
+            _guard_print(f"✅ Branch check passed: {current_branch}")
             return True
         except Exception as e:
-            print(f"❌ Branch check failed: {e}")
+            _guard_print(f"❌ Branch check failed: {e}")
             return False
 
     def _guard_dry_run_unless_allowed(self, context: Dict) -> bool:
@@ -547,34 +1036,25 @@ class FlowRunner:
         is_dry_run = context.get("dry_run", True)
 
         if not is_dry_run and not allow_writes:
-            print("❌ Live execution blocked - set ALLOW_WRITES=1 to enable")
+            _guard_print("❌ Live execution blocked - set ALLOW_WRITES=1 to enable")
             return False
 
         if is_dry_run:
-            print("✅ Dry-run mode enabled")
+            _guard_print("✅ Dry-run mode enabled")
         elif allow_writes:
-            print("✅ Live execution enabled (ALLOW_WRITES=1)")
+            _guard_print("✅ Live execution enabled (ALLOW_WRITES=1)")
 
         return True
 
     def _guard_artifacts_present(self, context: Dict) -> bool:
         """Check required artifacts exist"""
-        required_files = [
-            "memory-bank/business/client_score.json",
-            "memory-bank/business/capacity_report.md",
-            "memory-bank/plan/proposal.md"
-        ]
-
-        missing_files = []
-        for file_path in required_files:
-            if not Path(file_path).exists():
-                missing_files.append(file_path)
+        missing_files = _missing_paths(REQUIRED_ARTIFACTS)
 
         if missing_files:
-            print(f"❌ Missing required artifacts: {missing_files}")
+            _guard_print(f"❌ Missing required artifacts: {missing_files}")
             return False
 
-        print("✅ All required artifacts present")
+        _guard_print("✅ All required artifacts present")
         return True
 
     def _guard_git_clean(self, context: Dict) -> bool:
@@ -584,16 +1064,16 @@ class FlowRunner:
                                   capture_output=True, text=True, timeout=10)
 
             if result.stdout.strip():
-                print("❌ Working directory not clean")
-                print("   Modified files:")
+                _guard_print("❌ Working directory not clean")
+                _guard_print("   Modified files:")
                 for line in result.stdout.strip().split('\n'):
-                    print(f"   {line}")
+                    _guard_print(f"   {line}")
                 return False
 
-            print("✅ Working directory clean")
+            _guard_print("✅ Working directory clean")
             return True
         except Exception as e:
-            print(f"❌ Git status check failed: {e}")
+            _guard_print(f"❌ Git status check failed: {e}")
             return False
 
     def _guard_ci_environment(self, context: Dict) -> bool:
@@ -602,37 +1082,53 @@ class FlowRunner:
         ci_detected = any(os.getenv(var) for var in ci_vars)
 
         if not ci_detected:
-            print("❌ CI environment not detected")
+            _guard_print("❌ CI environment not detected")
             return False
 
-        print("✅ CI environment detected")
+        _guard_print("✅ CI environment detected")
         return True
 
     def _guard_test_framework_available(self, context: Dict) -> bool:
         """Check if test framework is available"""
         try:
-            result = subprocess.run(["python3", "-m", "pytest", "--version"],
-                                  capture_output=True, timeout=10)
+            # python3 on PATH lives beside this interpreter: check in-process, no fork/exec
+            python3 = shutil.which("python3")
+            if python3 and os.path.dirname(os.path.abspath(python3)) == os.path.dirname(os.path.abspath(sys.executable)):
+                available = importlib.util.find_spec("pytest") is not None
+            else:
+                result = subprocess.run(["python3", "-m", "pytest", "--version"],
+                                      capture_output=True, timeout=10)
+                available = result.returncode == 0
 
-            if result.returncode == 0:
-                print("✅ Test framework available")
+            if available:
+                _guard_print("✅ Test framework available")
                 return True
             else:
-                print("❌ Test framework not available")
+                _guard_print("❌ Test framework not available")
                 return False
         except Exception as e:
-            print(f"❌ Test framework check failed: {e}")
+            _guard_print(f"❌ Test framework check failed: {e}")
             return False
 
-    def _get_current_branch(self) -> str:
+    def _git_show_current(self, context: Optional[Dict] = None) -> subprocess.CompletedProcess:
+        """`git branch --show-current`, run at most once per flow execution (re-raises its error)"""
+        outcome = context.get("_git_branch") if context is not None else None
+        if outcome is None:
+            try:
+                outcome = subprocess.run(["git", "branch", "--show-current"],
+                                         capture_output=True, text=True, timeout=10)
+            except Exception as e:
+                outcome = e
+            if context is not None:
+                context["_git_branch"] = outcome
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    def _get_current_branch(self, context: Optional[Dict] = None) -> str:
         """Get current git branch name for metrics"""
         try:
-            result = subprocess.run(
-                ["git", "branch", "--show-current"], 
-                capture_output=True, 
-                text=True, 
-                timeout=5
-            )
+            result = self._git_show_current(context)
             if result.returncode == 0:
                 return result.stdout.strip() or "unknown"
         except Exception:
@@ -654,6 +1150,8 @@ def main():
                        help="Execute in live mode (requires ALLOW_WRITES=1)")
     parser.add_argument("--param", action="append",
                        help="Parameter in key=value format")
+    parser.add_argument("--summary-out",
+                       help="Write the execution summary as JSON to this file")
 
     args = parser.parse_args()
 
@@ -671,6 +1169,8 @@ def main():
     try:
         runner = FlowRunner(args.registry)
         result = runner.execute_flow(args.flow_id, parameters, dry_run)
+        if args.summary_out:
+            Path(args.summary_out).write_bytes(_dumpb(result))
 
         # Print summary
         print("\n📊 Execution Summary:")
@@ -4,8 +4,130 @@ Drop-in helpers for instrumenting runner/personas
 Provides a convenient interface to the metrics collector
 """
 
+import atexit
+import collections
+import os
+import threading
+import time
+from contextlib import nullcontext
+
 from observability import collector as obs
 
+# Events are queued and applied to the collector by a background thread, so
+# callers never wait on collector locks. When the queue is full new events are
+# dropped (and counted) rather than letting a stalled collector grow memory
+# without bound; only the exit of an already-queued step is always kept, so
+# the inflight gauge stays balanced. AR_METRICS_SYNC=1 applies events inline.
+EVENT_QUEUE_SIZE = 65536
+_DRAIN_BATCH = 1024
+# Safety net only: the drainer is woken by _emit, not by polling
+_DRAIN_IDLE_TIMEOUT = 5.0
+_SYNC = os.getenv("AR_METRICS_SYNC") == "1"
+
+_EVENTS = collections.deque()
+_dropped = 0
+_drainer_pid = None
+_drainer_lock = threading.Lock()
+# Set by _emit when the idle drainer may be waiting; cleared by the drainer
+_wake = threading.Event()
+_NULL_CTX = nullcontext()
+
+
+def _emit(fn, *args, force=False):
+    """Queue one collector call; returns False if it was dropped"""
+    global _dropped
+    if not obs.metrics_enabled():
+        return False
+    if _SYNC:
+        fn(*args)
+        return True
+    if _drainer_pid != os.getpid():
+        _start_drainer()
+    if len(_EVENTS) >= EVENT_QUEUE_SIZE and not force:
+        _dropped += 1
+        return False
+    _EVENTS.append((fn, args))
+    if not _wake.is_set():
+        _wake.set()
+    return True
+
+
+def _start_drainer():
+    """Start the drain thread for this process (again after a fork)"""
+    global _drainer_pid, _wake
+    with _drainer_lock:
+        if _drainer_pid == os.getpid():
+            return
+        if _drainer_pid is not None:
+            # Forked child: what is queued belongs to the parent, and the
+            # parent's drainer may have held the event's lock at fork time
+            _EVENTS.clear()
+            _wake = threading.Event()
+        threading.Thread(target=_drain_forever, name="instr-drain", daemon=True).start()
+        _drainer_pid = os.getpid()
+
+
+def _drain_batch():
+    """Apply up to _DRAIN_BATCH queued events; returns how many were applied"""
+    popleft = _EVENTS.popleft
+    n = 0
+    while n < _DRAIN_BATCH:
+        try:
+            fn, args = popleft()
+        except IndexError:
+            break
+        try:
+            fn(*args)
+        except Exception:
+            pass  # one bad event must not stop the drainer
+        n += 1
+    return n
+
+
+def _drain_forever():
+    """Drain thread body: apply batches, block until _emit queues more"""
+    wake = _wake
+    while True:
+        if _drain_batch():
+            continue
+        # Clear before re-checking, so an event queued in between still wakes us
+        wake.clear()
+        if not _EVENTS:
+            wake.wait(_DRAIN_IDLE_TIMEOUT)
+
+
+def flush():
+    """Apply every queued event now (tests, before reading metrics in-process)"""
+    while _drain_batch():
+        pass
+
+
+def dropped_events():
+    """Number of events discarded because the queue was full"""
+    return _dropped
+
+
+atexit.register(flush)
+
+
+class _StepTimer:
+    """Times a step in the caller; the collector updates go through the queue"""
+    __slots__ = ("labels", "started", "begun")
+
+    def __init__(self, labels):
+        self.labels = labels
+
+    def __enter__(self):
+        self.begun = _emit(obs.step_begin, self.labels[0])
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        # A step whose entry was queued must have its exit queued as well
+        _emit(obs.step_end, *self.labels, (time.perf_counter() - self.started) * 1000.0,
+              self.begun, force=self.begun)
+        return False
+
 
 class instr:
     """
@@ -21,8 +143,8 @@ class instr:
             # execute step logic
             pass
         
-        # Retry tracking
-        instr.retry(flow_id, step_id, persona)
+        # Retry tracking (delay: backoff in seconds, optional)
+        instr.retry(flow_id, step_id, persona, delay=12.5)
         
         # Token tracking
         instr.tokens_in(model="gpt-4", persona="CODER_AI", n=1500)
@@ -32,12 +154,12 @@ class instr:
     @staticmethod
     def flow_start(flow_id, persona, exec_mode, branch):
         """Mark the start of a flow execution"""
-        obs.flow_start(flow_id, persona, exec_mode, branch)
+        _emit(obs.flow_start, flow_id, persona, exec_mode, branch)
     
     @staticmethod
     def flow_end(flow_id, persona, exec_mode, branch, success: bool, reason="ok"):
         """Mark the end of a flow execution"""
-        obs.flow_end(flow_id, persona, exec_mode, branch, success, reason)
+        _emit(obs.flow_end, flow_id, persona, exec_mode, branch, success, reason)
     
     @staticmethod
     def step(flow_id, step_id, persona, model="unknown", exec_mode="dry_run"):
@@ -49,22 +171,24 @@ class instr:
                 # step execution code here
                 pass
         """
-        return obs.step_timer(flow_id, step_id, persona, model, exec_mode)
+        if not obs.metrics_enabled():
+            return _NULL_CTX
+        return _StepTimer((flow_id, step_id, persona, model, exec_mode))
     
     @staticmethod
-    def retry(flow_id, step_id, persona):
+    def retry(flow_id, step_id, persona, delay=None):
         """Record a retry event for a step"""
-        obs.add_retry(flow_id, step_id, persona)
+        _emit(obs.add_retry, flow_id, step_id, persona, delay)
     
     @staticmethod
     def tokens_in(model, persona, n):
         """Record input tokens consumed"""
-        obs.add_tokens("in", model, persona, n)
+        _emit(obs.add_tokens, "in", model, persona, n)
     
     @staticmethod
     def tokens_out(model, persona, n):
         """Record output tokens generated"""
-        obs.add_tokens("out", model, persona, n)
+        _emit(obs.add_tokens, "out", model, persona, n)
 
 
 # Convenience aliases
@@ -10,12 +10,34 @@ Features:
 - Configurable heuristics
 """
 
+import codecs
+import functools
+import heapq
 import json
-from typing import List, Dict, Any, Optional, Callable
+import sys
+from collections import defaultdict
+from itertools import chain, zip_longest
+from typing import List, Dict, Any, Optional, Callable, BinaryIO, Iterator
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
 
+# orjson serializes datetimes natively in C; stdlib json with isoformat otherwise.
+# _dump_indented_to writes UTF-8 to a binary stream (stdlib json streams chunks)
+try:
+    import orjson
+    _dumps_indented = lambda obj: orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    _dump_indented_to = lambda obj, stream: stream.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+except ImportError:
+    # One-entry memo: a step's end is the same datetime as the next step's start
+    _isoformat = functools.lru_cache(maxsize=1)(datetime.isoformat)
+    _dumps_indented = lambda obj: json.dumps(obj, indent=2, default=_isoformat)
+    _dump_indented_to = lambda obj, stream: json.dump(obj, codecs.getwriter("utf-8")(stream), indent=2,
+                                                      default=_isoformat)
+
+# Slotted dataclasses (no per-instance __dict__) where supported (3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class SchedulingAlgorithm(Enum):
     """Available scheduling algorithms"""
@@ -25,7 +47,7 @@ class SchedulingAlgorithm(Enum):
     DEPENDENCY_CHAIN = "dependency_chain"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ScheduledTask:
     """Scheduled task with timing information"""
     task_id: str
@@ -39,6 +61,63 @@ class ScheduledTask:
     status: str = "pending"
 
 
+class ReadyQueue:
+    """Kahn-style queue of tasks whose dependencies are all met, ordered by (key, list position)"""
+    # Sequential on purpose; a relaxed (k-)priority queue can replace the
+    # heap here if scheduling ever goes concurrent
+
+    def __init__(self, tasks: List[ScheduledTask],
+                 key: Optional[Callable[[ScheduledTask], Any]] = None):
+        self.tasks = tasks
+        # Position breaks ties, so pops match a stable sort by key
+        self.ranks = [(key(task), i) for i, task in enumerate(tasks)] if key else [(0, i) for i in range(len(tasks))]
+        # Distinct unmet dependencies per task; dependents per description
+        self.unmet = []
+        self.dependents = defaultdict(list)
+        self.done = [False] * len(tasks)
+        self._ready = []
+        self._blocked = None  # every task by rank, built on the first deadlock
+        for i, task in enumerate(tasks):
+            deps = set(task.dependencies)
+            self.unmet.append(len(deps))
+            for dep in deps:
+                self.dependents[dep].append(i)
+            if not deps:
+                self._ready.append(self.ranks[i])
+        heapq.heapify(self._ready)
+
+    def push(self, i: int):
+        """Mark the task at position i ready"""
+        heapq.heappush(self._ready, self.ranks[i])
+
+    def _take(self, heap: List) -> Optional[ScheduledTask]:
+        """Pop the lowest-ranked task not yet taken (forced tasks may also turn ready later)"""
+        while heap:
+            i = heapq.heappop(heap)[1]
+            if not self.done[i]:
+                self.done[i] = True
+                return self.tasks[i]
+        return None
+
+    def pop(self) -> Optional[ScheduledTask]:
+        """Take the lowest-ranked ready task, or None if nothing is ready"""
+        return self._take(self._ready)
+
+    def pop_blocked(self) -> Optional[ScheduledTask]:
+        """Take the lowest-ranked remaining task regardless of dependencies"""
+        if self._blocked is None:
+            self._blocked = [rank for rank in self.ranks if not self.done[rank[1]]]
+            heapq.heapify(self._blocked)
+        return self._take(self._blocked)
+
+    def notify_completed(self, task: ScheduledTask):
+        """Release the tasks waiting on task's description (only its first completion counts)"""
+        for j in self.dependents.pop(task.description, ()):
+            self.unmet[j] -= 1
+            if self.unmet[j] == 0:
+                self.push(j)
+
+
 class PriorityScheduler:
     """Pluggable priority-based task scheduler"""
 
@@ -51,7 +130,7 @@ class PriorityScheduler:
             SchedulingAlgorithm.DEPENDENCY_CHAIN: self._dependency_chain_scheduling,
         }
 
-    def schedule_tasks(self, tasks: List[Dict[str, Any]],
+    def schedule_tasks(self, tasks: List[Any],
                      start_time: Optional[datetime] = None) -> List[ScheduledTask]:
         """Main scheduling method - delegates to specific algorithm"""
 
@@ -64,214 +143,179 @@ class PriorityScheduler:
         scheduler_func = self.scheduling_functions[self.algorithm]
         return scheduler_func(tasks, start_time)
 
-    def _priority_first_scheduling(self, tasks: List[Dict[str, Any]],
-                                  start_time: datetime) -> List[ScheduledTask]:
-        """Priority-first scheduling: High priority tasks first, then by dependencies"""
-
-        # Convert to ScheduledTask objects
+    def _to_scheduled_tasks(self, tasks: List[Any]) -> List[ScheduledTask]:
+        """Flatten task dicts or Task objects into ScheduledTask steps"""
+        # One comprehension per task with positional construction; every
+        # algorithm goes through here
+        make = ScheduledTask
         scheduled_tasks = []
         for task_data in tasks:
-            for step_data in task_data.get("steps", []):
-                task = ScheduledTask(
-                    task_id=task_data["id"],
-                    step_id=step_data["id"],
-                    description=step_data["description"],
-                    priority=step_data.get("priority", 1),
-                    estimated_time=step_data.get("estimated_time", 60),
-                    dependencies=step_data.get("dependencies", [])
-                )
-                scheduled_tasks.append(task)
-
-        # Sort by priority (higher first), then by dependency count (fewer first)
-        scheduled_tasks.sort(key=lambda x: (-x.priority, len(x.dependencies)))
-
-        # Schedule with dependency resolution
-        scheduled = []
-        current_time = start_time
-        processed = set()
-
-        while scheduled_tasks:
-            # Find tasks with no unresolved dependencies
-            available = []
-            for task in scheduled_tasks:
-                deps_resolved = all(dep in processed for dep in task.dependencies)
-                if deps_resolved:
-                    available.append(task)
-
-            if not available:
-                # No tasks can be scheduled - dependency issue
-                break
-
-            # Take the highest priority available task
-            next_task = max(available, key=lambda x: x.priority)
-
-            # Schedule it
-            next_task.scheduled_start = current_time
-            next_task.scheduled_end = current_time + timedelta(minutes=next_task.estimated_time)
+            if isinstance(task_data, dict):
+                steps = task_data.get("steps", [])
+                if steps:
+                    task_id = task_data["id"]
+                    scheduled_tasks.extend([
+                        make(task_id, step["id"], step["description"], step.get("priority", 1),
+                             step.get("estimated_time", 60), step.get("dependencies", []))
+                        for step in steps
+                    ])
+            else:
+                # Task/TaskStep dataclasses: read attributes, no dict round-trip
+                task_id = task_data.id
+                scheduled_tasks.extend([
+                    make(task_id, step.id, step.description, step.priority,
+                         step.estimated_time, step.dependencies)
+                    for step in task_data.steps
+                ])
+        return scheduled_tasks
+
+    def _priority_first_scheduling(self, tasks: List[Any],
+                                  start_time: datetime) -> List[ScheduledTask]:
+        """Priority-first scheduling: High priority tasks first, then by dependencies"""
 
-            scheduled.append(next_task)
-            processed.add(next_task.description)
-            scheduled_tasks.remove(next_task)
-            current_time = next_task.scheduled_end
+        scheduled_tasks = self._to_scheduled_tasks(tasks)
 
-        return scheduled
+        # Order by priority (higher first), then by dependency count (fewer first);
+        # the first ready task is the highest-priority one. Tasks whose
+        # dependencies never resolve are left out.
+        return self._schedule_ready_first(scheduled_tasks, start_time, force_on_deadlock=False,
+                                          key=lambda x: (-x.priority, len(x.dependencies)))
 
-    def _deadline_driven_scheduling(self, tasks: List[Dict[str, Any]],
+    def _deadline_driven_scheduling(self, tasks: List[Any],
                                   start_time: datetime) -> List[ScheduledTask]:
         """Deadline-driven: Prioritize tasks with nearest deadlines"""
 
         # For this implementation, we'll use priority as a proxy for urgency/deadline
         # In a real system, this would use actual deadline data
 
-        scheduled_tasks = []
-        for task_data in tasks:
-            for step_data in task_data.get("steps", []):
-                task = ScheduledTask(
-                    task_id=task_data["id"],
-                    step_id=step_data["id"],
-                    description=step_data["description"],
-                    priority=step_data.get("priority", 1),
-                    estimated_time=step_data.get("estimated_time", 60),
-                    dependencies=step_data.get("dependencies", [])
-                )
-                scheduled_tasks.append(task)
-
-        # Sort by "urgency" (inverse of priority, higher priority = more urgent)
-        scheduled_tasks.sort(key=lambda x: (len(x.dependencies), -x.priority))
-
-        return self._schedule_with_dependencies(scheduled_tasks, start_time)
-
-    def _effort_balanced_scheduling(self, tasks: List[Dict[str, Any]],
+        scheduled_tasks = self._to_scheduled_tasks(tasks)
+
+        # Order by "urgency" (inverse of priority, higher priority = more urgent)
+        return self._schedule_with_dependencies(scheduled_tasks, start_time,
+                                                key=lambda x: (len(x.dependencies), -x.priority))
+
+    def _effort_balanced_scheduling(self, tasks: List[Any],
                                   start_time: datetime) -> List[ScheduledTask]:
         """Effort-balanced: Alternate between high and low effort tasks"""
 
-        scheduled_tasks = []
-        for task_data in tasks:
-            for step_data in task_data.get("steps", []):
-                task = ScheduledTask(
-                    task_id=task_data["id"],
-                    step_id=step_data["id"],
-                    description=step_data["description"],
-                    priority=step_data.get("priority", 1),
-                    estimated_time=step_data.get("estimated_time", 60),
-                    dependencies=step_data.get("dependencies", [])
-                )
-                scheduled_tasks.append(task)
+        scheduled_tasks = self._to_scheduled_tasks(tasks)
 
         # Sort by effort (estimated_time), alternating high/low
         high_effort = [t for t in scheduled_tasks if t.estimated_time >= 120]
         low_effort = [t for t in scheduled_tasks if t.estimated_time < 120]
 
-        # Interleave high and low effort tasks
-        result = []
-        max_len = max(len(high_effort), len(low_effort))
-
-        for i in range(max_len):
-            if i < len(high_effort):
-                result.append(high_effort[i])
-            if i < len(low_effort):
-                result.append(low_effort[i])
+        # Interleave high and low effort tasks (the shorter list pads with None)
+        result = [t for t in chain.from_iterable(zip_longest(high_effort, low_effort)) if t is not None]
 
         return self._schedule_with_dependencies(result, start_time)
 
-    def _dependency_chain_scheduling(self, tasks: List[Dict[str, Any]],
+    def _dependency_chain_scheduling(self, tasks: List[Any],
                                    start_time: datetime) -> List[ScheduledTask]:
         """Dependency chain: Follow longest dependency chains first"""
 
-        scheduled_tasks = []
-        for task_data in tasks:
-            for step_data in task_data.get("steps", []):
-                task = ScheduledTask(
-                    task_id=task_data["id"],
-                    step_id=step_data["id"],
-                    description=step_data["description"],
-                    priority=step_data.get("priority", 1),
-                    estimated_time=step_data.get("estimated_time", 60),
-                    dependencies=step_data.get("dependencies", [])
-                )
-                scheduled_tasks.append(task)
-
-        # Sort by dependency chain length (longest first)
-        def get_chain_length(task):
-            # Simple heuristic: count dependencies as proxy for chain length
-            return len(task.dependencies) + task.priority
-
-        scheduled_tasks.sort(key=lambda x: -get_chain_length(x))
-
-        return self._schedule_with_dependencies(scheduled_tasks, start_time)
-
-    def _schedule_with_dependencies(self, tasks: List[ScheduledTask],
-                                  start_time: datetime) -> List[ScheduledTask]:
-        """Helper method to schedule tasks respecting dependencies"""
-
-        scheduled = []
-        current_time = start_time
-        processed = set()
-
-        remaining = tasks.copy()
+        scheduled_tasks = self._to_scheduled_tasks(tasks)
 
-        while remaining:
-            # Find tasks whose dependencies are satisfied
-            available = []
-            for task in remaining:
-                deps_satisfied = all(dep in processed for dep in task.dependencies)
-                if deps_satisfied:
-                    available.append(task)
+        # Order by dependency chain length (longest first); simple heuristic:
+        # dependency count plus priority as a proxy for chain length
+        return self._schedule_with_dependencies(scheduled_tasks, start_time,
+                                                key=lambda x: -(len(x.dependencies) + x.priority))
 
-            if not available:
-                # Deadlock - schedule remaining tasks without dependency resolution
-                available = remaining[:]
+    def _schedule_with_dependencies(self, tasks: List[ScheduledTask], start_time: datetime,
+                                  key: Optional[Callable[[ScheduledTask], Any]] = None) -> List[ScheduledTask]:
+        """Helper method to schedule tasks respecting dependencies"""
+        # On deadlock, schedule remaining tasks without dependency resolution
+        return self._schedule_ready_first(tasks, start_time, force_on_deadlock=True, key=key)
+
+    def _schedule_ready_first(self, tasks: List[ScheduledTask], start_time: datetime,
+                              force_on_deadlock: bool,
+                              key: Optional[Callable[[ScheduledTask], Any]] = None) -> List[ScheduledTask]:
+        """Repeatedly schedule the first task by (key, list position) whose dependencies are met"""
+        queue = ReadyQueue(tasks, key)
+        scheduled = []
 
-            # Schedule the first available task
-            task_to_schedule = available[0]
+        while len(scheduled) < len(tasks):
+            task = queue.pop()
+            if task is None:
+                if not force_on_deadlock:
+                    # No tasks can be scheduled - dependency issue
+                    break
+                task = queue.pop_blocked()
 
-            task_to_schedule.scheduled_start = current_time
-            task_to_schedule.scheduled_end = current_time + timedelta(minutes=task_to_schedule.estimated_time)
+            scheduled.append(task)
+            queue.notify_completed(task)
 
-            scheduled.append(task_to_schedule)
-            processed.add(task_to_schedule.description)
-            remaining.remove(task_to_schedule)
-            current_time = task_to_schedule.scheduled_end
+        # Materialize times in one pass from integer minute offsets; each end
+        # doubles as the next task's start
+        offset = 0
+        current_time = start_time
+        for task in scheduled:
+            task.scheduled_start = current_time
+            offset += task.estimated_time
+            current_time = task.scheduled_end = start_time + timedelta(minutes=offset)
 
         return scheduled
 
+    def _iter_json_records(self, scheduled_tasks: List[ScheduledTask]) -> Iterator[Dict[str, Any]]:
+        """JSON export record per task (datetimes go to the serializer as-is)"""
+        for task in scheduled_tasks:
+            yield {
+                "task_id": task.task_id,
+                "step_id": task.step_id,
+                "description": task.description,
+                "priority": task.priority,
+                "estimated_time": task.estimated_time,
+                "scheduled_start": task.scheduled_start,
+                "scheduled_end": task.scheduled_end,
+                "dependencies": task.dependencies,
+            }
+
+    def _iter_text_lines(self, scheduled_tasks: List[ScheduledTask]) -> Iterator[str]:
+        """Text export lines, without newlines"""
+        yield "📅 SCHEDULED TASKS"
+        yield "=" * 50
+        current_day = None
+
+        # Times come straight from the datetime fields (no strftime); the
+        # day header is formatted only when the date changes
+        for task in scheduled_tasks:
+            start = task.scheduled_start
+            if start:
+                day = start.date()
+                if day != current_day:
+                    yield f"\n📆 {day.isoformat()}"
+                    current_day = day
+
+                end = task.scheduled_end
+                end_time = f"{end.hour:02d}:{end.minute:02d}" if end else "TBD"
+
+                yield f"  {start.hour:02d}:{start.minute:02d}-{end_time}: {task.description}"
+                yield f"    Priority: {task.priority}, Duration: {task.estimated_time}min"
+
     def export_schedule(self, scheduled_tasks: List[ScheduledTask],
                        format: str = "json") -> str:
         """Export schedule in various formats"""
 
         if format == "json":
-            schedule_data = []
-            for task in scheduled_tasks:
-                schedule_data.append({
-                    "task_id": task.task_id,
-                    "step_id": task.step_id,
-                    "description": task.description,
-                    "priority": task.priority,
-                    "estimated_time": task.estimated_time,
-                    "scheduled_start": task.scheduled_start.isoformat() if task.scheduled_start else None,
-                    "scheduled_end": task.scheduled_end.isoformat() if task.scheduled_end else None,
-                    "dependencies": task.dependencies
-                })
-            return json.dumps(schedule_data, indent=2)
+            return _dumps_indented(list(self._iter_json_records(scheduled_tasks)))
 
         elif format == "text":
-            lines = ["📅 SCHEDULED TASKS", "=" * 50]
-            current_day = None
+            return "\n".join(self._iter_text_lines(scheduled_tasks))
 
-            for task in scheduled_tasks:
-                if task.scheduled_start:
-                    day = task.scheduled_start.strftime("%Y-%m-%d")
-                    if day != current_day:
-                        lines.append(f"\n📆 {day}")
-                        current_day = day
+        else:
+            raise ValueError(f"Unsupported export format: {format}")
 
-                    start_time = task.scheduled_start.strftime("%H:%M")
-                    end_time = task.scheduled_end.strftime("%H:%M") if task.scheduled_end else "TBD"
+    def export_schedule_to(self, stream: BinaryIO, scheduled_tasks: List[ScheduledTask],
+                           format: str = "json") -> None:
+        """Write the export_schedule output to a binary stream as UTF-8, without building it as one string"""
 
-                    lines.append(f"  {start_time}-{end_time}: {task.description}")
-                    lines.append(f"    Priority: {task.priority}, Duration: {task.estimated_time}min")
+        if format == "json":
+            _dump_indented_to(list(self._iter_json_records(scheduled_tasks)), stream)
 
-            return "\n".join(lines)
+        elif format == "text":
+            separator = b""
+            for line in self._iter_text_lines(scheduled_tasks):
+                stream.write(separator + line.encode("utf-8"))
+                separator = b"\n"
 
         else:
             raise ValueError(f"Unsupported export format: {format}")
@@ -315,15 +359,13 @@ def main():
 
     scheduled_tasks = scheduler.schedule_tasks(tasks)
 
-    # Export and display results
-    result = scheduler.export_schedule(scheduled_tasks, args.format)
-
+    # Export and display results; files are written straight from the records
     if args.output:
-        with open(args.output, 'w') as f:
-            f.write(result)
+        with open(args.output, 'wb') as f:
+            scheduler.export_schedule_to(f, scheduled_tasks, args.format)
         print(f"✅ Schedule saved to: {args.output}")
     else:
-        print(result)
+        print(scheduler.export_schedule(scheduled_tasks, args.format))
 
 
 if __name__ == "__main__":
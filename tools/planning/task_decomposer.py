@@ -10,15 +10,121 @@ Features:
 - JSON schema compliance
 """
 
+import functools
 import json
+import os
 import re
-from typing import Dict, List, Optional, Tuple
+import sys
+from collections import Counter, defaultdict
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
-import networkx as nx  # For cycle detection and topological sorting
+
+# Goal keywords per type, checked in this order (plain substring matches, one
+# compiled alternation per type so each is a single scan of the goal)
+_GOAL_TYPE_PATTERNS = tuple(
+    (goal_type, re.compile("|".join(map(re.escape, words))))
+    for goal_type, words in (
+        ("implementation", ("build", "implement", "create", "develop")),
+        ("research", ("research", "investigate", "study", "analyze")),
+        ("planning", ("plan", "organize", "schedule", "coordinate")),
+    )
+)
+
+# Pseudo-LLM step rewrites by keyword, checked in this order
+_ENHANCEMENT_TEMPLATES = {
+    "design": "Design detailed specifications and architecture for {goal}",
+    "implement": "Implement core functionality with proper error handling for {goal}",
+    "test": "Create comprehensive tests and validate implementation for {goal}",
+    "deploy": "Deploy to production environment with monitoring for {goal}",
+}
+
+
+def _freeze(obj):
+    """Read-only copy of nested rules: mappings become proxies, lists tuples"""
+    if isinstance(obj, (dict, MappingProxyType)):
+        return MappingProxyType({k: _freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(v) for v in obj)
+    return obj
+
+
+# Default decomposition rules, frozen so every TaskDecomposer can share them
+_DEFAULT_RULES = _freeze({
+    "patterns": {
+        "implementation": [
+            "design", "implement", "test", "deploy", "document"
+        ],
+        "research": [
+            "gather_requirements", "analyze", "research", "validate", "document"
+        ],
+        "planning": [
+            "analyze", "design", "schedule", "resource", "execute"
+        ]
+    },
+    "dependencies": {
+        "design": [],
+        "implement": ["design"],
+        "test": ["implement"],
+        "deploy": ["test"],
+        "document": ["implement"],
+        "analyze": [],
+        "research": ["analyze"],
+        "validate": ["research"],
+        "schedule": ["analyze"],
+        "resource": ["schedule"],
+        "execute": ["resource"]
+    },
+    "priorities": {
+        "design": 1, "analyze": 1, "research": 1,
+        "implement": 2, "validate": 2, "schedule": 2,
+        "test": 3, "resource": 3, "document": 3,
+        "deploy": 4, "execute": 4
+    }
+})
+
+
+@functools.lru_cache(maxsize=8)
+def _load_rules_file(path: str, mtime_ns: int) -> Mapping:
+    """Parse a JSON rules file over the defaults (cached per path and mtime)"""
+    with open(path, "r") as f:
+        loaded = json.load(f)
+    if not isinstance(loaded, dict):
+        raise ValueError(f"Rules file must contain a JSON object: {path}")
+    return _freeze({**_DEFAULT_RULES, **loaded})
+
+
+# Slotted dataclasses (no per-instance __dict__) where supported (3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def _iter_back_edges(adj: Dict) -> Iterator[Tuple]:
+    """Yield (u, v) for each DFS back edge in adj (node -> successors); none means acyclic"""
+    # Iterative white/gray/black DFS: nodes missing from color are white
+    GRAY, BLACK = 1, 2
+    color = {}
+    for root in adj:
+        if root in color:
+            continue
+        color[root] = GRAY
+        stack = [(root, iter(adj[root]))]
+        while stack:
+            u, successors = stack[-1]
+            for v in successors:
+                state = color.get(v)
+                if state is None:
+                    color[v] = GRAY
+                    stack.append((v, iter(adj.get(v, ()))))
+                    break
+                if state == GRAY:
+                    yield u, v
+            else:
+                color[u] = BLACK
+                stack.pop()
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TaskStep:
     """Individual step within a task"""
     id: str
@@ -29,7 +135,7 @@ class TaskStep:
     status: str = "pending"  # pending, in_progress, completed, blocked
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Task:
     """Task containing multiple steps"""
     id: str
@@ -49,41 +155,14 @@ class TaskDecomposer:
         self.task_counter = 0
         self.step_counter = 0
 
-    def _load_decomposition_rules(self, rules_file: str = None) -> Dict:
+    def _load_decomposition_rules(self, rules_file: str = None) -> Mapping:
         """Load decomposition rules from file or use defaults"""
-        default_rules = {
-            "patterns": {
-                "implementation": [
-                    "design", "implement", "test", "deploy", "document"
-                ],
-                "research": [
-                    "gather_requirements", "analyze", "research", "validate", "document"
-                ],
-                "planning": [
-                    "analyze", "design", "schedule", "resource", "execute"
-                ]
-            },
-            "dependencies": {
-                "design": [],
-                "implement": ["design"],
-                "test": ["implement"],
-                "deploy": ["test"],
-                "document": ["implement"],
-                "analyze": [],
-                "research": ["analyze"],
-                "validate": ["research"],
-                "schedule": ["analyze"],
-                "resource": ["schedule"],
-                "execute": ["resource"]
-            },
-            "priorities": {
-                "design": 1, "analyze": 1, "research": 1,
-                "implement": 2, "validate": 2, "schedule": 2,
-                "test": 3, "resource": 3, "document": 3,
-                "deploy": 4, "execute": 4
-            }
-        }
-        return default_rules
+        if rules_file:
+            try:
+                return _load_rules_file(rules_file, os.stat(rules_file).st_mtime_ns)
+            except (OSError, ValueError):
+                pass  # unreadable or invalid rules file: fall back to defaults
+        return _DEFAULT_RULES
 
     def _generate_id(self, prefix: str) -> str:
         """Generate unique IDs for tasks and steps"""
@@ -99,14 +178,10 @@ class TaskDecomposer:
         """Extract goal type from goal description using pattern matching"""
         goal_lower = goal.lower()
 
-        if any(word in goal_lower for word in ["build", "implement", "create", "develop"]):
-            return "implementation"
-        elif any(word in goal_lower for word in ["research", "investigate", "study", "analyze"]):
-            return "research"
-        elif any(word in goal_lower for word in ["plan", "organize", "schedule", "coordinate"]):
-            return "planning"
-        else:
-            return "implementation"  # default
+        for goal_type, pattern in _GOAL_TYPE_PATTERNS:
+            if pattern.search(goal_lower):
+                return goal_type
+        return "implementation"  # default
 
     def _apply_rules_decomposition(self, goal: str, goal_type: str) -> List[str]:
         """Apply rules-based decomposition patterns"""
@@ -122,89 +197,90 @@ class TaskDecomposer:
 
     def _enhance_with_llm(self, goal: str, rule_steps: List[str]) -> List[str]:
         """Enhance rules with LLM-style reasoning (pseudo-implementation)"""
+        # Pseudo-LLM enhancement - in real implementation, this would call an LLM
+        # Templates are filled once per goal; each step is lowercased once and
+        # takes the first template whose keyword it contains
+        filled = [(keyword, template.format(goal=goal)) for keyword, template in _ENHANCEMENT_TEMPLATES.items()]
         enhanced_steps = []
 
         for step in rule_steps:
-            # Pseudo-LLM enhancement - in real implementation, this would call an LLM
-            if "design" in step.lower():
-                enhanced_steps.append(f"Design detailed specifications and architecture for {goal}")
-            elif "implement" in step.lower():
-                enhanced_steps.append(f"Implement core functionality with proper error handling for {goal}")
-            elif "test" in step.lower():
-                enhanced_steps.append(f"Create comprehensive tests and validate implementation for {goal}")
-            elif "deploy" in step.lower():
-                enhanced_steps.append(f"Deploy to production environment with monitoring for {goal}")
-            else:
-                enhanced_steps.append(step)
+            step_lower = step.lower()
+            enhanced_steps.append(next((text for keyword, text in filled if keyword in step_lower), step))
 
         return enhanced_steps
 
-    def _create_dependency_graph(self, steps: List[str], goal_type: str) -> Dict[str, List[str]]:
+    @staticmethod
+    def _step_keys(steps: List[str]) -> List[str]:
+        """Rule key (first word, lowercased) per step"""
+        return [step.split(None, 1)[0].lower() for step in steps]
+
+    def _create_dependency_graph(self, steps: List[str], goal_type: str,
+                                 keys: Optional[List[str]] = None) -> Dict[str, List[str]]:
         """Create dependency relationships between steps"""
         dependencies = {}
 
         if goal_type in self.rules["dependencies"]:
             dep_rules = self.rules["dependencies"]
 
-            for i, step in enumerate(steps):
-                step_key = step.split()[0].lower()  # extract first word as key
-                deps = []
+            # Reverse rule index: key -> the rule keys whose lists name it
+            listed_by = defaultdict(set)
+            for prev_key, rule_keys in dep_rules.items():
+                for key in rule_keys:
+                    listed_by[key].add(prev_key)
 
-                # Add dependencies based on rules
-                for prev_step in steps[:i]:
-                    prev_key = prev_step.split()[0].lower()
-                    if prev_key in dep_rules and step_key in dep_rules[prev_key]:
-                        deps.append(prev_step)
+            # One forward scan; earlier (position, step) pairs per key
+            seen = defaultdict(list)
+            if keys is None:
+                keys = self._step_keys(steps)
+            for i, (step, step_key) in enumerate(zip(steps, keys)):
+                # Add dependencies based on rules, in step order
+                matches = [m for prev_key in listed_by.get(step_key, ()) for m in seen.get(prev_key, ())]
+                matches.sort()
+                dependencies[step] = [prev_step for _, prev_step in matches]
 
-                dependencies[step] = deps
+                seen[step_key].append((i, step))
 
         return dependencies
 
-    def _assign_priorities(self, steps: List[str], dependencies: Dict[str, List[str]]) -> Dict[str, int]:
+    def _assign_priorities(self, steps: List[str], dependencies: Dict[str, List[str]],
+                           keys: Optional[List[str]] = None) -> Dict[str, int]:
         """Assign priorities based on dependencies and rules"""
         priorities = {}
 
-        for step in steps:
-            step_key = step.split()[0].lower()
+        # Dependents per step in one pass over the edges (a step listed twice
+        # in one dependency list still counts once)
+        dependents = Counter()
+        for deps in dependencies.values():
+            dependents.update(set(deps))
+
+        if keys is None:
+            keys = self._step_keys(steps)
+        for step, step_key in zip(steps, keys):
             base_priority = self.rules["priorities"].get(step_key, 2)
 
             # Boost priority if step has many dependents
-            dependents = sum(1 for deps in dependencies.values() if step in deps)
-            priority = base_priority + dependents
+            priority = base_priority + dependents[step]
 
             priorities[step] = min(priority, 5)  # Cap at 5
 
         return priorities
 
     def _ensure_acyclic(self, dependencies: Dict[str, List[str]]) -> Dict[str, List[str]]:
-        """Ensure dependency graph is acyclic using NetworkX"""
-        try:
-            G = nx.DiGraph()
-            for step, deps in dependencies.items():
-                for dep in deps:
-                    G.add_edge(dep, step)
-
-            # Check for cycles
-            if nx.is_directed_acyclic_graph(G):
-                return dependencies
-            else:
-                # Remove problematic edges to break cycles
-                cycles = list(nx.simple_cycles(G))
-                cleaned_deps = dependencies.copy()
+        """Ensure dependency graph is acyclic by dropping DFS back edges"""
+        # Walk step -> dependency edges; without its back edges the graph is a DAG
+        back_edges = {}
+        for step, dep in _iter_back_edges(dependencies):
+            back_edges.setdefault(step, set()).add(dep)
 
-                for cycle in cycles:
-                    # Remove the last dependency in cycle
-                    if len(cycle) > 1:
-                        last_step = cycle[-1]
-                        if last_step in cleaned_deps and cycle[-2] in cleaned_deps[last_step]:
-                            cleaned_deps[last_step].remove(cycle[-2])
-
-                return cleaned_deps
-
-        except Exception:
-            # Fallback: return original dependencies if graph analysis fails
+        if not back_edges:
             return dependencies
 
+        # Remove problematic edges to break cycles (input lists are left untouched)
+        cleaned_deps = dependencies.copy()
+        for step, dropped in back_edges.items():
+            cleaned_deps[step] = [dep for dep in cleaned_deps[step] if dep not in dropped]
+        return cleaned_deps
+
     def decompose_goal(self, goal: str) -> Task:
         """Main method to decompose a goal into an ordered task with steps"""
 
@@ -217,14 +293,17 @@ class TaskDecomposer:
         # LLM enhancement
         enhanced_steps = self._enhance_with_llm(goal, rule_steps)
 
+        # Rule key per step, shared by the graph and priority passes
+        step_keys = self._step_keys(enhanced_steps)
+
         # Create dependency graph
-        dependencies = self._create_dependency_graph(enhanced_steps, goal_type)
+        dependencies = self._create_dependency_graph(enhanced_steps, goal_type, step_keys)
 
         # Ensure acyclic dependencies
         clean_dependencies = self._ensure_acyclic(dependencies)
 
         # Assign priorities
-        priorities = self._assign_priorities(enhanced_steps, clean_dependencies)
+        priorities = self._assign_priorities(enhanced_steps, clean_dependencies, step_keys)
 
         # Create TaskStep objects
         task_steps = []
@@ -253,24 +332,22 @@ class TaskDecomposer:
         """Validate that task graph is well-formed"""
         issues = []
 
-        # Check for cycles
-        try:
-            G = nx.DiGraph()
-            for step in task.steps:
-                for dep in step.dependencies:
-                    G.add_edge(dep, step.description)
-
-            if not nx.is_directed_acyclic_graph(G):
-                issues.append("Task graph contains cycles")
-        except Exception as e:
-            issues.append(f"Graph validation error: {e}")
-
-        # Check dependency validity
-        step_descriptions = {step.description for step in task.steps}
-        for step in task.steps:
+        # Map step descriptions (what dependencies name) to ordinals once; edges are then plain ints
+        index = {step.description: i for i, step in enumerate(task.steps)}
+
+        adj = {}
+        for i, step in enumerate(task.steps):
+            deps = adj[i] = []
             for dep in step.dependencies:
-                if dep not in step_descriptions:
+                j = index.get(dep)
+                if j is None:
                     issues.append(f"Invalid dependency '{dep}' in step '{step.description}'")
+                    continue
+                deps.append(j)
+
+        # Check for cycles (any back edge means one)
+        if any(True for _ in _iter_back_edges(adj)):
+            issues.insert(0, "Task graph contains cycles")
 
         return len(issues) == 0, issues
 
@@ -49,7 +49,8 @@ def write_md_with_frontmatter(path: Path, frontmatter: Dict, body: str, role: st
 
 def append_event(evt: Dict) -> None:
     ensure_parent(EVENTS)
-    EVENTS.write_text((EVENTS.read_text() if EVENTS.exists() else "") + json.dumps(evt) + "\n", encoding="utf-8")
+    with EVENTS.open("a", encoding="utf-8") as f:
+        f.write(json.dumps(evt) + "\n")
 
 def run_plugin(module: str, func: str = "run", **kwargs):
     start = time.time()
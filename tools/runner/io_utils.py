@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 import json
+import os
 from pathlib import Path
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Tuple
 
 ROOT = Path(__file__).resolve().parents[2]
 MB = ROOT / "memory-bank"
@@ -13,13 +15,22 @@ def ensure_parent(p: Path) -> None:
 
 def append_event(evt: Dict[str, Any]) -> None:
     ensure_parent(EVENTS)
-    content = (EVENTS.read_text() if EVENTS.exists() else "") + json.dumps(evt) + "\n"
-    EVENTS.write_text(content, encoding="utf-8")
+    # Append one line; re-reading and rewriting the log made each event O(log size)
+    with EVENTS.open("a", encoding="utf-8") as f:
+        f.write(json.dumps(evt) + "\n")
 
-def write_text(path: Path, content: str, role: str | None = None) -> None:
+def _write_all(path: Path, data: bytes) -> None:
+    # One unbuffered write (looped only on a short write), no TextIO/BufferedWriter
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+def _record_emitted(path: Path, role: str | None) -> None:
     from tools.artifacts.hash_index import record as index_record  # local import to avoid cycles
-    ensure_parent(path)
-    path.write_text(content, encoding="utf-8")
     append_event({"type":"artifact_emitted","role":role or "runner","path":str(path.relative_to(ROOT))})
     try:
         if str(path).startswith(str(MB)) and path.exists() and path.stat().st_size:
@@ -27,16 +38,27 @@ def write_text(path: Path, content: str, role: str | None = None) -> None:
     except Exception:
         pass
 
-def touch_json(path: Path, payload: Dict[str, Any], role: str | None = None) -> None:
-    from tools.artifacts.hash_index import record as index_record
+def write_bytes(path: Path, data: bytes, role: str | None = None) -> None:
     ensure_parent(path)
-    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
-    append_event({"type":"artifact_emitted","role":role or "runner","path":str(path.relative_to(ROOT))})
-    try:
-        if str(path).startswith(str(MB)) and path.exists() and path.stat().st_size:
-            index_record(path, role=role or "runner")
-    except Exception:
-        pass
+    _write_all(path, data)
+    _record_emitted(path, role)
+
+def write_many(entries: List[Tuple[Path, bytes]], role: str | None = None) -> None:
+    # Independent files are written concurrently; events and provenance records
+    # (read-modify-write of the index) stay sequential and in entry order
+    for path, _ in entries:
+        ensure_parent(path)
+    with ThreadPoolExecutor(max_workers=max(1, min(4, len(entries)))) as pool:
+        futures = [pool.submit(_write_all, path, data) for path, data in entries]
+    for (path, _), future in zip(entries, futures):
+        future.result()
+        _record_emitted(path, role)
+
+def write_text(path: Path, content: str, role: str | None = None) -> None:
+    write_bytes(path, content.encode("utf-8"), role=role)
+
+def touch_json(path: Path, payload: Dict[str, Any], role: str | None = None) -> None:
+    write_bytes(path, json.dumps(payload, indent=2).encode("utf-8"), role=role)
 
 def write_md_with_frontmatter(path: Path, frontmatter: Dict[str, Any], body: str, role: str | None = None) -> None:
     fm = "---\n" + json.dumps(frontmatter, ensure_ascii=False) + "\n---\n"
@@ -1,36 +1,11 @@
 #!/usr/bin/env python3
+import hashlib
+import json
 from pathlib import Path
-from tools.runner.io_utils import write_text, touch_json, MB
-import yaml
+from tools.runner.io_utils import append_event, write_many, MB, ROOT
 
-def run() -> None:
-    client_brief = MB / "plan/client_brief.md"
-    if not client_brief.exists():
-        raise SystemExit("client_brief.md missing; cannot generate backlog.")
-    
-    # Read client brief content
-    brief_content = client_brief.read_text()
-    
-    # Generate comprehensive product backlog
-    product_backlog = generate_product_backlog(brief_content)
-    write_text(MB / "plan/product_backlog.yaml", product_backlog, role="product_owner_ai")
-    
-    # Generate acceptance criteria
-    acceptance_criteria = generate_acceptance_criteria(brief_content)
-    touch_json(MB / "plan/acceptance_criteria.json", acceptance_criteria, role="product_owner_ai")
-    
-    # Generate user stories
-    user_stories = generate_user_stories(brief_content)
-    write_text(MB / "plan/user_stories.md", user_stories, role="product_owner_ai")
-    
-    # Generate product vision document
-    product_vision = generate_product_vision(brief_content)
-    write_text(MB / "plan/product_vision.md", product_vision, role="product_owner_ai")
-
-def generate_product_backlog(brief_content: str) -> str:
-    """Generate a prioritized product backlog based on the client brief."""
-    
-    backlog = """# Product Backlog - Customer Support Ticket Dashboard
+# Static artifact documents (they do not depend on the brief yet)
+_BACKLOG_MD = """# Product Backlog - Customer Support Ticket Dashboard
 
 ## Epic: Core Dashboard Functionality
 **Priority: HIGH** | **Story Points: 21**
@@ -213,144 +188,8 @@ def generate_product_backlog(brief_content: str) -> str:
 - [ ] Documentation updated
 - [ ] Staging deployment successful
 """
-    
-    return backlog
 
-def generate_acceptance_criteria(brief_content: str) -> dict:
-    """Generate detailed acceptance criteria for each user story."""
-    
-    criteria = {
-        "criteria": [
-            {
-                "story_id": "US1",
-                "title": "Dashboard Overview",
-                "criteria": [
-                    "Dashboard displays total ticket count prominently",
-                    "Tickets are grouped by status with clear visual indicators",
-                    "Priority levels are color-coded (Red=Critical, Orange=High, Yellow=Medium, Green=Low)",
-                    "Real-time updates occur within 5 seconds of data changes",
-                    "Dashboard loads within 3 seconds on standard internet connection"
-                ]
-            },
-            {
-                "story_id": "US2", 
-                "title": "Ticket Filtering",
-                "criteria": [
-                    "All filter options are clearly visible and accessible",
-                    "Filters can be combined (e.g., High Priority + In Progress)",
-                    "Search function returns results within 1 second",
-                    "Filter combinations can be saved and named",
-                    "Clear visual feedback shows active filters"
-                ]
-            },
-            {
-                "story_id": "US3",
-                "title": "Ticket Assignment", 
-                "criteria": [
-                    "Drag-and-drop assignment works smoothly on desktop",
-                    "Bulk assignment handles up to 50 tickets simultaneously",
-                    "Assignment history shows who assigned what and when",
-                    "Agent workload indicators update in real-time",
-                    "Auto-assignment considers agent skills and current workload"
-                ]
-            },
-            {
-                "story_id": "US4",
-                "title": "User Authentication",
-                "criteria": [
-                    "Login process completes within 2 seconds",
-                    "JWT tokens expire after 8 hours of inactivity",
-                    "Password reset emails are sent within 1 minute",
-                    "Failed login attempts are logged for security monitoring",
-                    "Session timeout warnings appear 5 minutes before expiration"
-                ]
-            },
-            {
-                "story_id": "US5",
-                "title": "User Role Management",
-                "criteria": [
-                    "Role changes take effect immediately upon save",
-                    "Permission changes are logged for audit purposes",
-                    "Admin can create new users with appropriate roles",
-                    "Role hierarchy prevents privilege escalation",
-                    "User deactivation preserves ticket history"
-                ]
-            },
-            {
-                "story_id": "US6",
-                "title": "Email Notifications",
-                "criteria": [
-                    "Emails are delivered within 5 minutes of triggering event",
-                    "Notification preferences are saved per user",
-                    "Email templates are professional and clear",
-                    "Unsubscribe options are available for non-critical notifications",
-                    "Email delivery failures are logged and retried"
-                ]
-            },
-            {
-                "story_id": "US7",
-                "title": "Slack Integration",
-                "criteria": [
-                    "Slack messages are delivered within 1 minute",
-                    "Webhook failures are logged and retried automatically",
-                    "Critical alerts include actionable information",
-                    "Escalation notifications follow defined rules",
-                    "Slack integration can be disabled per user preference"
-                ]
-            },
-            {
-                "story_id": "US8",
-                "title": "Mobile & Tablet Support",
-                "criteria": [
-                    "Dashboard is fully functional on devices with 320px+ width",
-                    "Touch targets are at least 44px in size",
-                    "Navigation is intuitive on mobile devices",
-                    "Performance is maintained across all device types",
-                    "User experience is consistent regardless of device"
-                ]
-            },
-            {
-                "story_id": "US9",
-                "title": "Comprehensive Testing",
-                "criteria": [
-                    "Unit test coverage exceeds 80% for all modules",
-                    "Integration tests cover all API endpoints",
-                    "E2E tests validate critical user journeys",
-                    "Performance tests meet defined response time requirements",
-                    "Security tests validate authentication and authorization"
-                ]
-            },
-            {
-                "story_id": "US10",
-                "title": "Staging Deployment",
-                "criteria": [
-                    "Docker containers start within 30 seconds",
-                    "Vercel deployment completes within 5 minutes",
-                    "Environment variables are properly configured",
-                    "Deployment pipeline includes automated testing",
-                    "Rollback capability is available if deployment fails"
-                ]
-            },
-            {
-                "story_id": "US11",
-                "title": "Documentation",
-                "criteria": [
-                    "User manual covers all dashboard features",
-                    "API documentation includes examples and error codes",
-                    "Setup guide includes troubleshooting steps",
-                    "Documentation is searchable and well-organized",
-                    "Documentation is updated with each release"
-                ]
-            }
-        ]
-    }
-    
-    return criteria
-
-def generate_user_stories(brief_content: str) -> str:
-    """Generate detailed user stories with acceptance criteria."""
-    
-    stories = """# User Stories - Customer Support Ticket Dashboard
+_STORIES_MD = """# User Stories - Customer Support Ticket Dashboard
 
 ## Epic 1: Core Dashboard Functionality
 
@@ -584,13 +423,8 @@ def generate_user_stories(brief_content: str) -> str:
 - **Timeline Risk:** Prioritize high-value features for early delivery
 - **Quality Risk:** Include testing story in each sprint for continuous validation
 """
-    
-    return stories
 
-def generate_product_vision(brief_content: str) -> str:
-    """Generate a comprehensive product vision document."""
-    
-    vision = """# Product Vision - Customer Support Ticket Dashboard
+_VISION_MD = """# Product Vision - Customer Support Ticket Dashboard
 
 ## Vision Statement
 **"Empower support teams with an intuitive, real-time dashboard that transforms ticket management from reactive to proactive, enabling faster resolution and better customer satisfaction."**
@@ -728,6 +562,212 @@ The Customer Support Ticket Dashboard represents a significant step forward in s
 
 The phased approach ensures successful delivery while managing risks and providing immediate value to users. With clear success metrics and a comprehensive roadmap, this project is positioned for long-term success and continued enhancement.
 """
+
+_ACCEPTANCE_CRITERIA = {
+    "criteria": [
+        {
+            "story_id": "US1",
+            "title": "Dashboard Overview",
+            "criteria": [
+                "Dashboard displays total ticket count prominently",
+                "Tickets are grouped by status with clear visual indicators",
+                "Priority levels are color-coded (Red=Critical, Orange=High, Yellow=Medium, Green=Low)",
+                "Real-time updates occur within 5 seconds of data changes",
+                "Dashboard loads within 3 seconds on standard internet connection"
+            ]
+        },
+        {
+            "story_id": "US2", 
+            "title": "Ticket Filtering",
+            "criteria": [
+                "All filter options are clearly visible and accessible",
+                "Filters can be combined (e.g., High Priority + In Progress)",
+                "Search function returns results within 1 second",
+                "Filter combinations can be saved and named",
+                "Clear visual feedback shows active filters"
+            ]
+        },
+        {
+            "story_id": "US3",
+            "title": "Ticket Assignment", 
+            "criteria": [
+                "Drag-and-drop assignment works smoothly on desktop",
+                "Bulk assignment handles up to 50 tickets simultaneously",
+                "Assignment history shows who assigned what and when",
+                "Agent workload indicators update in real-time",
+                "Auto-assignment considers agent skills and current workload"
+            ]
+        },
+        {
+            "story_id": "US4",
+            "title": "User Authentication",
+            "criteria": [
+                "Login process completes within 2 seconds",
+                "JWT tokens expire after 8 hours of inactivity",
+                "Password reset emails are sent within 1 minute",
+                "Failed login attempts are logged for security monitoring",
+                "Session timeout warnings appear 5 minutes before expiration"
+            ]
+        },
+        {
+            "story_id": "US5",
+            "title": "User Role Management",
+            "criteria": [
+                "Role changes take effect immediately upon save",
+                "Permission changes are logged for audit purposes",
+                "Admin can create new users with appropriate roles",
+                "Role hierarchy prevents privilege escalation",
+                "User deactivation preserves ticket history"
+            ]
+        },
+        {
+            "story_id": "US6",
+            "title": "Email Notifications",
+            "criteria": [
+                "Emails are delivered within 5 minutes of triggering event",
+                "Notification preferences are saved per user",
+                "Email templates are professional and clear",
+                "Unsubscribe options are available for non-critical notifications",
+                "Email delivery failures are logged and retried"
+            ]
+        },
+        {
+            "story_id": "US7",
+            "title": "Slack Integration",
+            "criteria": [
+                "Slack messages are delivered within 1 minute",
+                "Webhook failures are logged and retried automatically",
+                "Critical alerts include actionable information",
+                "Escalation notifications follow defined rules",
+                "Slack integration can be disabled per user preference"
+            ]
+        },
+        {
+            "story_id": "US8",
+            "title": "Mobile & Tablet Support",
+            "criteria": [
+                "Dashboard is fully functional on devices with 320px+ width",
+                "Touch targets are at least 44px in size",
+                "Navigation is intuitive on mobile devices",
+                "Performance is maintained across all device types",
+                "User experience is consistent regardless of device"
+            ]
+        },
+        {
+            "story_id": "US9",
+            "title": "Comprehensive Testing",
+            "criteria": [
+                "Unit test coverage exceeds 80% for all modules",
+                "Integration tests cover all API endpoints",
+                "E2E tests validate critical user journeys",
+                "Performance tests meet defined response time requirements",
+                "Security tests validate authentication and authorization"
+            ]
+        },
+        {
+            "story_id": "US10",
+            "title": "Staging Deployment",
+            "criteria": [
+                "Docker containers start within 30 seconds",
+                "Vercel deployment completes within 5 minutes",
+                "Environment variables are properly configured",
+                "Deployment pipeline includes automated testing",
+                "Rollback capability is available if deployment fails"
+            ]
+        },
+        {
+            "story_id": "US11",
+            "title": "Documentation",
+            "criteria": [
+                "User manual covers all dashboard features",
+                "API documentation includes examples and error codes",
+                "Setup guide includes troubleshooting steps",
+                "Documentation is searchable and well-organized",
+                "Documentation is updated with each release"
+            ]
+        }
+    ]
+}
+
+# Serialized and encoded once, exactly as touch_json would write it
+_ACCEPTANCE_CRITERIA_JSON = json.dumps(_ACCEPTANCE_CRITERIA, indent=2).encode("utf-8")
+
+# UTF-8 of the static documents, encoded at import; _encode falls back to
+# encoding anything else (e.g. a generator that starts using the brief)
+_PREENCODED = {text: text.encode("utf-8") for text in (_BACKLOG_MD, _STORIES_MD, _VISION_MD)}
+
+def _encode(text: str) -> bytes:
+    data = _PREENCODED.get(text)
+    return data if data is not None else text.encode("utf-8")
+
+# Input and artifact paths (fixed for the process)
+_P_BRIEF = MB / "plan/client_brief.md"
+_P_BACKLOG = MB / "plan/product_backlog.yaml"
+_P_CRITERIA = MB / "plan/acceptance_criteria.json"
+_P_STORIES = MB / "plan/user_stories.md"
+_P_VISION = MB / "plan/product_vision.md"
+# Digest of the last emitted artifacts plus their size/mtime (regen short-circuit)
+_P_META = MB / "plan/.plan_meta.json"
+
+def _stat_key(path: Path):
+    st = path.stat()
+    return [st.st_size, st.st_mtime_ns]
+
+def _unchanged(entries, digest: str) -> bool:
+    # Same output as last run and no artifact touched since it was written
+    try:
+        meta = json.loads(_P_META.read_bytes())
+        return meta.get("digest") == digest and all(
+            meta["files"].get(path.name) == _stat_key(path) for path, _ in entries
+        )
+    except (OSError, ValueError, KeyError, AttributeError):
+        return False
+
+def run() -> None:
+    # Read client brief content (one read of a small file; no buffered text
+    # wrapper, and no separate exists() stat)
+    try:
+        brief_content = _P_BRIEF.read_bytes().decode("utf-8")
+    except FileNotFoundError:
+        raise SystemExit("client_brief.md missing; cannot generate backlog.") from None
     
-    return vision
+    # Generate the four artifacts
+    entries = [
+        (_P_BACKLOG, _encode(generate_product_backlog(brief_content))),
+        # Acceptance criteria are static: write the JSON serialized at import
+        (_P_CRITERIA, _ACCEPTANCE_CRITERIA_JSON),
+        (_P_STORIES, _encode(generate_user_stories(brief_content))),
+        (_P_VISION, _encode(generate_product_vision(brief_content))),
+    ]
+
+    # Skip the rewrite when nothing would change on disk
+    h = hashlib.sha256()
+    for path, data in entries:
+        h.update(path.name.encode("utf-8") + b"\0" + data + b"\0")
+    digest = h.hexdigest()
+    if _unchanged(entries, digest):
+        append_event({"type": "artifacts_unchanged", "role": "product_owner_ai",
+                      "paths": [str(path.relative_to(ROOT)) for path, _ in entries]})
+        return
+
+    # Write them in one concurrent batch, then remember what was written
+    write_many(entries, role="product_owner_ai")
+    meta = {"digest": digest, "files": {path.name: _stat_key(path) for path, _ in entries}}
+    _P_META.write_text(json.dumps(meta), encoding="utf-8")
+
+def generate_product_backlog(brief_content: str) -> str:
+    """Generate a prioritized product backlog based on the client brief."""
+    return _BACKLOG_MD
+
+def generate_acceptance_criteria(brief_content: str) -> dict:
+    """Generate detailed acceptance criteria for each user story (shared; do not mutate)."""
+    return _ACCEPTANCE_CRITERIA
+
+def generate_user_stories(brief_content: str) -> str:
+    """Generate detailed user stories with acceptance criteria."""
+    return _STORIES_MD
+
+def generate_product_vision(brief_content: str) -> str:
+    """Generate a comprehensive product vision document."""
+    return _VISION_MD
 
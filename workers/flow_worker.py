@@ -7,27 +7,48 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from exec_queue.celery_app import app  # noqa: F401  # ensure app is discoverable
+from exec_queue.celery_app import app
+
+
+def _concurrency() -> str:
+    # ARX_WORKER_CONCURRENCY if set (validated here rather than by Celery);
+    # otherwise one less than the usable CPUs (leave one for broker/IO), min 2
+    raw = os.getenv("ARX_WORKER_CONCURRENCY", "").strip()
+    if raw:
+        try:
+            n = int(raw)
+        except ValueError:
+            n = 0
+        if n < 1:
+            raise SystemExit(f"ARX_WORKER_CONCURRENCY must be a positive integer, got {raw!r}")
+        return str(n)
+    try:
+        cpus = len(os.sched_getaffinity(0))  # respects CPU pinning/cpusets
+    except AttributeError:
+        cpus = os.cpu_count() or 4
+    return str(max(2, cpus - 1))
 
 
 def main():
     # Worker options: queue & concurrency bound via env
     q = os.getenv("ARX_WORKER_QUEUE", "q.coder")
-    c = os.getenv("ARX_WORKER_CONCURRENCY", "4")
-    os.execvp(
-        "celery",
-        [
-            "celery",
-            "-A",
-            "exec_queue.celery_app",
-            "worker",
-            "-Q",
-            q,
-            "-c",
-            c,
-            "--loglevel=INFO",
-        ],
-    )
+    c = _concurrency()
+    argv = [
+        "worker",
+        "-Q",
+        q,
+        "-c",
+        c,
+        "--loglevel=INFO",
+    ]
+    # Lean worker by default: fair scheduling, and no gossip/mingle/heartbeat
+    # chatter between peers (ARX_WORKER_LEAN="" or "0" restores Celery defaults;
+    # prefetch is already 1 via worker_prefetch_multiplier)
+    if os.getenv("ARX_WORKER_LEAN", "1") not in ("", "0"):
+        argv += ["-O", "fair", "--without-gossip", "--without-mingle", "--without-heartbeat"]
+    # Start the worker in this process with the already-imported app (no
+    # exec of the celery CLI and no second interpreter start/app import)
+    app.worker_main(argv=argv)
 
 
 if __name__ == "__main__":